@@ -1,27 +1,95 @@
 #!/usr/bin/env python3
 """
 Create simple PNG assets for the mobile app
+
+Pillow-SIMD is a drop-in replacement for Pillow with SSE4/AVX2 paths for
+resampling and compositing. Prefer it (the AVX2 build) on x86_64 CI runners:
+
+    pip uninstall -y pillow && CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
 """
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import PIL
 from PIL import Image, ImageDraw, ImageFont
+import math
+import numpy as np
 import os
 
-def create_icon(size, filename, text="C"):
-    """Create a simple icon with the given size"""
-    # Create image with dark background
-    img = Image.new('RGBA', (size, size), (26, 26, 26, 255))
-    draw = ImageDraw.Draw(img)
-    
-    # Draw a circle with gradient effect
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+try:
+    import cairo
+except (ImportError, OSError):
+    cairo = None
+
+FONT_PATH = "/System/Library/Fonts/Arial.ttf"
+
+@lru_cache(maxsize=32)
+def _get_font(path, size):
+    """Load a TrueType font once per (path, size), falling back to the default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+def _save_png(img, path):
+    """Save a PNG through libvips when available, falling back to Pillow"""
+    if img.mode == 'P':
+        # libvips has no indexed-colour input, so palette images stay on Pillow
+        img.save(path, optimize=True)
+        return
+    if pyvips is None:
+        img.save(path)
+        return
+    vimg = pyvips.Image.new_from_memory(
+        img.tobytes(), img.width, img.height, len(img.getbands()), 'uchar')
+    vimg.pngsave(path, compression=6, effort=1)
+
+def _render_icon_base_cairo(size, margin, outline_width):
+    """Rasterize the icon background and anti-aliased circle with cairo"""
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+    ctx = cairo.Context(surface)
+    ctx.set_source_rgb(26 / 255, 26 / 255, 26 / 255)
+    ctx.paint()
+    
+    # Match Pillow's geometry: the outline is drawn inside the bounding box
+    center = size / 2
+    radius = (size - 2 * margin) / 2
+    ctx.arc(center, center, radius, 0, 2 * math.pi)
+    ctx.set_source_rgb(0, 212 / 255, 170 / 255)
+    ctx.fill()
+    ctx.arc(center, center, radius - outline_width / 2, 0, 2 * math.pi)
+    ctx.set_line_width(outline_width)
+    ctx.set_source_rgb(0, 184 / 255, 148 / 255)
+    ctx.stroke()
+    
+    surface.flush()
+    img = Image.frombuffer('RGBA', (size, size), surface.get_data(),
+                           'raw', 'BGRA', surface.get_stride(), 1)
+    return img.convert('RGB')
+
+def _render_icon(size, text="C"):
+    """Render an icon of the given size without saving it"""
     margin = size // 8
-    draw.ellipse([margin, margin, size-margin, size-margin], 
-                 fill=(0, 212, 170, 255), outline=(0, 184, 148, 255), width=4)
+    
+    if cairo is not None:
+        # Background and circle via cairo's SIMD (pixman) rasterizer
+        img = _render_icon_base_cairo(size, margin, 4)
+        draw = ImageDraw.Draw(img)
+    else:
+        # Create image with dark background (icons are fully opaque, so no alpha)
+        img = Image.new('RGB', (size, size), (26, 26, 26))
+        draw = ImageDraw.Draw(img)
+        
+        # Draw a circle with gradient effect
+        draw.ellipse([margin, margin, size-margin, size-margin], 
+                     fill=(0, 212, 170), outline=(0, 184, 148), width=4)
     
     # Try to use a font, fallback to default if not available
-    try:
-        font_size = size // 3
-        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+    font = _get_font(FONT_PATH, size // 3)
     
     # Draw text
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -31,24 +99,38 @@ def create_icon(size, filename, text="C"):
     x = (size - text_width) // 2
     y = (size - text_height) // 2 - 5
     
-    draw.text((x, y), text, fill=(26, 26, 26, 255), font=font)
+    draw.text((x, y), text, fill=(26, 26, 26), font=font)
     
-    img.save(filename)
+    return img
+
+def _to_palette(img):
+    """Quantize a flat-colour icon to a 16-colour indexed image"""
+    return img.convert('P', palette=Image.Palette.ADAPTIVE, colors=16)
+
+def create_icon(size, filename, text="C"):
+    """Create a simple icon with the given size"""
+    _save_png(_to_palette(_render_icon(size, text)), filename)
     print(f"Created {filename} ({size}x{size})")
 
+def create_icon_set(master_size, targets, text="C"):
+    """Render one master icon and downscale it for each (size, filename) target"""
+    master = _render_icon(master_size, text)
+    for size, filename in targets:
+        img = master if size == master_size else master.resize(
+            (size, size), Image.Resampling.LANCZOS)
+        _save_png(_to_palette(img), filename)
+        print(f"Created {filename} ({size}x{size})")
+
 def create_splash(width, height, filename):
     """Create a splash screen"""
-    img = Image.new('RGBA', (width, height), (26, 26, 26, 255))
+    # Build gradient background as a single array instead of one line per row
+    ramp = (26 + (45 - 26) * np.arange(height) / height).astype(np.uint8)
+    arr = np.empty((height, width, 4), dtype=np.uint8)
+    arr[..., :3] = ramp[:, None, None]
+    arr[..., 3] = 255
+    img = Image.fromarray(arr, 'RGBA')
     draw = ImageDraw.Draw(img)
     
-    # Draw gradient background
-    for y in range(height):
-        ratio = y / height
-        r = int(26 + (45 - 26) * ratio)
-        g = int(26 + (45 - 26) * ratio)
-        b = int(26 + (45 - 26) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b, 255))
-    
     # Draw logo circle
     logo_size = min(width, height) // 4
     logo_x = (width - logo_size) // 2
@@ -58,11 +140,7 @@ def create_splash(width, height, filename):
                  fill=(0, 212, 170, 255), outline=(0, 184, 148, 255), width=8)
     
     # Draw app name
-    try:
-        font_size = width // 20
-        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+    font = _get_font(FONT_PATH, width // 20)
     
     app_name = "CeesarTrader"
     bbox = draw.textbbox((0, 0), app_name, font=font)
@@ -74,11 +152,7 @@ def create_splash(width, height, filename):
     
     # Draw subtitle
     subtitle = "Automated Trading Platform"
-    try:
-        subtitle_font_size = width // 30
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", subtitle_font_size)
-    except:
-        subtitle_font = ImageFont.load_default()
+    subtitle_font = _get_font(FONT_PATH, width // 30)
     
     bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
     subtitle_width = bbox[2] - bbox[0]
@@ -87,19 +161,40 @@ def create_splash(width, height, filename):
     
     draw.text((subtitle_x, subtitle_y), subtitle, fill=(255, 255, 255, 200), font=subtitle_font)
     
-    img.save(filename)
+    _save_png(img, filename)
     print(f"Created {filename} ({width}x{height})")
 
+def build_icons(args):
+    """Process-pool entry point for create_icon_set"""
+    create_icon_set(*args)
+
+def build_splash(args):
+    """Process-pool entry point for create_splash"""
+    create_splash(*args)
+
 if __name__ == "__main__":
+    # Pillow-SIMD releases carry a ".postN" version suffix
+    simd = ".post" in PIL.__version__
+    print(f"Using Pillow {PIL.__version__}{' (SIMD)' if simd else ''}")
+    
     # Create assets directory if it doesn't exist
     os.makedirs("assets", exist_ok=True)
     
-    # Create icons
-    create_icon(1024, "assets/icon.png", "C")
-    create_icon(1024, "assets/adaptive-icon.png", "C")
-    create_icon(32, "assets/favicon.png", "C")
-    
-    # Create splash screen
-    create_splash(1284, 2778, "assets/splash.png")
+    tasks = [
+        # Icons from a single 1024px master
+        (build_icons, (1024, [
+            (1024, "assets/icon.png"),
+            (1024, "assets/adaptive-icon.png"),
+            (32, "assets/favicon.png"),
+        ], "C")),
+        # Splash screen
+        (build_splash, (1284, 2778, "assets/splash.png")),
+    ]
+    
+    # Icons and splash are independent, so render them in separate processes
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(fn, args) for fn, args in tasks]
+        for future in as_completed(futures):
+            future.result()
     
     print("All assets created successfully!")
@@ -8,10 +8,13 @@ alternative data, and technical indicators.
 import asyncio
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import yfinance as yf
 import ccxt
 import aiohttp
 import json
+from numba import njit
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -23,6 +26,200 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent requests to a single data source
+MAX_CONCURRENT_REQUESTS = 8
+
+# Fixed regime vocabularies; labels are stored as categorical codes
+TREND_REGIMES = ['uptrend', 'downtrend', 'sideways']
+VOL_REGIMES = ['low', 'normal', 'high']
+MARKET_REGIMES = [f"{trend}_{vol}" for trend in TREND_REGIMES for vol in VOL_REGIMES]
+
+def _rolling_mean_abs_dev(series: pd.Series, window: int) -> pd.Series:
+    """Rolling mean absolute deviation around each window's own mean."""
+    values = series.to_numpy(dtype=np.float64)
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        result[window - 1:] = np.abs(windows - windows.mean(axis=1, keepdims=True)).mean(axis=1)
+    return pd.Series(result, index=series.index)
+
+def _ffill_bfill_block(values: np.ndarray, group_starts: np.ndarray) -> np.ndarray:
+    """Forward- then back-fill NaNs down each column without crossing group boundaries."""
+    
+    def ffill(block: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        # Index of the last valid row (or the group start) at or above each row
+        rows = np.arange(block.shape[0])[:, None]
+        idx = np.where(~np.isnan(block) | starts[:, None], rows, 0)
+        np.maximum.accumulate(idx, axis=0, out=idx)
+        return np.take_along_axis(block, idx, axis=0)
+    
+    group_ends = np.roll(group_starts, -1)
+    group_ends[-1] = True
+    filled = ffill(values, group_starts)
+    return ffill(filled[::-1], group_ends[::-1])[::-1]
+
+@njit(cache=True)
+def _rolling_std_multi(values: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """Rolling sample standard deviation for several window sizes in one pass.
+    
+    Uses Welford's running mean/M2 update with removal of the value leaving
+    each window, so the cost is O(N) per window instead of O(N * window).
+    A window containing NaN yields NaN, as pandas does with min_periods=window,
+    and a window of identical values yields exactly zero.
+    """
+    n = values.shape[0]
+    k = windows.shape[0]
+    out = np.full((n, k), np.nan)
+    nobs = np.zeros(k, dtype=np.int64)
+    mean = np.zeros(k)
+    m2 = np.zeros(k)
+    run = 0
+    
+    for i in range(n):
+        value = values[i]
+        # Length of the run of identical values ending at i
+        run = run + 1 if i > 0 and value == values[i - 1] else 1
+        for j in range(k):
+            window = windows[j]
+            if not np.isnan(value):
+                nobs[j] += 1
+                delta = value - mean[j]
+                mean[j] += delta / nobs[j]
+                m2[j] += delta * (value - mean[j])
+            
+            if i >= window:
+                old = values[i - window]
+                if not np.isnan(old):
+                    nobs[j] -= 1
+                    if nobs[j] == 0:
+                        mean[j] = 0.0
+                        m2[j] = 0.0
+                    else:
+                        delta = old - mean[j]
+                        mean[j] -= delta / nobs[j]
+                        m2[j] -= delta * (old - mean[j])
+            
+            # Re-anchor the running state once per window to stop float drift;
+            # this costs O(window) every window steps, i.e. O(1) amortized
+            if (i + 1) % window == 0:
+                count = 0
+                total = 0.0
+                for t in range(i - window + 1, i + 1):
+                    if not np.isnan(values[t]):
+                        count += 1
+                        total += values[t]
+                nobs[j] = count
+                mean[j] = total / count if count > 0 else 0.0
+                m2[j] = 0.0
+                for t in range(i - window + 1, i + 1):
+                    if not np.isnan(values[t]):
+                        m2[j] += (values[t] - mean[j]) ** 2
+            
+            if nobs[j] == window and window > 1:
+                if run >= window:
+                    out[i, j] = 0.0
+                else:
+                    out[i, j] = np.sqrt(max(m2[j], 0.0) / (window - 1))
+    
+    return out
+
+def _rolling_std(series: pd.Series, *windows: int) -> np.ndarray:
+    """Rolling standard deviations of a series, one column per window."""
+    return _rolling_std_multi(series.to_numpy(dtype=np.float64), np.array(windows, dtype=np.int64))
+
+def _add_return_features(data: pd.DataFrame) -> pd.DataFrame:
+    """Add returns, log returns and 20-period volatility to an OHLCV frame."""
+    data['returns'] = data['Close'].pct_change()
+    data['log_returns'] = np.log(data['Close'] / data['Close'].shift(1))
+    data['volatility'] = _rolling_std(data['returns'], 20)[:, 0]
+    return data
+
+@njit(cache=True, error_model='numpy')
+def _ohlcv_indicator_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                            volume: np.ndarray, window: int) -> Tuple[np.ndarray, ...]:
+    """Compute RSI, ATR, Stochastic %K, Williams %R and OBV in one fused pass.
+    
+    Rolling sums are updated incrementally, so the cost is O(N) per indicator
+    rather than O(N * window). NaN handling matches the equivalent pandas ops.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+    stoch_k = np.full(n, np.nan)
+    williams_r = np.full(n, np.nan)
+    obv = np.full(n, np.nan)
+    
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    true_range = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    tr_sum = 0.0
+    tr_nans = 0
+    obv_total = 0.0
+    
+    for i in range(n):
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+            
+            step = volume[i] * np.sign(delta)
+            if not np.isnan(step):
+                obv_total += step
+                obv[i] = obv_total
+            
+            high_close = abs(high[i] - close[i - 1])
+            low_close = abs(low[i] - close[i - 1])
+            true_range[i] = max(high[i] - low[i], max(high_close, low_close))
+            if np.isnan(high_close) or np.isnan(low_close) or np.isnan(high[i] - low[i]):
+                true_range[i] = np.nan
+        
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if np.isnan(true_range[i]):
+            tr_nans += 1
+        else:
+            tr_sum += true_range[i]
+        
+        if i >= window:
+            # Clamp to zero so float drift cannot flip the sign of a flat window
+            gain_sum = max(gain_sum - gains[i - window], 0.0)
+            loss_sum = max(loss_sum - losses[i - window], 0.0)
+            if np.isnan(true_range[i - window]):
+                tr_nans -= 1
+            else:
+                tr_sum -= true_range[i - window]
+        
+        if i < window - 1:
+            continue
+        
+        rs = (gain_sum / window) / (loss_sum / window)
+        rsi[i] = 100 - (100 / (1 + rs))
+        if tr_nans == 0:
+            atr[i] = tr_sum / window
+        
+        low_n = np.inf
+        high_n = -np.inf
+        has_nan = False
+        for j in range(i - window + 1, i + 1):
+            if np.isnan(low[j]) or np.isnan(high[j]):
+                has_nan = True
+                break
+            low_n = min(low_n, low[j])
+            high_n = max(high_n, high[j])
+        if not has_nan:
+            # Shared by both oscillators; a flat window has no defined position
+            range_n = high_n - low_n
+            if range_n == 0:
+                range_n = np.nan
+            stoch_k[i] = 100 * (close[i] - low_n) / range_n
+            williams_r[i] = -100 * (high_n - close[i]) / range_n
+    
+    return rsi, atr, stoch_k, williams_r, obv
+
 @dataclass
 class DataSource:
     """Data source configuration."""
@@ -34,7 +231,7 @@ class DataSource:
 class EnhancedDataCollector:
     """Enhanced data collector for comprehensive training data."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.data_sources = {
             "yfinance": DataSource("yfinance", ["equity", "etf"], 2000, True),
             "ccxt": DataSource("ccxt", ["crypto"], 1200, True),
@@ -56,6 +253,26 @@ class EnhancedDataCollector:
             "newsapi": "YOUR_NEWS_API_KEY",
             "fred": "YOUR_FRED_KEY"
         }
+        
+        # Random generator for mock data (seed for reproducible runs)
+        self.rng = np.random.default_rng(seed)
+        
+        # Shared HTTP session for REST data sources, opened by ``async with``
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "EnhancedDataCollector":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=MAX_CONCURRENT_REQUESTS,
+                keepalive_timeout=60
+            )
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
     
     async def collect_comprehensive_data(self, 
                                       symbols: List[str],
@@ -91,6 +308,107 @@ class EnhancedDataCollector:
         
         return combined_data
     
+    async def collect_to_parquet(self,
+                                 symbols: List[str],
+                                 start_date: datetime,
+                                 end_date: datetime,
+                                 output_path: Path,
+                                 timeframe: str = "1d") -> int:
+        """Collect comprehensive training data and stream it to Parquet.
+        
+        Each symbol is processed and written as its own row group, so only one
+        symbol's feature block is held in memory at a time. Regime labels and
+        cross-asset correlations depend on every symbol; they are added in a
+        second pass over the row groups. Returns the number of rows written.
+        """
+        
+        logger.info(f"Collecting data for {len(symbols)} symbols from {start_date} to {end_date}")
+        
+        market_data = await self._collect_market_data(symbols, start_date, end_date, timeframe)
+        alternative_data = await self._collect_alternative_data(symbols, start_date, end_date)
+        economic_data = await self._collect_economic_data(start_date, end_date)
+        
+        if market_data.empty:
+            return 0
+        
+        output_path = Path(output_path)
+        staging_path = output_path.with_suffix('.staging.parquet')
+        
+        # First pass: per-symbol features, plus the cross-symbol statistics
+        alternative_by_symbol = (
+            dict(tuple(alternative_data.groupby('symbol', sort=False)))
+            if not alternative_data.empty else {}
+        )
+        returns_sum: Optional[pd.Series] = None
+        returns_count: Optional[pd.Series] = None
+        volatilities = []
+        writer = None
+        try:
+            for symbol, symbol_data in market_data.groupby('symbol', sort=False):
+                block = self._combine_data_sources(
+                    symbol_data,
+                    alternative_by_symbol.get(symbol, pd.DataFrame()),
+                    economic_data
+                )
+                block = self._add_technical_indicators(block)
+                
+                returns = block.groupby('timestamp')['returns'].agg(['sum', 'count'])
+                if returns_sum is None:
+                    returns_sum, returns_count = returns['sum'], returns['count']
+                else:
+                    returns_sum = returns_sum.add(returns['sum'], fill_value=0)
+                    returns_count = returns_count.add(returns['count'], fill_value=0)
+                volatilities.append(block['volatility_20'].to_numpy(dtype=np.float64))
+                
+                writer = self._write_row_group(writer, staging_path, block)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        vol_quantiles = tuple(np.nanquantile(np.concatenate(volatilities), [0.2, 0.8]))
+        market_returns = (
+            returns_sum / returns_count.replace(0, np.nan)
+            if market_data['symbol'].nunique() > 1 else None
+        )
+        
+        # Second pass: add the labels that need every symbol, one row group at a time
+        total_rows = 0
+        writer = None
+        try:
+            staged = pq.ParquetFile(staging_path)
+            for i in range(staged.num_row_groups):
+                block = staged.read_row_group(i).to_pandas()
+                block = self._add_regime_labels(block, vol_quantiles=vol_quantiles)
+                block = self._add_cross_asset_features(block, market_returns=market_returns)
+                writer = self._write_row_group(writer, output_path, block)
+                total_rows += len(block)
+        finally:
+            if writer is not None:
+                writer.close()
+            staging_path.unlink(missing_ok=True)
+        
+        logger.info(f"Wrote {total_rows} data points to {output_path}")
+        
+        return total_rows
+    
+    @staticmethod
+    def _write_row_group(writer: Optional[pq.ParquetWriter],
+                         path: Path,
+                         block: pd.DataFrame) -> pq.ParquetWriter:
+        """Append a frame as a row group, opening the writer on first use."""
+        
+        if writer is None:
+            table = pa.Table.from_pandas(block, preserve_index=False)
+            writer = pq.ParquetWriter(path, table.schema, compression='snappy')
+        else:
+            table = pa.Table.from_pandas(
+                block.reindex(columns=writer.schema.names),
+                schema=writer.schema,
+                preserve_index=False
+            )
+        writer.write_table(table)
+        return writer
+    
     async def _collect_market_data(self, 
                                  symbols: List[str],
                                  start_date: datetime,
@@ -98,23 +416,38 @@ class EnhancedDataCollector:
                                  timeframe: str) -> pd.DataFrame:
         """Collect market data from multiple sources."""
         
-        all_data = []
+        # Equities/ETFs go out as one batched download; crypto is fetched per symbol
+        crypto_symbols = [s for s in symbols if s.endswith('USD') and len(s) > 6]
+        equity_symbols = [s for s in symbols if s not in crypto_symbols]
+        
+        # Bound in-flight crypto requests by the source's per-minute rate limit
+        crypto_limit = self.data_sources["ccxt"].rate_limit // 60
+        semaphore = asyncio.Semaphore(max(1, min(MAX_CONCURRENT_REQUESTS, crypto_limit)))
+        
+        async def fetch_crypto(symbol: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                return await self._collect_crypto_data(symbol, start_date, end_date, timeframe)
+        
+        equity_result, *crypto_results = await asyncio.gather(
+            self._collect_equity_data(equity_symbols, start_date, end_date, timeframe),
+            *(fetch_crypto(symbol) for symbol in crypto_symbols),
+            return_exceptions=True
+        )
+        
+        results = dict(zip(crypto_symbols, crypto_results))
+        if isinstance(equity_result, Exception):
+            logger.error(f"Error collecting equity data: {equity_result}")
+        else:
+            results.update(equity_result)
         
+        all_data = []
         for symbol in symbols:
-            try:
-                # Determine data source based on symbol
-                if symbol.endswith('USD') and len(symbol) > 6:  # Crypto
-                    data = await self._collect_crypto_data(symbol, start_date, end_date, timeframe)
-                else:  # Equity/ETF
-                    data = await self._collect_equity_data(symbol, start_date, end_date, timeframe)
-                
-                if data is not None and not data.empty:
-                    data['symbol'] = symbol
-                    all_data.append(data)
-                    
-            except Exception as e:
-                logger.error(f"Error collecting data for {symbol}: {e}")
-                continue
+            data = results.get(symbol)
+            if isinstance(data, Exception):
+                logger.error(f"Error collecting data for {symbol}: {data}")
+            elif data is not None and not data.empty:
+                data['symbol'] = symbol
+                all_data.append(data)
         
         if all_data:
             return pd.concat(all_data, ignore_index=True)
@@ -122,40 +455,58 @@ class EnhancedDataCollector:
             return pd.DataFrame()
     
     async def _collect_equity_data(self, 
-                                 symbol: str,
+                                 symbols: List[str],
                                  start_date: datetime,
                                  end_date: datetime,
-                                 timeframe: str) -> pd.DataFrame:
-        """Collect equity data using yfinance."""
+                                 timeframe: str) -> Dict[str, pd.DataFrame]:
+        """Collect equity data for all symbols with one batched yfinance download."""
+        
+        if not symbols:
+            return {}
         
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(
+            batch = await asyncio.to_thread(
+                yf.download,
+                symbols,
                 start=start_date,
                 end=end_date,
                 interval=timeframe,
                 auto_adjust=True,
-                back_adjust=True
+                back_adjust=True,
+                ignore_tz=False,
+                group_by='ticker',
+                threads=True,
+                progress=False
             )
+        except Exception as e:
+            logger.error(f"Error collecting equity data for {symbols}: {e}")
+            return {}
+        
+        if batch is None or batch.empty:
+            return {}
+        
+        equity_data = {}
+        for symbol in symbols:
+            if isinstance(batch.columns, pd.MultiIndex):
+                if symbol not in batch.columns.get_level_values(0):
+                    continue
+                data = batch[symbol]
+            else:
+                data = batch
             
+            # Rows are aligned across tickers; drop dates this symbol did not trade
+            data = data.dropna(how='all')
             if data.empty:
-                return None
-                
+                continue
+            
             # Reset index to get date as column
-            data = data.reset_index()
-            data['timestamp'] = data['Date']
-            data = data.drop('Date', axis=1)
+            data = data.rename_axis('timestamp').reset_index()
+            data.columns.name = None
             
             # Add basic features
-            data['returns'] = data['Close'].pct_change()
-            data['log_returns'] = np.log(data['Close'] / data['Close'].shift(1))
-            data['volatility'] = data['returns'].rolling(window=20).std()
-            
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error collecting equity data for {symbol}: {e}")
-            return None
+            equity_data[symbol] = _add_return_features(data)
+        
+        return equity_data
     
     async def _collect_crypto_data(self, 
                                  symbol: str,
@@ -180,7 +531,9 @@ class EnhancedDataCollector:
             end_ms = int(end_date.timestamp() * 1000)
             
             # Fetch OHLCV data
-            ohlcv = exchange.fetch_ohlcv(symbol, ccxt_timeframe, start_ms, limit=1000)
+            ohlcv = await asyncio.to_thread(
+                exchange.fetch_ohlcv, symbol, ccxt_timeframe, start_ms, limit=1000
+            )
             
             if not ohlcv:
                 return None
@@ -190,11 +543,7 @@ class EnhancedDataCollector:
             data['timestamp'] = pd.to_datetime(data['timestamp'], unit='ms')
             
             # Add basic features
-            data['returns'] = data['Close'].pct_change()
-            data['log_returns'] = np.log(data['Close'] / data['Close'].shift(1))
-            data['volatility'] = data['returns'].rolling(window=20).std()
-            
-            return data
+            return _add_return_features(data)
             
         except Exception as e:
             logger.error(f"Error collecting crypto data for {symbol}: {e}")
@@ -206,7 +555,8 @@ class EnhancedDataCollector:
                                       end_date: datetime) -> pd.DataFrame:
         """Collect alternative data (news sentiment, etc.)."""
         
-        # This is a placeholder - in production, you would integrate with:
+        # This is a placeholder - in production, you would integrate with
+        # (using the shared self.session):
         # - News API for sentiment analysis
         # - Social media APIs for sentiment
         # - Economic data APIs
@@ -216,28 +566,25 @@ class EnhancedDataCollector:
         
         # Create mock alternative data for now
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        alt_data = []
-        
-        for date in dates:
-            for symbol in symbols:
-                alt_data.append({
-                    'timestamp': date,
-                    'symbol': symbol,
-                    'news_sentiment': np.random.normal(0, 0.1),  # Mock sentiment
-                    'social_sentiment': np.random.normal(0, 0.15),  # Mock social sentiment
-                    'fear_greed_index': np.random.uniform(0, 100),  # Mock fear/greed
-                    'vix': np.random.uniform(10, 40),  # Mock VIX
-                    'dxy': np.random.uniform(90, 110),  # Mock Dollar Index
-                })
-        
-        return pd.DataFrame(alt_data)
+        n = len(dates) * len(symbols)
+        
+        return pd.DataFrame({
+            'timestamp': dates.repeat(len(symbols)),
+            'symbol': np.tile(np.asarray(symbols, dtype=object), len(dates)),
+            'news_sentiment': self.rng.normal(0, 0.1, n),  # Mock sentiment
+            'social_sentiment': self.rng.normal(0, 0.15, n),  # Mock social sentiment
+            'fear_greed_index': self.rng.uniform(0, 100, n),  # Mock fear/greed
+            'vix': self.rng.uniform(10, 40, n),  # Mock VIX
+            'dxy': self.rng.uniform(90, 110, n),  # Mock Dollar Index
+        })
     
     async def _collect_economic_data(self, 
                                    start_date: datetime,
                                    end_date: datetime) -> pd.DataFrame:
         """Collect economic data."""
         
-        # This is a placeholder - in production, you would integrate with:
+        # This is a placeholder - in production, you would integrate with
+        # (using the shared self.session):
         # - FRED API for economic indicators
         # - Central bank APIs
         # - Economic calendar APIs
@@ -246,19 +593,16 @@ class EnhancedDataCollector:
         
         # Create mock economic data
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        econ_data = []
-        
-        for date in dates:
-            econ_data.append({
-                'timestamp': date,
-                'interest_rate': np.random.uniform(0.5, 5.0),  # Mock interest rate
-                'inflation_rate': np.random.uniform(1.0, 4.0),  # Mock inflation
-                'gdp_growth': np.random.uniform(-2.0, 4.0),  # Mock GDP growth
-                'unemployment_rate': np.random.uniform(3.0, 8.0),  # Mock unemployment
-                'consumer_confidence': np.random.uniform(80, 120),  # Mock confidence
-            })
-        
-        return pd.DataFrame(econ_data)
+        n = len(dates)
+        
+        return pd.DataFrame({
+            'timestamp': dates,
+            'interest_rate': self.rng.uniform(0.5, 5.0, n),  # Mock interest rate
+            'inflation_rate': self.rng.uniform(1.0, 4.0, n),  # Mock inflation
+            'gdp_growth': self.rng.uniform(-2.0, 4.0, n),  # Mock GDP growth
+            'unemployment_rate': self.rng.uniform(3.0, 8.0, n),  # Mock unemployment
+            'consumer_confidence': self.rng.uniform(80, 120, n),  # Mock confidence
+        })
     
     def _combine_data_sources(self, 
                             market_data: pd.DataFrame,
@@ -288,8 +632,15 @@ class EnhancedDataCollector:
                 how='left'
             )
         
-        # Forward fill missing values
-        combined = combined.fillna(method='ffill').fillna(method='bfill')
+        # Forward/back fill numeric gaps within each symbol's history
+        combined = combined.sort_values(['symbol', 'timestamp'], kind='stable', ignore_index=True)
+        float_cols = combined.select_dtypes('float').columns
+        if len(float_cols) > 0:
+            symbols = combined['symbol'].to_numpy()
+            group_starts = np.r_[True, symbols[1:] != symbols[:-1]]
+            combined[float_cols] = _ffill_bfill_block(
+                combined[float_cols].to_numpy(dtype=np.float64), group_starts
+            )
         
         return combined
     
@@ -299,6 +650,28 @@ class EnhancedDataCollector:
         if data.empty:
             return data
         
+        if 'symbol' not in data.columns:
+            df = self._add_symbol_indicators(data.sort_values('timestamp'))
+        else:
+            # Compute indicators per symbol so rolling windows never span two symbols
+            df = pd.concat(
+                [self._add_symbol_indicators(group.sort_values('timestamp'))
+                 for _, group in data.groupby('symbol', sort=False)],
+                ignore_index=True
+            )
+        
+        # Derived indicators only need float32 precision; input prices stay float64
+        indicator_cols = [
+            col for col in df.columns.difference(data.columns)
+            if df[col].dtype == np.float64
+        ]
+        df[indicator_cols] = df[indicator_cols].astype(np.float32)
+        
+        return df
+    
+    def _add_symbol_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Add technical indicators to a single symbol's time-ordered frame."""
+        
         df = data.copy()
         
         # Moving averages
@@ -318,47 +691,44 @@ class EnhancedDataCollector:
         df['macd_signal'] = df['macd'].ewm(span=9).mean()
         df['macd_histogram'] = df['macd'] - df['macd_signal']
         
-        # RSI
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+        # RSI, ATR, Stochastic %K, Williams %R and OBV share one compiled pass
+        rsi, atr, stoch_k, williams_r, obv = _ohlcv_indicator_kernel(
+            df['High'].to_numpy(dtype=np.float64),
+            df['Low'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64),
+            df['Volume'].to_numpy(dtype=np.float64),
+            14
+        )
+        df['rsi'] = rsi
         
         # Bollinger Bands
-        df['bb_middle'] = df['Close'].rolling(window=20).mean()
-        bb_std = df['Close'].rolling(window=20).std()
+        df['bb_middle'] = df['sma_20']
+        bb_std = _rolling_std(df['Close'], 20)[:, 0]
         df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
         df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
         df['bb_width'] = df['bb_upper'] - df['bb_lower']
         df['bb_position'] = (df['Close'] - df['bb_lower']) / df['bb_width']
         
         # ATR (Average True Range)
-        high_low = df['High'] - df['Low']
-        high_close = np.abs(df['High'] - df['Close'].shift())
-        low_close = np.abs(df['Low'] - df['Close'].shift())
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        df['atr'] = true_range.rolling(window=14).mean()
+        df['atr'] = atr
         
         # Stochastic Oscillator
-        low_14 = df['Low'].rolling(window=14).min()
-        high_14 = df['High'].rolling(window=14).max()
-        df['stoch_k'] = 100 * (df['Close'] - low_14) / (high_14 - low_14)
+        df['stoch_k'] = stoch_k
         df['stoch_d'] = df['stoch_k'].rolling(window=3).mean()
         
         # Williams %R
-        df['williams_r'] = -100 * (high_14 - df['Close']) / (high_14 - low_14)
+        df['williams_r'] = williams_r
         
         # CCI (Commodity Channel Index)
         typical_price = (df['High'] + df['Low'] + df['Close']) / 3
         sma_tp = typical_price.rolling(window=20).mean()
-        mad = typical_price.rolling(window=20).apply(lambda x: np.mean(np.abs(x - x.mean())))
+        mad = _rolling_mean_abs_dev(typical_price, 20)
         df['cci'] = (typical_price - sma_tp) / (0.015 * mad)
         
         # Volume indicators
         df['volume_sma'] = df['Volume'].rolling(window=20).mean()
         df['volume_ratio'] = df['Volume'] / df['volume_sma']
-        df['obv'] = (df['Volume'] * np.sign(df['Close'].diff())).cumsum()
+        df['obv'] = obv
         
         # Price patterns
         df['higher_high'] = (df['High'] > df['High'].shift(1)).astype(int)
@@ -367,67 +737,79 @@ class EnhancedDataCollector:
                            (df['Low'] > df['Low'].shift(1))).astype(int)
         
         # Volatility indicators
-        df['volatility_20'] = df['returns'].rolling(window=20).std()
-        df['volatility_5'] = df['returns'].rolling(window=5).std()
+        volatility = _rolling_std(df['returns'], 20, 5)
+        df['volatility_20'] = volatility[:, 0]
+        df['volatility_5'] = volatility[:, 1]
         df['volatility_ratio'] = df['volatility_5'] / df['volatility_20']
         
         return df
     
-    def _add_regime_labels(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Add market regime labels."""
+    def _add_regime_labels(self,
+                           data: pd.DataFrame,
+                           vol_quantiles: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+        """Add market regime labels.
+        
+        ``vol_quantiles`` are the (20%, 80%) volatility thresholds; they default
+        to the quantiles of ``data`` itself.
+        """
         
         if data.empty:
             return data
         
         df = data.copy()
         
-        # Calculate regime indicators
-        df['trend_regime'] = 'sideways'
-        df.loc[df['sma_20'] > df['sma_50'], 'trend_regime'] = 'uptrend'
-        df.loc[df['sma_20'] < df['sma_50'], 'trend_regime'] = 'downtrend'
+        # Calculate regime indicators as integer codes
+        trend_code = np.where(df['sma_20'] > df['sma_50'], 0,
+                              np.where(df['sma_20'] < df['sma_50'], 1, 2))
+        df['trend_regime'] = pd.Categorical.from_codes(trend_code, categories=TREND_REGIMES)
         
         # Volatility regime
-        df['vol_regime'] = 'normal'
-        df.loc[df['volatility_20'] > df['volatility_20'].quantile(0.8), 'vol_regime'] = 'high'
-        df.loc[df['volatility_20'] < df['volatility_20'].quantile(0.2), 'vol_regime'] = 'low'
+        vol = df['volatility_20']
+        if vol_quantiles is None:
+            vol_quantiles = (vol.quantile(0.2), vol.quantile(0.8))
+        vol_low, vol_high = vol_quantiles
+        vol_code = np.where(vol < vol_low, 0, np.where(vol > vol_high, 2, 1))
+        df['vol_regime'] = pd.Categorical.from_codes(vol_code, categories=VOL_REGIMES)
         
         # Market regime (combination)
-        df['market_regime'] = df['trend_regime'] + '_' + df['vol_regime']
+        df['market_regime'] = pd.Categorical.from_codes(
+            trend_code * len(VOL_REGIMES) + vol_code, categories=MARKET_REGIMES
+        )
         
         return df
     
-    def _add_cross_asset_features(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Add cross-asset correlation features."""
+    def _add_cross_asset_features(self,
+                                  data: pd.DataFrame,
+                                  market_returns: Optional[pd.Series] = None) -> pd.DataFrame:
+        """Add cross-asset correlation features.
+        
+        ``market_returns`` maps timestamp to the cross-sectional mean return; it
+        defaults to the mean over the symbols in ``data``.
+        """
         
         if data.empty:
             return data
         
         df = data.copy()
         
-        # Calculate correlations with market indices
-        if 'symbol' in df.columns:
-            # Group by symbol and calculate rolling correlations
-            for symbol in df['symbol'].unique():
-                symbol_data = df[df['symbol'] == symbol].copy()
-                
-                # Rolling correlation with market (if multiple symbols)
-                if len(df['symbol'].unique()) > 1:
-                    market_returns = df.groupby('timestamp')['returns'].mean()
-                    symbol_data['market_correlation'] = symbol_data['returns'].rolling(
-                        window=20
-                    ).corr(symbol_data['timestamp'].map(market_returns))
-                
-                # Update the main dataframe
-                df.loc[df['symbol'] == symbol, 'market_correlation'] = symbol_data['market_correlation']
+        # Rolling correlation of each symbol's returns with the cross-sectional mean
+        if market_returns is not None:
+            df['_market_returns'] = df['timestamp'].map(market_returns)
+        elif 'symbol' in df.columns and df['symbol'].nunique() > 1:
+            df['_market_returns'] = df.groupby('timestamp')['returns'].transform('mean')
+        
+        if '_market_returns' in df.columns:
+            df['market_correlation'] = pd.concat([
+                group['returns'].rolling(window=20).corr(group['_market_returns'])
+                for _, group in df.groupby('symbol', sort=False)
+            ])
+            df = df.drop(columns='_market_returns')
         
         return df
 
 async def main():
     """Main function to collect training data."""
     
-    # Initialize data collector
-    collector = EnhancedDataCollector()
-    
     # Define symbols to collect
     symbols = [
         'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA',  # Tech stocks
@@ -440,37 +822,44 @@ async def main():
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=5*365)
     
-    # Collect comprehensive data
-    training_data = await collector.collect_comprehensive_data(
-        symbols=symbols,
-        start_date=start_date,
-        end_date=end_date,
-        timeframe='1d'
-    )
+    # Collect comprehensive data, streaming one symbol at a time to Parquet
+    output_path = Path('training_data_comprehensive.parquet')
+    async with EnhancedDataCollector() as collector:
+        total_records = await collector.collect_to_parquet(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            output_path=output_path,
+            timeframe='1d'
+        )
+    
+    if total_records == 0:
+        logger.error("No training data collected")
+        return
     
-    # Save data
-    output_path = Path('training_data_comprehensive.csv')
-    training_data.to_csv(output_path, index=False)
+    # Only the key columns are loaded back for the summary
+    columns = pq.ParquetFile(output_path).schema_arrow.names
+    keys = pd.read_parquet(output_path, columns=['timestamp', 'symbol'])
     
     logger.info(f"Training data saved to {output_path}")
-    logger.info(f"Data shape: {training_data.shape}")
-    logger.info(f"Columns: {list(training_data.columns)}")
+    logger.info(f"Data shape: ({total_records}, {len(columns)})")
+    logger.info(f"Columns: {columns}")
     
     # Print summary statistics
     print("\n=== Training Data Summary ===")
-    print(f"Total records: {len(training_data)}")
-    print(f"Total features: {len(training_data.columns)}")
-    print(f"Date range: {training_data['timestamp'].min()} to {training_data['timestamp'].max()}")
-    print(f"Symbols: {training_data['symbol'].unique()}")
+    print(f"Total records: {total_records}")
+    print(f"Total features: {len(columns)}")
+    print(f"Date range: {keys['timestamp'].min()} to {keys['timestamp'].max()}")
+    print(f"Symbols: {keys['symbol'].unique()}")
     
     # Print feature categories
     feature_categories = {
         'Price Data': ['Open', 'High', 'Low', 'Close', 'Volume'],
-        'Technical Indicators': [col for col in training_data.columns if any(indicator in col.lower() for indicator in ['sma', 'ema', 'rsi', 'macd', 'bb', 'atr', 'stoch', 'williams', 'cci'])],
-        'Alternative Data': [col for col in training_data.columns if any(alt in col.lower() for alt in ['sentiment', 'vix', 'dxy', 'fear', 'greed'])],
-        'Economic Data': [col for col in training_data.columns if any(econ in col.lower() for econ in ['interest', 'inflation', 'gdp', 'unemployment', 'confidence'])],
-        'Regime Labels': [col for col in training_data.columns if 'regime' in col.lower()],
-        'Cross-Asset': [col for col in training_data.columns if 'correlation' in col.lower()]
+        'Technical Indicators': [col for col in columns if any(indicator in col.lower() for indicator in ['sma', 'ema', 'rsi', 'macd', 'bb', 'atr', 'stoch', 'williams', 'cci'])],
+        'Alternative Data': [col for col in columns if any(alt in col.lower() for alt in ['sentiment', 'vix', 'dxy', 'fear', 'greed'])],
+        'Economic Data': [col for col in columns if any(econ in col.lower() for econ in ['interest', 'inflation', 'gdp', 'unemployment', 'confidence'])],
+        'Regime Labels': [col for col in columns if 'regime' in col.lower()],
+        'Cross-Asset': [col for col in columns if 'correlation' in col.lower()]
     }
     
     for category, features in feature_categories.items():
@@ -11,10 +11,25 @@ import torch
 import torch.nn as nn
 from datetime import datetime, timezone
 from pathlib import Path
+import hashlib
 import logging
-import json
+import operator
+import os
+import re
+import tempfile
+import weakref
+import orjson
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, Any, List, Optional
 import joblib
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+from numba import njit, prange
+from safetensors.torch import save_file
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.model_selection import train_test_split
 
@@ -33,15 +48,184 @@ from trading.logging_utils import model_logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@njit(parallel=True, cache=True)
+def _build_windows(features, lookback_window, out, y):
+    """Fill ``out[i] = features[i:i + lookback]`` and ``y[i] = features[i + lookback, 0]`` in parallel.
+    
+    Compiled lazily on the first contiguous windowing call; ``cache=True`` lets later
+    processes load the compiled kernel from disk instead of re-running the JIT.
+    """
+    
+    for i in prange(features.shape[0] - lookback_window):
+        out[i] = features[i:i + lookback_window]
+        y[i] = features[i + lookback_window, 0]
+
+def _sliding_windows(features: np.ndarray, lookback_window: int, contiguous: bool = False) -> tuple:
+    """Build (lookback, features) input windows and next-step close targets.
+    
+    X[i] = features[i:i + lookback] and y[i] = features[i + lookback, 0]. By default X
+    is a zero-copy strided view over ``features``; with ``contiguous=True`` it is
+    materialized into a C-contiguous (N - lookback, lookback, F) buffer by a parallel
+    kernel, for consumers that reshape or copy the windows anyway.
+    """
+    
+    if len(features) <= lookback_window:
+        return np.array([]), np.array([])
+    
+    if contiguous:
+        n_windows = len(features) - lookback_window
+        X = np.empty((n_windows, lookback_window, features.shape[1]), dtype=features.dtype)
+        y = np.empty(n_windows, dtype=features.dtype)
+        _build_windows(features, lookback_window, X, y)
+        return X, y
+    
+    windows = np.lib.stride_tricks.sliding_window_view(features, lookback_window, axis=0)
+    X = windows[:-1].transpose(0, 2, 1)
+    y = features[lookback_window:, 0].copy()  # Predict close price
+    
+    return X, y
+
+# Columns that are never model features
+NON_FEATURE_COLUMNS = {'timestamp', 'symbol', 'Date', 'returns', 'log_returns'}
+
+# Hive partition keys of the date-sharded training dataset (see csv_to_parquet)
+PARTITION_COLUMNS = ['year', 'month']
+
+# Fixed regime vocabularies, in the order collect_training_data.py writes them, so a
+# label maps to the same code whether it was read from CSV, Parquet or a subset
+TREND_REGIMES = ['uptrend', 'downtrend', 'sideways']
+VOL_REGIMES = ['low', 'normal', 'high']
+MARKET_REGIMES = [f"{trend}_{vol}" for trend in TREND_REGIMES for vol in VOL_REGIMES]
+REGIME_VOCABULARIES = {
+    'trend_regime': pd.Index(TREND_REGIMES),
+    'vol_regime': pd.Index(VOL_REGIMES),
+    'market_regime': pd.Index(MARKET_REGIMES)
+}
+
+# Bump whenever preprocessing changes what the cached windows hold (e.g. the regime
+# label encoding), so windows written by older code are never reused
+WINDOW_CACHE_VERSION = 2
+
+# Window files named by the unversioned scheme: a bare SHA1 before the _X/_y suffix
+_LEGACY_WINDOW_STEM = re.compile(r'[0-9a-f]{40}')
+
+# Column-name patterns used to group features in the data summary
+FEATURE_CATEGORY_PATTERNS = {
+    'Technical Indicators': re.compile(r'sma|ema|rsi|macd|bb|atr|stoch|williams|cci', re.IGNORECASE),
+    'Alternative Data': re.compile(r'sentiment|vix|dxy|fear|greed', re.IGNORECASE),
+    'Economic Data': re.compile(r'interest|inflation|gdp|unemployment|confidence', re.IGNORECASE),
+    'Regime Labels': re.compile(r'regime', re.IGNORECASE),
+    'Cross-Asset': re.compile(r'correlation', re.IGNORECASE)
+}
+
+# orjson serializes NumPy scalars/arrays and datetimes natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Serialize ``obj`` with orjson and atomically replace ``path`` with it.
+    
+    The bytes go to a temporary sibling first, so a run that dies mid-write never
+    leaves a truncated JSON file behind.
+    """
+    
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(orjson.dumps(obj, option=JSON_OPTIONS))
+    os.replace(tmp_path, path)
+
+def _save_npy(path: Path, array: np.ndarray) -> None:
+    """np.save to a temporary file and move it into place, so readers never see a partial file."""
+    
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+def _save_state_dict_safetensors(module: Optional[nn.Module], path: Path) -> Optional[Path]:
+    """Write an inference checkpoint of ``module`` as bf16 safetensors.
+    
+    Floating-point tensors are stored as bfloat16 (half the bytes, mmap-able on load);
+    a ``<name>.dtypes.json`` sidecar records the original dtypes so loaders can upcast.
+    Returns the weights path, or None when there is no torch module to export.
+    """
+    
+    if module is None:
+        return None
+    
+    state_dict = module.state_dict()
+    weights = {}
+    for name, tensor in state_dict.items():
+        tensor = tensor.detach().cpu()
+        if tensor.is_floating_point():
+            tensor = tensor.to(torch.bfloat16)
+        weights[name] = tensor.contiguous()
+    
+    weights_path = path.with_suffix('.safetensors')
+    save_file(weights, str(weights_path))
+    
+    dtypes_path = path.with_suffix('.dtypes.json')
+    _write_json(dtypes_path, {name: str(tensor.dtype) for name, tensor in state_dict.items()})
+    
+    return weights_path
+
+# Models that hold CUDA tensors; they take turns on the GPU in worker processes
+GPU_MODELS = {'tft', 'lstm', 'ppo'}
+
+# Prepared train/validation frames handed from train_all_models to its workers
+PREPARED_SPLITS = ('train', 'validation')
+
+_gpu_semaphore = None
+
+def _init_training_worker(gpu_semaphore) -> None:
+    """Pool initializer: install the GPU semaphore shared by all workers."""
+    
+    global _gpu_semaphore
+    _gpu_semaphore = gpu_semaphore
+
+def _train_model_worker(data_path: str, output_dir: str, model_key: str,
+                        prepared_dir: str,
+                        start_date: Optional[str] = None,
+                        end_date: Optional[str] = None,
+                        cache_dir: str = "cache/windows") -> Dict[str, Any]:
+    """Train a single model in a worker process on the parent's prepared data.
+    
+    Only paths travel to the worker, so the trainer itself is never pickled, and
+    the prepared frames are memory-mapped rather than parsed again.
+    """
+    
+    trainer = EnhancedModelTrainer(data_path, output_dir, start_date=start_date,
+                                   end_date=end_date, cache_dir=cache_dir)
+    trainer.load_prepared_data(prepared_dir)
+    train = getattr(trainer, f"train_{model_key}_model")
+    
+    if _gpu_semaphore is not None and model_key in GPU_MODELS:
+        with _gpu_semaphore:
+            return train()
+    return train()
+
 class EnhancedModelTrainer:
     """Enhanced model trainer with comprehensive training pipeline."""
     
-    def __init__(self, data_path: str, output_dir: str = "models"):
+    def __init__(self, data_path: str, output_dir: str = "models",
+                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 cache_dir: str = "cache/windows"):
+        # TF32 matmuls/convolutions on Ampere+ and cuDNN autotuning for the
+        # fixed (lookback, features) input shapes
+        torch.set_float32_matmul_precision('high')
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+        
         self.data_path = data_path
+        self.start_date = start_date
+        self.end_date = end_date
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Window cache lives outside output_dir so it survives model retraining
+        self.cache_dir = Path(cache_dir)
         
-        # Model configurations
+        # Model configurations. Models are deliberately not wrapped in torch.compile:
+        # its tracing and guard overhead outweighs kernel savings on graphs this
+        # small at batch 64
         self.model_configs = {
             ModelType.TFT: {
                 "model_name": "tft_enhanced",
@@ -54,10 +238,11 @@ class EnhancedModelTrainer:
                     "dropout": 0.1,
                     "learning_rate": 0.001,
                     "batch_size": 64,
-                    "max_epochs": 100
+                    "max_epochs": 100,
+                    "fused_optimizer": True
                 }
             },
-            ModelType.LSTM: {
+            ModelType.LSTM_ATTN: {
                 "model_name": "lstm_enhanced",
                 "symbol": "AAPL",
                 "config": {
@@ -71,7 +256,8 @@ class EnhancedModelTrainer:
                     "prediction_length": 1,
                     "learning_rate": 0.001,
                     "batch_size": 64,
-                    "max_epochs": 100
+                    "max_epochs": 100,
+                    "fused_optimizer": True
                 }
             },
             ModelType.PPO: {
@@ -108,38 +294,155 @@ class EnhancedModelTrainer:
         # Training data
         self.training_data = None
         self.validation_data = None
+        self._feature_columns: List[str] = []
+        # (id(frame), window shape) -> (weakref to frame, windows); the weakref both
+        # guards against a reused id and evicts the entry once the frame is freed
+        self._windowed_cache: Dict[tuple, tuple] = {}
         
-    def load_and_prepare_data(self) -> None:
+    def load_and_prepare_data(self, summary: bool = True) -> None:
         """Load and prepare training data."""
         
         logger.info(f"Loading training data from {self.data_path}")
         
-        # Load data
-        self.training_data = pd.read_csv(self.data_path)
+        # Load data (Parquet file or date-partitioned dataset; CSV is still accepted)
+        data_path = Path(self.data_path)
+        if data_path.is_dir() or data_path.suffix == '.parquet':
+            self.training_data = self._load_parquet(data_path)
+        else:
+            self.training_data = self._read_csv(self.data_path)
         
-        # Convert timestamp
-        self.training_data['timestamp'] = pd.to_datetime(self.training_data['timestamp'])
+        # Normalize timestamps to UTC (a no-op parse when the reader already typed them)
+        self.training_data['timestamp'] = pd.to_datetime(
+            self.training_data['timestamp'], format='ISO8601', cache=True, utc=True
+        )
         
         # Sort by timestamp
         self.training_data = self.training_data.sort_values('timestamp').reset_index(drop=True)
         
-        # Handle missing values
-        self.training_data = self.training_data.fillna(method='ffill').fillna(method='bfill')
-        
-        # Split into train/validation
-        split_date = self.training_data['timestamp'].quantile(0.8)
-        self.validation_data = self.training_data[
-            self.training_data['timestamp'] >= split_date
-        ].copy()
-        self.training_data = self.training_data[
-            self.training_data['timestamp'] < split_date
-        ].copy()
+        # Handle missing values, touching only columns that have gaps; numeric
+        # columns are forward/back filled together as one block
+        data = self.training_data
+        gap_columns = [col for col in data.columns if data[col].hasnans]
+        numeric_columns = set(data.select_dtypes(include=[np.number]).columns)
+        numeric_gaps = [col for col in gap_columns if col in numeric_columns]
+        if numeric_gaps:
+            data[numeric_gaps] = data[numeric_gaps].ffill().bfill()
+        for col in gap_columns:
+            if col not in numeric_columns:
+                data[col] = data[col].ffill().bfill()
+        
+        # Regime labels become 1-byte integer codes so the feature matrix stays numeric
+        self._encode_regime_labels(self.training_data)
+        
+        # Split into train/validation by position on the sorted timestamps; the
+        # boundary is moved back to the first row of its timestamp so a single
+        # timestamp never straddles both sets
+        timestamps = self.training_data['timestamp']
+        split_idx = int(0.8 * len(self.training_data))
+        if split_idx < len(self.training_data):
+            split_idx = timestamps.searchsorted(timestamps.iloc[split_idx], side='left')
+        self.validation_data = self.training_data.iloc[split_idx:].reset_index(drop=True)
+        self.training_data = self.training_data.iloc[:split_idx].reset_index(drop=True)
+        self._windowed_cache.clear()
+        self._resolve_feature_columns()
         
         logger.info(f"Training data: {len(self.training_data)} samples")
         logger.info(f"Validation data: {len(self.validation_data)} samples")
         
         # Print data summary
-        self._print_data_summary()
+        if summary:
+            self._print_data_summary()
+    
+    def save_prepared_data(self, directory: str) -> None:
+        """Write the prepared train/validation frames as uncompressed Arrow IPC files."""
+        
+        for split, frame in zip(PREPARED_SPLITS, (self.training_data, self.validation_data)):
+            feather.write_feather(frame, str(Path(directory) / f"{split}.arrow"), compression='uncompressed')
+    
+    def load_prepared_data(self, directory: str) -> None:
+        """Memory-map frames written by save_prepared_data instead of loading the raw data."""
+        
+        self.training_data, self.validation_data = (
+            feather.read_table(str(Path(directory) / f"{split}.arrow"), memory_map=True)
+            .to_pandas(split_blocks=True, self_destruct=True)
+            for split in PREPARED_SPLITS
+        )
+        self._windowed_cache.clear()
+        self._resolve_feature_columns()
+    
+    def _resolve_feature_columns(self) -> None:
+        """Resolve the numeric feature columns once; every model and metadata builder reuses them."""
+        
+        numeric_columns = set(self.training_data.select_dtypes(include=[np.number]).columns)
+        self._feature_columns = [
+            col for col in self.training_data.columns
+            if col not in NON_FEATURE_COLUMNS and col in numeric_columns
+        ]
+    
+    @staticmethod
+    def _encode_regime_labels(data: pd.DataFrame) -> None:
+        """Replace categorical/string/integer regime columns with int8 codes in place.
+        
+        Labels are coded against the fixed REGIME_VOCABULARIES, never the categories
+        of the input, and labels outside the vocabulary (or missing) become -1.
+        """
+        
+        columns = data.columns
+        for col in columns[columns.str.contains(FEATURE_CATEGORY_PATTERNS['Regime Labels'])]:
+            labels = data[col]
+            if pd.api.types.is_integer_dtype(labels):
+                data[col] = labels.astype(np.int8)
+            elif isinstance(labels.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(labels):
+                vocabulary = REGIME_VOCABULARIES.get(col)
+                if vocabulary is None:
+                    logger.warning(f"No fixed vocabulary for regime column {col}; leaving it out of the features")
+                    continue
+                data[col] = vocabulary.get_indexer(labels.astype(object)).astype(np.int8)
+    
+    def _load_parquet(self, path: Path) -> pd.DataFrame:
+        """Load a Parquet file or hive-partitioned dataset with column and date pushdown.
+        
+        Only timestamp, symbol and feature columns are decoded, and the optional
+        start_date/end_date bounds are pushed into the scan so row groups and
+        year/month partitions outside the range are skipped.
+        """
+        
+        dataset = ds.dataset(str(path), format='parquet', partitioning='hive')
+        
+        skip_columns = (NON_FEATURE_COLUMNS - {'timestamp', 'symbol'}) | set(PARTITION_COLUMNS)
+        columns = [col for col in dataset.schema.names if col not in skip_columns]
+        
+        row_filter = None
+        timestamp_type = dataset.schema.field('timestamp').type
+        partitioned = all(col in dataset.schema.names for col in PARTITION_COLUMNS)
+        for bound, op in ((self.start_date, operator.ge), (self.end_date, operator.le)):
+            if bound is None:
+                continue
+            bound = pd.Timestamp(bound)
+            condition = op(ds.field('timestamp'), pa.scalar(bound, type=timestamp_type))
+            if partitioned:
+                # Coarse (year, month) bound so whole partitions are pruned
+                condition &= op(ds.field('year') * 100 + ds.field('month'),
+                                bound.year * 100 + bound.month)
+            row_filter = condition if row_filter is None else row_filter & condition
+        
+        table = dataset.to_table(columns=columns, filter=row_filter)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    @staticmethod
+    def _read_csv(path: str) -> pd.DataFrame:
+        """Read a training CSV with Arrow's multithreaded parser.
+        
+        Raw OHLCV stays float64 so returns and rolling statistics keep full
+        precision; only the model input windows are downcast to float32.
+        """
+        
+        read_options = pv.ReadOptions(use_threads=True, block_size=64 << 20)
+        convert_options = pv.ConvertOptions(
+            timestamp_parsers=[pv.ISO8601, '%Y-%m-%d %H:%M:%S%z', '%Y-%m-%d %H:%M:%S']
+        )
+        table = pv.read_csv(path, read_options=read_options, convert_options=convert_options)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
     
     def _print_data_summary(self) -> None:
         """Print data summary."""
@@ -151,15 +454,11 @@ class EnhancedModelTrainer:
         if 'symbol' in self.training_data.columns:
             print(f"Symbols: {self.training_data['symbol'].unique()}")
         
-        # Feature categories
-        feature_categories = {
-            'Price Data': ['Open', 'High', 'Low', 'Close', 'Volume'],
-            'Technical Indicators': [col for col in self.training_data.columns if any(indicator in col.lower() for indicator in ['sma', 'ema', 'rsi', 'macd', 'bb', 'atr', 'stoch', 'williams', 'cci'])],
-            'Alternative Data': [col for col in self.training_data.columns if any(alt in col.lower() for alt in ['sentiment', 'vix', 'dxy', 'fear', 'greed'])],
-            'Economic Data': [col for col in self.training_data.columns if any(econ in col.lower() for econ in ['interest', 'inflation', 'gdp', 'unemployment', 'confidence'])],
-            'Regime Labels': [col for col in self.training_data.columns if 'regime' in col.lower()],
-            'Cross-Asset': [col for col in self.training_data.columns if 'correlation' in col.lower()]
-        }
+        # Feature categories (one case-insensitive regex pass over the columns each)
+        columns = self.training_data.columns
+        feature_categories = {'Price Data': ['Open', 'High', 'Low', 'Close', 'Volume']}
+        for category, pattern in FEATURE_CATEGORY_PATTERNS.items():
+            feature_categories[category] = columns[columns.str.contains(pattern)].tolist()
         
         for category, features in feature_categories.items():
             if features:
@@ -189,13 +488,15 @@ class EnhancedModelTrainer:
         # Train model
         training_results = model.train(X_train, y_train, X_val, y_val)
         
-        # Save model
+        # Save model (full checkpoint plus bf16 inference weights)
         model_path = self.output_dir / f"{config['model_name']}.pkl"
         model.save_model(str(model_path))
+        weights_path = _save_state_dict_safetensors(model.model, model_path)
         
         # Save training metadata
         metadata = {
             "model_type": "TFT",
+            "weights_path": str(weights_path) if weights_path else None,
             "training_samples": len(X_train),
             "validation_samples": len(X_val),
             "features": len(X_train[0]) if len(X_train) > 0 else 0,
@@ -205,8 +506,7 @@ class EnhancedModelTrainer:
         }
         
         metadata_path = self.output_dir / f"{config['model_name']}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
         
         logger.info(f"TFT model saved to {model_path}")
         return training_results
@@ -216,7 +516,7 @@ class EnhancedModelTrainer:
         
         logger.info("Training LSTM model...")
         
-        config = self.model_configs[ModelType.LSTM]
+        config = self.model_configs[ModelType.LSTM_ATTN]
         model = ProductionLSTM(
             model_name=config["model_name"],
             symbol=config["symbol"],
@@ -231,13 +531,15 @@ class EnhancedModelTrainer:
             feature_columns=self._get_feature_columns()
         )
         
-        # Save model
+        # Save model (full checkpoint plus bf16 inference weights)
         model_path = self.output_dir / f"{config['model_name']}.pkl"
         model.save_model(str(model_path))
+        weights_path = _save_state_dict_safetensors(model.model, model_path)
         
         # Save training metadata
         metadata = {
             "model_type": "LSTM",
+            "weights_path": str(weights_path) if weights_path else None,
             "training_samples": len(self.training_data),
             "validation_samples": len(self.validation_data),
             "features": len(self._get_feature_columns()),
@@ -247,8 +549,7 @@ class EnhancedModelTrainer:
         }
         
         metadata_path = self.output_dir / f"{config['model_name']}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
         
         logger.info(f"LSTM model saved to {model_path}")
         return training_results
@@ -298,8 +599,7 @@ class EnhancedModelTrainer:
         }
         
         metadata_path = self.output_dir / f"{config['model_name']}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
         
         logger.info(f"PPO model saved to {model_path}")
         return training_results
@@ -339,8 +639,7 @@ class EnhancedModelTrainer:
         }
         
         metadata_path = self.output_dir / f"{config['model_name']}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
         
         logger.info(f"Naive model saved to {model_path}")
         return training_results
@@ -348,28 +647,107 @@ class EnhancedModelTrainer:
     def _prepare_tft_features(self, data: pd.DataFrame) -> tuple:
         """Prepare features for TFT model."""
         
-        # Select relevant features
-        feature_columns = self._get_feature_columns()
-        available_features = [col for col in feature_columns if col in data.columns]
+        lookback_window = self.model_configs[ModelType.TFT]["config"]["lookback_window"]
+        # The TFT reshapes its input, so hand it contiguous windows rather than a strided view
+        return self._prepare_windowed(data, lookback_window, self._get_feature_columns(), contiguous=True)
+    
+    def _prepare_windowed(self, data: pd.DataFrame, lookback_window: int,
+                          feature_columns: List[str], contiguous: bool = False) -> tuple:
+        """Build (X, y) windows over ``feature_columns``, cached per frame and window shape."""
+        
+        available_features = tuple(col for col in feature_columns if col in data.columns)
+        key = (id(data), lookback_window, available_features, contiguous)
+        cached = self._windowed_cache.get(key)
+        if cached is not None and cached[0]() is data:
+            return cached[1]
         
         if not available_features:
             return np.array([]), np.array([])
         
-        # Prepare feature matrix
-        features = data[available_features].values
+        # Reuse windows persisted by an earlier run over the same data
+        disk_key = self._window_cache_key(data, lookback_window, available_features)
+        if disk_key is not None:
+            path_X = self.cache_dir / f"{disk_key}_X.npy"
+            path_y = self.cache_dir / f"{disk_key}_y.npy"
+            if path_X.exists() and path_y.exists():
+                windows = np.load(path_X, mmap_mode='r'), np.load(path_y, mmap_mode='r')
+                self._cache_windows(key, data, windows)
+                return windows
+        
+        # Prepare feature matrix as one owned, contiguous float32 block
+        features = np.ascontiguousarray(
+            data[list(available_features)].to_numpy(dtype=np.float32, copy=True)
+        )
         
-        # Handle missing values
-        features = np.nan_to_num(features, nan=0.0, posinf=0.0, neginf=0.0)
+        # Handle missing values in place
+        np.nan_to_num(features, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         
         # Create sequences
-        lookback_window = 60
-        X, y = [], []
+        windows = _sliding_windows(features, lookback_window, contiguous)
+        if disk_key is not None and len(windows[0]) > 0:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _save_npy(path_X, windows[0])
+            _save_npy(path_y, windows[1])
+            self._prune_window_cache(disk_key)
+        
+        self._cache_windows(key, data, windows)
+        return windows
+    
+    def _cache_windows(self, key: tuple, data: pd.DataFrame, windows: tuple) -> None:
+        """Remember windows built from ``data`` until the frame is freed."""
+        
+        cache = self._windowed_cache
         
-        for i in range(lookback_window, len(features)):
-            X.append(features[i-lookback_window:i])
-            y.append(features[i, 0])  # Predict close price
+        def evict(ref: weakref.ref) -> None:
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
         
-        return np.array(X), np.array(y)
+        cache[key] = (weakref.ref(data, evict), windows)
+    
+    def _window_cache_key(self, data: pd.DataFrame, lookback_window: int,
+                          feature_columns: tuple) -> Optional[str]:
+        """File stem identifying the windows of the train/validation split on disk.
+        
+        ``<slot>-<fingerprint>``: the slot hashes the data path, split and lookback
+        window; the fingerprint also covers the data mtime, the date range, the
+        feature columns and their dtypes, the output dtype and WINDOW_CACHE_VERSION.
+        None for any other frame.
+        """
+        
+        if data is self.training_data:
+            split = 'train'
+        elif data is self.validation_data:
+            split = 'validation'
+        else:
+            return None
+        
+        data_path = Path(self.data_path)
+        if data_path.is_dir():
+            mtime = max((p.stat().st_mtime_ns for p in data_path.rglob('*') if p.is_file()), default=0)
+        else:
+            mtime = data_path.stat().st_mtime_ns
+        
+        resolved = str(data_path.resolve())
+        feature_dtypes = tuple(str(data[col].dtype) for col in feature_columns)
+        slot = (resolved, split, lookback_window)
+        fingerprint = (WINDOW_CACHE_VERSION, resolved, mtime, split, self.start_date, self.end_date,
+                       feature_columns, feature_dtypes, lookback_window, 'float32')
+        return (f"{hashlib.sha1(repr(slot).encode()).hexdigest()[:16]}-"
+                f"{hashlib.sha1(repr(fingerprint).encode()).hexdigest()}")
+    
+    def _prune_window_cache(self, disk_key: str) -> None:
+        """Delete cached windows that ``disk_key`` supersedes.
+        
+        That is every other fingerprint in the same slot, plus files left by the
+        unversioned naming scheme, which no current key can match.
+        """
+        
+        slot_prefix = disk_key.split('-', 1)[0] + '-'
+        for path in self.cache_dir.glob('*.npy'):
+            stem = path.stem.rsplit('_', 1)[0]
+            if stem != disk_key and (stem.startswith(slot_prefix) or _LEGACY_WINDOW_STEM.fullmatch(stem)):
+                path.unlink(missing_ok=True)
     
     def _prepare_ppo_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Prepare data for PPO training."""
@@ -378,109 +756,111 @@ class EnhancedModelTrainer:
         feature_columns = self._get_feature_columns()
         available_features = [col for col in feature_columns if col in data.columns]
         
-        # Add required columns for PPO
-        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume'] + available_features
-        
-        ppo_data = data[required_columns].copy()
+        # Add required columns for PPO (OHLCV are usually features too, so dedupe)
+        required_columns = list(dict.fromkeys(['Open', 'High', 'Low', 'Close', 'Volume'] + available_features))
         
-        # Ensure all required columns exist
-        for col in required_columns:
-            if col not in ppo_data.columns:
-                ppo_data[col] = 0.0
+        # Select existing columns without a defensive copy; only missing ones are allocated
+        missing = [col for col in required_columns if col not in data.columns]
+        if not missing:
+            return data.loc[:, required_columns]
         
-        return ppo_data
+        zeros = pd.DataFrame(0.0, index=data.index, columns=missing, dtype=np.float32)
+        present = [col for col in required_columns if col in data.columns]
+        return pd.concat([data[present], zeros], axis=1)[required_columns]
     
     def _prepare_naive_features(self, data: pd.DataFrame) -> tuple:
         """Prepare features for Naive model."""
         
         # Simple moving average features
-        feature_columns = ['Close', 'Volume']
-        available_features = [col for col in feature_columns if col in data.columns]
-        
-        if not available_features:
-            return np.array([]), np.array([])
-        
-        # Prepare feature matrix
-        features = data[available_features].values
-        
-        # Handle missing values
-        features = np.nan_to_num(features, nan=0.0, posinf=0.0, neginf=0.0)
-        
-        # Create sequences
-        lookback_window = 20
-        X, y = [], []
-        
-        for i in range(lookback_window, len(features)):
-            X.append(features[i-lookback_window:i])
-            y.append(features[i, 0])  # Predict close price
-        
-        return np.array(X), np.array(y)
+        lookback_window = self.model_configs[ModelType.NAIVE]["config"]["lookback_window"]
+        return self._prepare_windowed(data, lookback_window, ['Close', 'Volume'])
     
     def _get_feature_columns(self) -> List[str]:
-        """Get list of feature columns."""
-        
-        if self.training_data is None:
-            return []
+        """Get list of feature columns (resolved once in load_and_prepare_data)."""
         
-        # Exclude non-feature columns
-        exclude_columns = ['timestamp', 'symbol', 'Date', 'returns', 'log_returns']
-        
-        feature_columns = [
-            col for col in self.training_data.columns 
-            if col not in exclude_columns
-        ]
-        
-        return feature_columns
+        return self._feature_columns
     
-    def train_all_models(self) -> Dict[str, Any]:
-        """Train all models."""
+    def train_all_models(self, max_workers: int = 4) -> Dict[str, Any]:
+        """Train all models concurrently, one worker process per model.
+        
+        The data is loaded and prepared once here (unless load_and_prepare_data
+        already ran) and handed to the workers as memory-mapped Arrow files.
+        """
         
         logger.info("Starting comprehensive model training...")
         
-        results = {}
-        
-        try:
-            # Train TFT model
-            results['tft'] = self.train_tft_model()
-        except Exception as e:
-            logger.error(f"TFT training failed: {e}")
-            results['tft'] = {"error": str(e)}
-        
-        try:
-            # Train LSTM model
-            results['lstm'] = self.train_lstm_model()
-        except Exception as e:
-            logger.error(f"LSTM training failed: {e}")
-            results['lstm'] = {"error": str(e)}
-        
-        try:
-            # Train PPO model
-            results['ppo'] = self.train_ppo_model()
-        except Exception as e:
-            logger.error(f"PPO training failed: {e}")
-            results['ppo'] = {"error": str(e)}
-        
-        try:
-            # Train Naive model
-            results['naive'] = self.train_naive_model()
-        except Exception as e:
-            logger.error(f"Naive training failed: {e}")
-            results['naive'] = {"error": str(e)}
+        if self.training_data is None:
+            self.load_and_prepare_data(summary=False)
+        
+        model_keys = ['tft', 'lstm', 'ppo', 'naive']
+        results = dict.fromkeys(model_keys)
+        
+        # CUDA needs spawned workers. Every worker would otherwise put its model on
+        # the default device, so TFT/LSTM/PPO take turns on the GPU while Naive
+        # always runs alongside them
+        ctx = multiprocessing.get_context('spawn')
+        gpu_semaphore = ctx.Semaphore(1) if torch.cuda.is_available() else None
+        
+        with tempfile.TemporaryDirectory(prefix="prepared_") as prepared_dir:
+            self.save_prepared_data(prepared_dir)
+            
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=ctx,
+                initializer=_init_training_worker,
+                initargs=(gpu_semaphore,)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _train_model_worker, self.data_path, str(self.output_dir), key,
+                        prepared_dir, self.start_date, self.end_date, str(self.cache_dir)
+                    ): key
+                    for key in model_keys
+                }
+                
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        logger.error(f"{key.upper()} training failed: {e}")
+                        results[key] = {"error": str(e)}
         
         # Save overall results
         results_path = self.output_dir / "training_results.json"
-        with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        _write_json(results_path, results)
         
         logger.info(f"Training results saved to {results_path}")
         
         return results
 
+def csv_to_parquet(src: str, dst: str) -> None:
+    """Convert a training CSV into a year/month hive-partitioned Parquet dataset.
+    
+    One-time migration for ``EnhancedModelTrainer``; retrains can then append new
+    months and load only the date range and columns they need.
+    """
+    
+    table = pa.Table.from_pandas(EnhancedModelTrainer._read_csv(src), preserve_index=False)
+    timestamps = table['timestamp']
+    table = table.append_column('year', pc.year(timestamps)).append_column('month', pc.month(timestamps))
+    
+    ds.write_dataset(
+        table,
+        dst,
+        format='parquet',
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor='hive',
+        existing_data_behavior='overwrite_or_ignore'
+    )
+    
+    logger.info(f"Wrote partitioned training dataset to {dst}")
+
 def main():
     """Main training function."""
     
     # Check if training data exists
-    data_path = "training_data_comprehensive.csv"
+    data_path = "training_data_comprehensive.parquet"
     if not Path(data_path).exists():
         logger.error(f"Training data not found at {data_path}")
         logger.info("Please run collect_training_data.py first")
@@ -489,7 +869,7 @@ def main():
     # Initialize trainer
     trainer = EnhancedModelTrainer(data_path)
     
-    # Load and prepare data
+    # Load and prepare data once; the training workers reuse it
     trainer.load_and_prepare_data()
     
     # Train all models
@@ -2,25 +2,137 @@
 
 import asyncio
 import aiohttp
-import json
+import ijson
+import itertools
+import numpy as np
+import pyarrow as pa
+import orjson
+import os
 import time
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, timezone, timedelta
+import weakref
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 import base64
 import hmac
 import hashlib
 from decimal import Decimal
-import backoff
+from functools import lru_cache, partial, wraps
+from operator import itemgetter
+from aiohttp import hdrs
+from multidict import CIMultiDict
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from cachetools import TTLCache
 from dataclasses import dataclass
 from enum import Enum
 
 from .base import BaseBrokerAdapter
 from trading.schemas import TradeSignal, TradeExecution, Position, Side, OrderType, ExecutionStatus
 from trading.logging_utils import TradingLogger
+from trading.resilience import CircuitBreaker, CircuitBreakerConfig, CircuitState
 
 trade_logger = TradingLogger("trading.execution")
 
 
+class RetryableStatus(Exception):
+    """HTTP status that should be retried (429 or 5xx)."""
+    
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"Server error: {status}" if status >= 500 else f"Rate limited: {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class NetworkError(Exception):
+    """Transport failure talking to the Alpaca API, after retries."""
+
+
+# Errors that say the API is unhealthy and count toward the circuit breaker; client
+# errors such as rejected orders or invalid signals do not
+_BREAKER_ERRORS = (NetworkError, RetryableStatus, aiohttp.ClientError, asyncio.TimeoutError)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert an API value to Decimal, parsing strings directly."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value if isinstance(value, str) else str(value))
+
+
+# Returned by _make_request when a conditional GET comes back 304 Not Modified
+NOT_MODIFIED = object()
+
+_backoff_wait = wait_exponential_jitter(initial=0.2, max=8)
+
+
+def _retry_wait(retry_state) -> float:
+    """Honour Retry-After on rate limited responses, otherwise back off with jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RetryableStatus) and exc.retry_after is not None:
+        return exc.retry_after
+    return _backoff_wait(retry_state)
+
+
+# Connections per host, and the cap on requests in flight against them
+_HOST_CONCURRENCY = 30
+
+# HTTP sessions shared across adapter instances, keyed by (event loop, sandbox,
+# api_key), so reconnects and short-lived adapters reuse pooled keep-alive
+# connections without ever handing a session to a loop that did not create it.
+# Each session carries the semaphore capping requests in flight on its connector
+_shared_sessions: Dict[tuple, Tuple[aiohttp.ClientSession, asyncio.Semaphore]] = {}
+_shared_sessions_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+async def _get_shared_session(
+    sandbox: bool,
+    api_key: str,
+    headers: CIMultiDict
+) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+    """Return the shared HTTP session and host semaphore for an account on the running loop.
+    
+    Both are created on first use, and replaced together if the session was closed.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _shared_sessions_locks.get(loop)
+    if lock is None:
+        lock = _shared_sessions_locks[loop] = asyncio.Lock()
+    
+    key = (loop, sandbox, api_key)
+    async with lock:
+        # Forget sessions left behind by event loops that have since closed
+        for stale in [k for k in _shared_sessions if k[0].is_closed()]:
+            del _shared_sessions[stale]
+        
+        shared = _shared_sessions.get(key)
+        if shared is None or shared[0].closed:
+            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=15)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=_HOST_CONCURRENCY,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                force_close=False,
+                enable_cleanup_closed=True
+            )
+            
+            session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers=headers
+            )
+            shared = _shared_sessions[key] = (session, asyncio.Semaphore(_HOST_CONCURRENCY))
+        return shared
+
+
+async def close_shared_sessions() -> None:
+    """Close the shared HTTP sessions created on the running loop; call on shutdown."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _shared_sessions if k[0] is loop]:
+        session, _ = _shared_sessions.pop(key)
+        if not session.closed:
+            await session.close()
+
+
 class AlpacaOrderStatus(Enum):
     """Alpaca order status enumeration."""
     NEW = "new"
@@ -78,6 +190,10 @@ class AlpacaOrderRequest:
     order_class: Optional[str] = None
     take_profit: Optional[Dict[str, str]] = None
     stop_loss: Optional[Dict[str, str]] = None
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Build the request body, leaving out unset and disabled fields."""
+        return {k: v for k, v in self.__dict__.items() if v is not None and v is not False}
 
 
 @dataclass
@@ -111,9 +227,206 @@ class AlpacaAccountInfo:
     daytrade_count: int
 
 
+# API keys in AlpacaAccountInfo field order, fetched with one itemgetter call
+_ACCOUNT_KEYS = (
+    "id", "account_number", "status", "currency", "buying_power",
+    "regt_buying_power", "daytrading_buying_power", "cash", "portfolio_value",
+    "pattern_day_trader", "trading_blocked", "transfers_blocked", "account_blocked",
+    "created_at", "trade_suspended_by_user", "multiplier", "shorting_enabled",
+    "equity", "last_equity", "long_market_value", "short_market_value",
+    "initial_margin", "maintenance_margin", "last_maintenance_margin", "sma",
+    "daytrade_count",
+)
+_DECIMAL_FIELDS = (
+    "buying_power", "regt_buying_power", "daytrading_buying_power", "cash",
+    "portfolio_value", "equity", "last_equity", "long_market_value",
+    "short_market_value", "initial_margin", "maintenance_margin",
+    "last_maintenance_margin", "sma",
+)
+_ACCOUNT_GETTER = itemgetter(*_ACCOUNT_KEYS)
+_POSITION_GETTER = itemgetter("symbol", "qty", "avg_entry_price", "unrealized_pl", "realized_pl", "market_value")
+_DECIMAL_INDEXES = tuple(i for i, key in enumerate(_ACCOUNT_KEYS) if key in _DECIMAL_FIELDS)
+_CREATED_AT_INDEX = _ACCOUNT_KEYS.index("created_at")
+
+# Order response fields copied into TradeExecution; amounts may be null before a fill
+_EXEC_META_KEYS = ("submitted_at", "created_at", "updated_at", "trail_price", "trail_percent")
+_EXEC_AMOUNT_KEYS = ("filled_avg_price", "filled_qty", "commission")
+
+# client_order_id = prefix + sequence number. The PID and start time keep ids from
+# separate processes or restarts (containers reuse PIDs) apart; the counter keeps
+# orders within one process apart, even in the same millisecond
+def _reset_client_ids() -> None:
+    """Start a fresh client_order_id prefix and sequence for this process."""
+    global _CLIENT_ID_PREFIX, _CLIENT_ID_SEQ
+    _CLIENT_ID_PREFIX = f"ceesar_{os.getpid()}_{int(time.time() * 1000)}_"
+    _CLIENT_ID_SEQ = itertools.count()
+
+
+_reset_client_ids()
+# Workers forked after import would otherwise inherit the parent's prefix and counter
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_ids)
+
+# Enum translation tables, built once; the _map_* methods look up bound .get methods
+_ORDER_TYPE_MAP = {
+    OrderType.MARKET: AlpacaOrderType.MARKET.value,
+    OrderType.LIMIT: AlpacaOrderType.LIMIT.value,
+    OrderType.STOP: AlpacaOrderType.STOP.value,
+    OrderType.STOP_LIMIT: AlpacaOrderType.STOP_LIMIT.value
+}
+_ALPACA_ORDER_TYPE_MAP = {
+    AlpacaOrderType.MARKET.value: OrderType.MARKET,
+    AlpacaOrderType.LIMIT.value: OrderType.LIMIT,
+    AlpacaOrderType.STOP.value: OrderType.STOP,
+    AlpacaOrderType.STOP_LIMIT.value: OrderType.STOP_LIMIT
+}
+_SIDE_MAP = {side: side.value.lower() for side in Side}
+_STATUS_MAP = {
+    AlpacaOrderStatus.NEW.value: ExecutionStatus.PENDING,
+    AlpacaOrderStatus.PARTIALLY_FILLED.value: ExecutionStatus.PARTIALLY_FILLED,
+    AlpacaOrderStatus.FILLED.value: ExecutionStatus.FILLED,
+    AlpacaOrderStatus.CANCELED.value: ExecutionStatus.CANCELLED,
+    AlpacaOrderStatus.EXPIRED.value: ExecutionStatus.EXPIRED,
+    AlpacaOrderStatus.REJECTED.value: ExecutionStatus.REJECTED,
+    AlpacaOrderStatus.PENDING_CANCEL.value: ExecutionStatus.PENDING_CANCEL,
+    AlpacaOrderStatus.PENDING_REPLACE.value: ExecutionStatus.PENDING_REPLACE,
+    AlpacaOrderStatus.ACCEPTED.value: ExecutionStatus.ACCEPTED,
+    AlpacaOrderStatus.PENDING_NEW.value: ExecutionStatus.PENDING,
+    AlpacaOrderStatus.STOPPED.value: ExecutionStatus.STOPPED,
+    AlpacaOrderStatus.SUSPENDED.value: ExecutionStatus.SUSPENDED
+}
+_ORDER_TYPE_GET = _ORDER_TYPE_MAP.get
+_ALPACA_ORDER_TYPE_GET = _ALPACA_ORDER_TYPE_MAP.get
+_STATUS_GET = _STATUS_MAP.get
+
+_ALLOWED_SIDES = frozenset({Side.BUY, Side.SELL})
+_ALLOWED_ORDER_TYPES = frozenset({OrderType.MARKET, OrderType.LIMIT, OrderType.STOP, OrderType.STOP_LIMIT})
+_LIMIT_ORDER_TYPES = frozenset({OrderType.LIMIT, OrderType.STOP_LIMIT})
+_STOP_ORDER_TYPES = frozenset({OrderType.STOP, OrderType.STOP_LIMIT})
+
+
+@lru_cache(maxsize=4096)
+def _validate_tuple(
+    symbol: str,
+    side: Side,
+    order_type: OrderType,
+    quantity: float,
+    price: Optional[float],
+    stop_loss: Optional[float],
+    take_profit: Optional[float]
+) -> bool:
+    """Validate signal fields; memoized, since the checks depend on nothing else."""
+    # Basic validation
+    if not symbol or not symbol.strip():
+        return False
+    
+    if quantity <= 0:
+        return False
+    
+    if side not in _ALLOWED_SIDES:
+        return False
+    
+    if order_type not in _ALLOWED_ORDER_TYPES:
+        return False
+    
+    # Price validation for limit orders
+    if order_type in _LIMIT_ORDER_TYPES and not price:
+        return False
+    
+    if price and price <= 0:
+        return False
+    
+    # Stop loss and take profit validation
+    if stop_loss and stop_loss <= 0:
+        return False
+    
+    if take_profit and take_profit <= 0:
+        return False
+    
+    # For priced buy orders, stop loss must sit below and take profit above the price
+    if side is Side.BUY and price:
+        if stop_loss and stop_loss >= price:
+            return False
+        if take_profit and take_profit <= price:
+            return False
+    
+    return True
+
+
+# Query params for get_orders / get_activities called with their defaults
+_DEFAULT_ORDERS_PARAMS = {"limit": 100, "direction": "desc"}
+_DEFAULT_ACTIVITIES_PARAMS = {"direction": "desc", "page_size": 100}
+
+# Bar requests above this limit are stream-parsed into arrays instead of decoded whole
+_BARS_STREAM_THRESHOLD = 5000
+
+
+async def _read_bar_arrays(symbol: str, limit: int, response: aiohttp.ClientResponse) -> Dict[str, np.ndarray]:
+    """Stream-parse a bars response body straight into preallocated column arrays."""
+    timestamp = np.empty(limit, dtype="datetime64[ns]")
+    open_ = np.empty(limit, dtype=np.float64)
+    high = np.empty(limit, dtype=np.float64)
+    low = np.empty(limit, dtype=np.float64)
+    close = np.empty(limit, dtype=np.float64)
+    volume = np.empty(limit, dtype=np.int64)
+    trade_count = np.empty(limit, dtype=np.int64)
+    vwap = np.empty(limit, dtype=np.float64)
+    
+    n = 0
+    async for bar in ijson.items(response.content, f"bars.{symbol}.item", use_float=True):
+        if n == limit:
+            break
+        timestamp[n] = np.datetime64(bar["t"].rstrip("Z"), "ns")
+        open_[n] = bar["o"]
+        high[n] = bar["h"]
+        low[n] = bar["l"]
+        close[n] = bar["c"]
+        volume[n] = bar["v"]
+        trade_count[n] = bar.get("n", 0)
+        vwap[n] = bar.get("vw", 0)
+        n += 1
+    
+    return {
+        "timestamp": timestamp[:n],
+        "open": open_[:n],
+        "high": high[:n],
+        "low": low[:n],
+        "close": close[:n],
+        "volume": volume[:n],
+        "trade_count": trade_count[:n],
+        "vwap": vwap[:n]
+    }
+
+
+def _require_connected(fn):
+    """Connect before running an adapter API method; refuse calls while the circuit breaker is open."""
+    @wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if not self.is_connected and not await self._ensure_connected():
+            trade_logger.logger.error("Failed to connect to Alpaca API in %s", fn.__name__)
+            raise Exception("Failed to connect to Alpaca API")
+        if not self._breaker.allow_request():
+            raise Exception("Circuit breaker active, request blocked")
+        return await fn(self, *args, **kwargs)
+    return wrapper
+
+
 class AlpacaAdapter(BaseBrokerAdapter):
     """Production-ready Alpaca broker adapter with comprehensive error handling and rate limiting."""
     
+    __slots__ = (
+        "base_url", "data_url", "stream_url", "trade_stream_url",
+        "session", "_default_headers", "websocket",
+        "_cap", "_tokens", "_refill_per_sec", "_cond", "_refill_task", "_host_sem",
+        "_connect_lock", "connection_retry_count", "max_retry_attempts", "retry_delay",
+        "_account_info_cache", "_account_info_cache_time", "_account_info_cache_ttl", "_account_info_etag",
+        "_positions_cache", "_positions_etag",
+        "_market_data_cache", "_assets_cache", "_calendar_cache", "_clock_cache",
+        "_pending_orders", "_order_status_cache", "_order_update_stream", "_order_events",
+        "_price_inflight", "_order_inflight",
+        "_breaker",
+    )
+    
     def __init__(self, api_key: str, secret_key: str, sandbox: bool = True):
         super().__init__(api_key, secret_key, sandbox)
         
@@ -121,80 +434,123 @@ class AlpacaAdapter(BaseBrokerAdapter):
         self.base_url = "https://paper-api.alpaca.markets" if sandbox else "https://api.alpaca.markets"
         self.data_url = "https://data.alpaca.markets"
         self.stream_url = "wss://stream.data.alpaca.markets/v2/iex" if sandbox else "wss://stream.data.alpaca.markets/v2/iex"
+        self.trade_stream_url = "wss://paper-api.alpaca.markets/stream" if sandbox else "wss://api.alpaca.markets/stream"
         
         # Session management
         self.session: Optional[aiohttp.ClientSession] = None
+        self._default_headers = CIMultiDict([
+            (hdrs.ACCEPT, "application/json"),
+            (hdrs.CONTENT_TYPE, "application/json"),
+            ("APCA-API-KEY-ID", api_key),
+            ("APCA-API-SECRET-KEY", secret_key),
+            (hdrs.USER_AGENT, "CeesarWallet/1.0.0")
+        ])
         self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
         
-        # Rate limiting
-        self.rate_limiter = asyncio.Semaphore(200)  # 200 requests per minute
-        self.last_request_time = 0
-        self.min_request_interval = 0.3  # 300ms between requests
+        # Rate limiting: token bucket for 200 requests per minute, refilled on a
+        # wall-clock schedule so concurrent requests are not serialized
+        self._cap = 200
+        self._tokens: float = float(self._cap)
+        self._refill_per_sec = self._cap / 60.0
+        self._cond = asyncio.Condition()
+        self._refill_task: Optional[asyncio.Task] = None
+        
+        # Concurrency cap matching the connector's limit_per_host, kept separate from the
+        # rate limit; shared with every adapter using the same session
+        self._host_sem: Optional[asyncio.Semaphore] = None
         
         # Connection state
         self.is_connected = False
+        self._connect_lock = asyncio.Lock()
         self.connection_retry_count = 0
         self.max_retry_attempts = 5
         self.retry_delay = 1.0
         
         # Account info cache
         self._account_info_cache: Optional[AlpacaAccountInfo] = None
-        self._account_info_cache_time: Optional[datetime] = None
-        self._account_info_cache_ttl = timedelta(minutes=1)
+        self._account_info_cache_time: Optional[float] = None  # time.monotonic()
+        self._account_info_cache_ttl = 60.0
+        self._account_info_etag: Optional[str] = None
+        
+        # Last parsed positions, revalidated with If-None-Match
+        self._positions_cache: Optional[List[Position]] = None
+        self._positions_etag: Optional[str] = None
+        
+        # Market data cache (bounded, entries expire after 5 seconds)
+        self._market_data_cache: TTLCache = TTLCache(maxsize=4096, ttl=5)
         
-        # Market data cache
-        self._market_data_cache: Dict[str, Dict[str, Any]] = {}
-        self._market_data_cache_ttl = timedelta(seconds=5)
+        # Reference data caches: assets for 1 hour, calendar for 24 hours, clock for 5 seconds
+        self._assets_cache: TTLCache = TTLCache(maxsize=16, ttl=3600)
+        self._calendar_cache: TTLCache = TTLCache(maxsize=64, ttl=86400)
+        self._clock_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
         
         # Order tracking
         self._pending_orders: Dict[str, TradeExecution] = {}
-        self._order_status_cache: Dict[str, Dict[str, Any]] = {}
+        self._order_status_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
         
-        # Error tracking
-        self._error_count = 0
-        self._last_error_time: Optional[datetime] = None
-        self._circuit_breaker_threshold = 10
-        self._circuit_breaker_timeout = timedelta(minutes=5)
-        self._circuit_breaker_active = False
+        # trade_updates stream feeding the order status cache, and events for callers waiting on an update
+        self._order_update_stream: Optional[asyncio.Task] = None
+        self._order_events: Dict[str, asyncio.Event] = {}
+        
+        # In-flight fetches, so concurrent cache misses share one request
+        self._price_inflight: Dict[str, asyncio.Future] = {}
+        self._order_inflight: Dict[str, asyncio.Future] = {}
+        
+        # Error tracking: open for 5 minutes after 10 errors within a minute
+        self._breaker = CircuitBreaker(
+            "alpaca",
+            CircuitBreakerConfig(
+                failure_threshold=10,
+                recovery_timeout=300.0,
+                success_threshold=1,
+                failure_window=60.0
+            )
+        )
     
     async def connect(self) -> bool:
-        """Connect to Alpaca API with comprehensive error handling and retry logic."""
-        if self._circuit_breaker_active:
-            if self._last_error_time and datetime.now(timezone.utc) - self._last_error_time < self._circuit_breaker_timeout:
-                trade_logger.logger.warning("Circuit breaker active, connection blocked")
-                return False
-            else:
-                self._circuit_breaker_active = False
-                self._error_count = 0
+        """Connect to Alpaca API with comprehensive error handling and retry logic.
+        
+        Concurrent calls run one handshake; the rest wait for it and return True
+        if it succeeded.
+        """
+        async with self._connect_lock:
+            if self.is_connected:
+                return True
+            return await self._do_connect()
+    
+    async def _do_connect(self) -> bool:
+        """Run the connect handshake with retries."""
+        if not self._breaker.allow_request():
+            trade_logger.logger.warning("Circuit breaker active, connection blocked")
+            return False
+        
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill_tokens())
         
         for attempt in range(self.max_retry_attempts):
             try:
-                # Create session with proper configuration
-                timeout = aiohttp.ClientTimeout(total=30, connect=10)
-                connector = aiohttp.TCPConnector(
-                    limit=100,
-                    limit_per_host=30,
-                    keepalive_timeout=30,
-                    enable_cleanup_closed=True
-                )
-                
-                self.session = aiohttp.ClientSession(
-                    timeout=timeout,
-                    connector=connector,
-                    headers=self._get_default_headers()
+                # Reuse the shared session and its concurrency cap for this account
+                self.session, self._host_sem = await _get_shared_session(
+                    self.sandbox,
+                    self.api_key,
+                    self._default_headers
                 )
                 
                 # Test connection with account info
-                account_info = await self._make_request("GET", "/v2/account")
+                account_info, resp_headers = await self._make_request("GET", "/v2/account", return_headers=True)
                 
                 if account_info:
                     self.is_connected = True
                     self.connection_retry_count = 0
-                    self._error_count = 0
                     
                     # Cache account info
                     self._account_info_cache = self._parse_account_info(account_info)
-                    self._account_info_cache_time = datetime.now(timezone.utc)
+                    self._account_info_cache_time = time.monotonic()
+                    self._account_info_etag = resp_headers.get(hdrs.ETAG)
+                    
+                    # Push order updates into the status cache instead of polling
+                    if self._order_update_stream is None or self._order_update_stream.done():
+                        self._order_update_stream = asyncio.create_task(self._consume_trade_updates())
                     
                     trade_logger.logger.info(
                         "Successfully connected to Alpaca API",
@@ -210,10 +566,11 @@ class AlpacaAdapter(BaseBrokerAdapter):
                     
             except Exception as e:
                 self.connection_retry_count += 1
-                self._error_count += 1
+                self._breaker.record_failure()
                 
                 trade_logger.logger.error(
-                    f"Connection attempt {attempt + 1} failed",
+                    "Connection attempt %s failed",
+                    attempt + 1,
                     extra={"error": str(e), "attempt": attempt + 1}
                 )
                 
@@ -225,31 +582,58 @@ class AlpacaAdapter(BaseBrokerAdapter):
         
         return False
     
+    async def _ensure_connected(self) -> bool:
+        """Connect if needed; concurrent callers share one handshake through connect().
+        
+        The handshake is shielded, so a cancelled caller does not abort it for the
+        others waiting on the lock.
+        """
+        if self.is_connected:
+            return True
+        return await asyncio.shield(self.connect())
+    
     async def disconnect(self) -> bool:
         """Disconnect from Alpaca API and cleanup resources."""
         try:
+            # Stop the order update stream
+            if self._order_update_stream is not None:
+                self._order_update_stream.cancel()
+                self._order_update_stream = None
+            
             # Close WebSocket connection
             if self.websocket and not self.websocket.closed:
                 await self.websocket.close()
                 self.websocket = None
             
-            # Close HTTP session
-            if self.session and not self.session.closed:
-                await self.session.close()
-                self.session = None
+            # Release the shared HTTP session; it stays open for other adapters
+            # until close_shared_sessions() runs at shutdown
+            self.session = None
+            self._host_sem = None
+            
+            # Stop the rate limiter refill
+            if self._refill_task is not None:
+                self._refill_task.cancel()
+                self._refill_task = None
             
             self.is_connected = False
             
             # Clear caches
             self._account_info_cache = None
+            self._account_info_etag = None
+            self._positions_cache = None
+            self._positions_etag = None
             self._market_data_cache.clear()
             self._order_status_cache.clear()
+            self._assets_cache.clear()
+            self._calendar_cache.clear()
+            self._clock_cache.clear()
+            self._order_events.clear()
             
             trade_logger.logger.info("Disconnected from Alpaca API")
             return True
             
         except Exception as e:
-            trade_logger.logger.error(f"Error during disconnect: {e}")
+            trade_logger.logger.error("Error during disconnect: %s", e)
             return False
     
     async def _make_request(
@@ -258,133 +642,185 @@ class AlpacaAdapter(BaseBrokerAdapter):
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        retries: int = 3
-    ) -> Optional[Dict[str, Any]]:
-        """Make HTTP request with rate limiting, retry logic, and error handling."""
+        retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        return_headers: bool = False,
+        reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+    ) -> Any:
+        """Make HTTP request with rate limiting, retry logic, and error handling.
+        
+        Returns NOT_MODIFIED on a 304, and a (data, response headers) tuple when
+        return_headers is set. A reader, if given, consumes a 200 response body in
+        place of orjson.loads.
+        """
         if not self.session:
             raise Exception("Not connected to Alpaca API")
         
+        # Serialize once; retries resend the same bytes
+        url = f"{self.base_url}{endpoint}"
+        body = orjson.dumps(data) if data is not None else None
+        
         # Rate limiting
-        await self.rate_limiter.acquire()
+        await self._acquire_token()
+        
+        # Make request with retry logic
         try:
-            # Ensure minimum interval between requests
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.min_request_interval:
-                await asyncio.sleep(self.min_request_interval - time_since_last)
-            
-            self.last_request_time = time.time()
-            
-            # Make request with retry logic
-            for attempt in range(retries):
-                try:
-                    url = f"{self.base_url}{endpoint}"
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(retries),
+                wait=_retry_wait,
+                retry=retry_if_exception_type((aiohttp.ClientError, RetryableStatus)),
+                reraise=True
+            ):
+                with attempt:
+                    return await self._do_once(method, url, body, params, headers, return_headers, reader)
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network error: {e}") from e
+    
+    async def _do_once(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        return_headers: bool = False,
+        reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+    ) -> Any:
+        """Issue a single HTTP request, raising RetryableStatus for retryable responses."""
+        async with self._host_sem:
+            async with self.session.request(
+                method=method,
+                url=url,
+                data=body,
+                params=params,
+                headers=headers
+            ) as response:
+                
+                # Cached copy is still current; skip reading the body
+                if response.status == 304:
+                    self._breaker.record_success()
+                    return (NOT_MODIFIED, response.headers) if return_headers else NOT_MODIFIED
+                
+                # Handle rate limiting
+                if response.status == 429:
+                    retry_after = int(response.headers.get('Retry-After', 60))
+                    trade_logger.logger.warning("Rate limited, waiting %s seconds", retry_after)
+                    raise RetryableStatus(response.status, retry_after)
+                
+                # Handle server errors
+                if response.status >= 500:
+                    raise RetryableStatus(response.status)
+                
+                # Handle client errors
+                if response.status >= 400:
+                    error_text = await response.text()
+                    error_data = {}
+                    try:
+                        error_data = orjson.loads(error_text)
+                    except:
+                        pass
                     
-                    async with self.session.request(
-                        method=method,
-                        url=url,
-                        json=data,
-                        params=params
-                    ) as response:
-                        
-                        # Handle rate limiting
-                        if response.status == 429:
-                            retry_after = int(response.headers.get('Retry-After', 60))
-                            trade_logger.logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                            await asyncio.sleep(retry_after)
-                            continue
-                        
-                        # Handle server errors
-                        if response.status >= 500:
-                            if attempt < retries - 1:
-                                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                                continue
-                            else:
-                                raise Exception(f"Server error: {response.status}")
-                        
-                        # Handle client errors
-                        if response.status >= 400:
-                            error_text = await response.text()
-                            error_data = {}
-                            try:
-                                error_data = await response.json()
-                            except:
-                                pass
-                            
-                            raise Exception(f"Client error {response.status}: {error_text}")
-                        
-                        # Success
-                        if response.status in [200, 201, 204]:
-                            if response.status == 204:
-                                return {}
-                            
-                            response_data = await response.json()
-                            return response_data
-                        
-                        # Unexpected status
-                        raise Exception(f"Unexpected status code: {response.status}")
-                        
-                except aiohttp.ClientError as e:
-                    if attempt < retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
+                    raise Exception(f"Client error {response.status}: {error_text}")
+                
+                # Success
+                if response.status in [200, 201, 204]:
+                    if response.status == 204:
+                        response_data = {}
+                    elif reader is not None and response.status == 200:
+                        response_data = await reader(response)
                     else:
-                        raise Exception(f"Network error: {e}")
-            
-            return None
-            
-        finally:
-            self.rate_limiter.release()
+                        response_data = orjson.loads(await response.read())
+                    self._breaker.record_success()
+                    return (response_data, response.headers) if return_headers else response_data
+                
+                # Unexpected status
+                raise Exception(f"Unexpected status code: {response.status}")
     
-    def _get_default_headers(self) -> Dict[str, str]:
-        """Get default HTTP headers."""
-        return {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.secret_key,
-            "Content-Type": "application/json",
-            "User-Agent": "CeesarWallet/1.0.0"
-        }
+    async def _acquire_token(self) -> None:
+        """Wait for a rate limit token and consume it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._tokens >= 1)
+            self._tokens -= 1
+    
+    async def _refill_tokens(self) -> None:
+        """Refill the token bucket at the request rate and wake waiting requests."""
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(1.0 / self._refill_per_sec)
+            now = time.monotonic()
+            async with self._cond:
+                self._tokens = min(self._cap, self._tokens + (now - last) * self._refill_per_sec)
+                self._cond.notify(int(self._tokens))
+            last = now
+    
+    async def _consume_trade_updates(self) -> None:
+        """Keep the order status cache current from the trade_updates stream, reconnecting on failure."""
+        failures = 0
+        while True:
+            try:
+                async with self.session.ws_connect(self.trade_stream_url, heartbeat=30) as ws:
+                    self.websocket = ws
+                    await ws.send_bytes(orjson.dumps({
+                        "action": "auth",
+                        "key": self.api_key,
+                        "secret": self.secret_key
+                    }))
+                    await ws.send_bytes(orjson.dumps({
+                        "action": "listen",
+                        "data": {"streams": ["trade_updates"]}
+                    }))
+                    
+                    async for msg in ws:
+                        if msg.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                            break
+                        payload = orjson.loads(msg.data)
+                        stream = payload.get("stream")
+                        if stream == "trade_updates":
+                            self._on_trade_update(payload["data"])
+                        elif stream == "authorization":
+                            if payload["data"].get("status") != "authorized":
+                                trade_logger.logger.error("Trade updates stream authorization failed")
+                                return
+                            failures = 0
+                
+                raise ConnectionError("Trade updates stream closed")
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                trade_logger.logger.warning("Trade updates stream error: %s", e)
+                await asyncio.sleep(self.retry_delay * (2 ** min(failures, 6)))
+            finally:
+                self.websocket = None
+    
+    def _on_trade_update(self, update: Dict[str, Any]) -> None:
+        """Store a streamed order update and wake callers waiting on it."""
+        order = update.get("order")
+        if not order:
+            return
+        
+        order_id = order["id"]
+        self._order_status_cache[order_id] = order
+        
+        event = self._order_events.pop(order_id, None)
+        if event is not None:
+            event.set()
     
     def _parse_account_info(self, data: Dict[str, Any]) -> AlpacaAccountInfo:
         """Parse account information from API response."""
-        return AlpacaAccountInfo(
-            account_id=data["id"],
-            account_number=data["account_number"],
-            status=data["status"],
-            currency=data["currency"],
-            buying_power=Decimal(str(data["buying_power"])),
-            regt_buying_power=Decimal(str(data["regt_buying_power"])),
-            daytrading_buying_power=Decimal(str(data["daytrading_buying_power"])),
-            cash=Decimal(str(data["cash"])),
-            portfolio_value=Decimal(str(data["portfolio_value"])),
-            pattern_day_trader=data["pattern_day_trader"],
-            trading_blocked=data["trading_blocked"],
-            transfers_blocked=data["transfers_blocked"],
-            account_blocked=data["account_blocked"],
-            created_at=datetime.fromisoformat(data["created_at"].replace('Z', '+00:00')),
-            trade_suspended_by_user=data["trade_suspended_by_user"],
-            multiplier=data["multiplier"],
-            shorting_enabled=data["shorting_enabled"],
-            equity=Decimal(str(data["equity"])),
-            last_equity=Decimal(str(data["last_equity"])),
-            long_market_value=Decimal(str(data["long_market_value"])),
-            short_market_value=Decimal(str(data["short_market_value"])),
-            initial_margin=Decimal(str(data["initial_margin"])),
-            maintenance_margin=Decimal(str(data["maintenance_margin"])),
-            last_maintenance_margin=Decimal(str(data["last_maintenance_margin"])),
-            sma=Decimal(str(data["sma"])),
-            daytrade_count=data["daytrade_count"]
-        )
+        values = list(_ACCOUNT_GETTER(data))
+        for i in _DECIMAL_INDEXES:
+            values[i] = _to_decimal(values[i])
+        values[_CREATED_AT_INDEX] = datetime.fromisoformat(values[_CREATED_AT_INDEX].replace('Z', '+00:00'))
+        return AlpacaAccountInfo(*values)
     
     def _handle_connection_failure(self, error: Exception):
-        """Handle connection failure and activate circuit breaker if necessary."""
-        self._last_error_time = datetime.now(timezone.utc)
-        
-        if self._error_count >= self._circuit_breaker_threshold:
-            self._circuit_breaker_active = True
+        """Handle connection failure and report the circuit breaker if it has opened."""
+        if self._breaker.state is CircuitState.OPEN:
             trade_logger.logger.error(
                 "Circuit breaker activated due to repeated connection failures",
-                extra={"error_count": self._error_count, "error": str(error)}
+                extra={"error_count": self._breaker.failure_count, "error": str(error)}
             )
         
         self.is_connected = False
@@ -392,33 +828,51 @@ class AlpacaAdapter(BaseBrokerAdapter):
     async def place_order(self, signal: TradeSignal) -> TradeExecution:
         """Place an order with Alpaca with comprehensive validation and error handling."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            if not await self._ensure_connected():
+                raise Exception("Failed to connect to Alpaca API")
             
             # Validate signal
             if not self.validate_signal(signal):
                 raise ValueError("Invalid trading signal")
             
-            # Check account status
-            account_info = await self.get_account_info()
+            # Check account status, fetching the market price concurrently when needed
+            if signal.side == Side.BUY and not signal.price:
+                preflight = asyncio.gather(
+                    self.get_account_info(),
+                    self.get_current_price(signal.symbol)
+                )
+            else:
+                preflight = asyncio.gather(
+                    self.get_account_info(),
+                    asyncio.sleep(0, signal.price)
+                )
+            
+            # Let the preflight requests go out, then build the order request while they are in flight
+            await asyncio.sleep(0)
+            try:
+                order_request = self._create_order_request(signal)
+            except BaseException:
+                # Don't leave the preflight requests in flight or their errors unretrieved
+                preflight.cancel()
+                await asyncio.gather(preflight, return_exceptions=True)
+                raise
+            
+            account_info, price = await preflight
+            
             if account_info.trading_blocked or account_info.account_blocked:
                 raise Exception("Trading is blocked for this account")
             
             # Validate order size against buying power
             if signal.side == Side.BUY:
-                required_capital = signal.quantity * (signal.price or await self.get_current_price(signal.symbol))
+                required_capital = signal.quantity * price
                 if required_capital > account_info.buying_power:
                     raise Exception(f"Insufficient buying power. Required: {required_capital}, Available: {account_info.buying_power}")
             
-            # Create order request
-            order_request = self._create_order_request(signal)
-            
             # Place order
             order_response = await self._make_request(
                 "POST",
                 "/v2/orders",
-                data=order_request.__dict__
+                data=order_request.to_payload()
             )
             
             if not order_response:
@@ -465,7 +919,7 @@ class AlpacaAdapter(BaseBrokerAdapter):
             side=self._map_side(signal.side),
             type=self._map_order_type(signal.order_type),
             time_in_force=self._map_time_in_force(signal),
-            client_order_id=f"ceesar_{int(time.time() * 1000)}"
+            client_order_id=f"{_CLIENT_ID_PREFIX}{next(_CLIENT_ID_SEQ)}"
         )
         
         # Set quantity or notional
@@ -479,7 +933,7 @@ class AlpacaAdapter(BaseBrokerAdapter):
             order_request.limit_price = str(signal.price)
         
         # Set stop price for stop orders
-        if signal.order_type in [OrderType.STOP, OrderType.STOP_LIMIT] and signal.stop_loss:
+        if signal.order_type in _STOP_ORDER_TYPES and signal.stop_loss:
             order_request.stop_price = str(signal.stop_loss)
         
         # Set order class for bracket orders
@@ -535,43 +989,46 @@ class AlpacaAdapter(BaseBrokerAdapter):
     
     def _map_alpaca_order_type_to_enum(self, alpaca_type: str) -> OrderType:
         """Map Alpaca order type string to OrderType enum."""
-        mapping = {
-            "market": OrderType.MARKET,
-            "limit": OrderType.LIMIT,
-            "stop": OrderType.STOP,
-            "stop_limit": OrderType.STOP_LIMIT
-        }
-        return mapping.get(alpaca_type, OrderType.MARKET)
+        return _ALPACA_ORDER_TYPE_GET(alpaca_type, OrderType.MARKET)
     
     def _create_execution_from_response(self, signal: TradeSignal, response: Dict[str, Any]) -> TradeExecution:
         """Create TradeExecution from Alpaca order response."""
-        return TradeExecution(
+        r = response
+        oid = r["id"]
+        status = r["status"]
+        fap, fqty, comm = map(r.get, _EXEC_AMOUNT_KEYS)
+        
+        metadata = {k: r.get(k) for k in _EXEC_META_KEYS}
+        metadata["alpaca_status"] = status
+        metadata["legs"] = r.get("legs") or []
+        
+        # Fields are already typed here, so skip pydantic validation
+        return TradeExecution.model_construct(
             signal=signal,
-            execution_id=response["id"],
-            executed_price=float(response.get("filled_avg_price", 0)),
-            executed_quantity=float(response.get("filled_qty", 0)),
+            execution_id=oid,
+            executed_price=float(fap) if fap else 0.0,
+            executed_quantity=float(fqty) if fqty else 0.0,
             execution_time=datetime.now(timezone.utc),
-            fees=float(response.get("commission", 0)),
-            status=self._map_execution_status(response["status"]),
-            broker_order_id=response["id"],
-            metadata={
-                "alpaca_status": response["status"],
-                "submitted_at": response.get("submitted_at"),
-                "created_at": response.get("created_at"),
-                "updated_at": response.get("updated_at"),
-                "legs": response.get("legs", []),
-                "trail_price": response.get("trail_price"),
-                "trail_percent": response.get("trail_percent")
-            }
+            fees=float(comm) if comm else 0.0,
+            status=self._map_execution_status(status),
+            broker_order_id=oid,
+            metadata=metadata
         )
     
     async def get_current_price(self, symbol: str) -> float:
         """Get current price for symbol with caching."""
         # Check cache first
-        if symbol in self._market_data_cache:
-            cache_time = self._market_data_cache[symbol].get("timestamp")
-            if cache_time and datetime.now(timezone.utc) - cache_time < self._market_data_cache_ttl:
-                return self._market_data_cache[symbol]["last"]
+        price = self._market_data_cache.get(symbol)
+        if price is not None:
+            return price
+        
+        # Join an in-flight fetch for the same symbol
+        fut = self._price_inflight.get(symbol)
+        if fut is not None:
+            return await asyncio.shield(fut)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._price_inflight[symbol] = fut
         
         # Fetch from API
         try:
@@ -579,23 +1036,26 @@ class AlpacaAdapter(BaseBrokerAdapter):
             price = market_data["last"]
             
             # Update cache
-            self._market_data_cache[symbol] = {
-                "last": price,
-                "timestamp": datetime.now(timezone.utc)
-            }
+            self._market_data_cache[symbol] = price
             
+            fut.set_result(price)
             return price
             
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get current price for {symbol}: {e}")
+            trade_logger.logger.error("Failed to get current price for %s: %s", symbol, e)
+            fut.set_exception(e)
+            fut.exception()  # Re-raised below, so mark it retrieved
             raise
+        finally:
+            del self._price_inflight[symbol]
+            if not fut.done():
+                fut.cancel()
     
     async def update_order(self, order_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing order (Alpaca doesn't support direct updates, so we cancel and replace)."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            if not await self._ensure_connected():
+                raise Exception("Failed to connect to Alpaca API")
             
             # Get current order details
             current_order = await self.get_order_status(order_id)
@@ -610,7 +1070,8 @@ class AlpacaAdapter(BaseBrokerAdapter):
             new_execution = await self.place_order(new_signal)
             
             trade_logger.logger.info(
-                f"Order {order_id} updated by cancellation and replacement",
+                "Order %s updated by cancellation and replacement",
+                order_id,
                 extra={
                     "original_order_id": order_id,
                     "new_order_id": new_execution.execution_id,
@@ -626,16 +1087,19 @@ class AlpacaAdapter(BaseBrokerAdapter):
             }
             
         except Exception as e:
-            trade_logger.logger.error(f"Failed to update order {order_id}: {e}")
+            trade_logger.logger.error("Failed to update order %s: %s", order_id, e)
             self.handle_broker_error(e)
             raise
     
     async def cancel_order(self, order_id: str) -> bool:
-        """Cancel an order with comprehensive error handling."""
+        """Cancel an order with comprehensive error handling.
+        
+        Cancels are not gated by the circuit breaker, so positions can still be
+        flattened while it is open.
+        """
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            if not await self._ensure_connected():
+                raise Exception("Failed to connect to Alpaca API")
             
             # Cancel order
             response = await self._make_request("DELETE", f"/v2/orders/{order_id}")
@@ -646,151 +1110,194 @@ class AlpacaAdapter(BaseBrokerAdapter):
                     del self._pending_orders[order_id]
                 
                 # Remove from status cache
-                if order_id in self._order_status_cache:
-                    del self._order_status_cache[order_id]
+                self._order_status_cache.pop(order_id, None)
                 
-                trade_logger.logger.info(f"Order {order_id} cancelled successfully")
+                trade_logger.logger.info("Order %s cancelled successfully", order_id)
                 return True
             else:
                 raise Exception("Failed to cancel order")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to cancel order {order_id}: {e}")
+            trade_logger.logger.error("Failed to cancel order %s: %s", order_id, e)
             self.handle_broker_error(e)
             return False
     
-    async def get_order_status(self, order_id: str) -> Dict[str, Any]:
-        """Get order status with caching."""
-        try:
-            # Check cache first
-            if order_id in self._order_status_cache:
-                cache_time = self._order_status_cache[order_id].get("cache_time")
-                if cache_time and datetime.now(timezone.utc) - cache_time < timedelta(seconds=30):
-                    return self._order_status_cache[order_id]["data"]
+    async def get_order_status(self, order_id: str, wait: bool = False, timeout: float = 30.0) -> Dict[str, Any]:
+        """Get order status from the streamed cache, falling back to the REST API.
+        
+        With wait=True and nothing cached yet, waits up to timeout seconds for the
+        first trade update on the order before falling back.
+        """
+        # Check cache first
+        order_data = self._order_status_cache.get(order_id)
+        if order_data is not None:
+            return order_data
+        
+        if wait and self._order_update_stream is not None and not self._order_update_stream.done():
+            event = self._order_events.get(order_id)
+            if event is None:
+                event = self._order_events[order_id] = asyncio.Event()
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                if self._order_events.get(order_id) is event:
+                    del self._order_events[order_id]
             
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            order_data = self._order_status_cache.get(order_id)
+            if order_data is not None:
+                return order_data
+        
+        # Join an in-flight fetch for the same order
+        fut = self._order_inflight.get(order_id)
+        if fut is not None:
+            return await asyncio.shield(fut)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._order_inflight[order_id] = fut
+        
+        try:
+            if not await self._ensure_connected():
+                raise Exception("Failed to connect to Alpaca API")
             
             # Fetch from API
             order_data = await self._make_request("GET", f"/v2/orders/{order_id}")
             
             if order_data:
                 # Update cache
-                self._order_status_cache[order_id] = {
-                    "data": order_data,
-                    "cache_time": datetime.now(timezone.utc)
-                }
+                self._order_status_cache[order_id] = order_data
                 
+                fut.set_result(order_data)
                 return order_data
             else:
                 raise Exception("Order not found")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get order status for {order_id}: {e}")
+            trade_logger.logger.error("Failed to get order status for %s: %s", order_id, e)
             self.handle_broker_error(e)
+            fut.set_exception(e)
+            fut.exception()  # Re-raised below, so mark it retrieved
             raise
+        finally:
+            del self._order_inflight[order_id]
+            if not fut.done():
+                fut.cancel()
     
+    @_require_connected
     async def get_positions(self) -> List[Position]:
         """Get current positions with comprehensive error handling."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            cached = self._positions_cache
+            etag = self._positions_etag if cached is not None else None
+            positions_data, resp_headers = await self._make_request(
+                "GET",
+                "/v2/positions",
+                headers={hdrs.IF_NONE_MATCH: etag} if etag else None,
+                return_headers=True
+            )
+            
+            if positions_data is NOT_MODIFIED:
+                return list(cached)
             
-            positions_data = await self._make_request("GET", "/v2/positions")
+            self._positions_etag = resp_headers.get(hdrs.ETAG)
             
             if not positions_data:
+                self._positions_cache = []
                 return []
             
-            positions = []
-            for pos_data in positions_data:
-                try:
-                    position = Position(
-                        symbol=pos_data["symbol"],
-                        quantity=float(pos_data["qty"]),
-                        average_price=float(pos_data["avg_entry_price"]),
-                        unrealized_pnl=float(pos_data["unrealized_pl"]),
-                        realized_pnl=float(pos_data["realized_pl"]),
-                        market_value=float(pos_data["market_value"]),
-                        timestamp=datetime.now(timezone.utc),
-                        metadata={
-                            "cost_basis": pos_data.get("cost_basis"),
-                            "unrealized_plpc": pos_data.get("unrealized_plpc"),
-                            "unrealized_intraday_pl": pos_data.get("unrealized_intraday_pl"),
-                            "unrealized_intraday_plpc": pos_data.get("unrealized_intraday_plpc"),
-                            "current_price": pos_data.get("current_price"),
-                            "lastday_price": pos_data.get("lastday_price"),
-                            "change_today": pos_data.get("change_today")
-                        }
-                    )
-                    positions.append(position)
-                    
-                except (KeyError, ValueError, TypeError) as e:
-                    trade_logger.logger.warning(f"Failed to parse position data: {e}")
-                    continue
+            timestamp = datetime.now(timezone.utc)
+            try:
+                positions = [self._parse_position(pos_data, timestamp) for pos_data in positions_data]
+            except (KeyError, ValueError, TypeError):
+                # Fall back to per-row parsing so one bad row does not drop the rest
+                positions = []
+                for pos_data in positions_data:
+                    try:
+                        positions.append(self._parse_position(pos_data, timestamp))
+                    except (KeyError, ValueError, TypeError) as e:
+                        trade_logger.logger.warning("Failed to parse position data: %s", e)
+                        continue
             
-            return positions
+            self._positions_cache = positions
+            return list(positions)
             
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get positions: {e}")
+            trade_logger.logger.error("Failed to get positions: %s", e)
             self.handle_broker_error(e)
             raise
     
+    def _parse_position(self, pos_data: Dict[str, Any], timestamp: datetime) -> Position:
+        """Parse a position from API response."""
+        symbol, qty, avg_entry_price, unrealized_pl, realized_pl, market_value = _POSITION_GETTER(pos_data)
+        return Position(
+            symbol=symbol,
+            quantity=float(qty),
+            average_price=float(avg_entry_price),
+            unrealized_pnl=float(unrealized_pl),
+            realized_pnl=float(realized_pl),
+            market_value=float(market_value),
+            timestamp=timestamp
+        )
+    
+    @_require_connected
     async def get_account_info(self) -> AlpacaAccountInfo:
         """Get account information with caching."""
         try:
             # Check cache first
             if (self._account_info_cache and 
                 self._account_info_cache_time and 
-                datetime.now(timezone.utc) - self._account_info_cache_time < self._account_info_cache_ttl):
+                time.monotonic() - self._account_info_cache_time < self._account_info_cache_ttl):
                 return self._account_info_cache
             
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            # Fetch from API, revalidating the cached copy if we have one
+            etag = self._account_info_etag if self._account_info_cache else None
+            account_data, resp_headers = await self._make_request(
+                "GET",
+                "/v2/account",
+                headers={hdrs.IF_NONE_MATCH: etag} if etag else None,
+                return_headers=True
+            )
             
-            # Fetch from API
-            account_data = await self._make_request("GET", "/v2/account")
+            if account_data is NOT_MODIFIED:
+                self._account_info_cache_time = time.monotonic()
+                return self._account_info_cache
             
             if account_data:
                 # Parse and cache account info
                 self._account_info_cache = self._parse_account_info(account_data)
-                self._account_info_cache_time = datetime.now(timezone.utc)
+                self._account_info_cache_time = time.monotonic()
+                self._account_info_etag = resp_headers.get(hdrs.ETAG)
                 
                 return self._account_info_cache
             else:
                 raise Exception("Failed to retrieve account information")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get account info: {e}")
+            trade_logger.logger.error("Failed to get account info: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_market_data(self, symbol: str) -> Dict[str, Any]:
         """Get market data for symbol with comprehensive error handling."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
-            # Get latest quote
-            quote_data = await self._make_request("GET", f"/v2/stocks/{symbol}/quotes/latest")
+            # Get latest quote and trade concurrently
+            quote_data, trade_data = await asyncio.gather(
+                self._make_request("GET", f"/v2/stocks/{symbol}/quotes/latest"),
+                self._make_request("GET", f"/v2/stocks/{symbol}/trades/latest")
+            )
             
             if not quote_data or "quote" not in quote_data:
                 raise Exception(f"No quote data available for {symbol}")
             
             quote = quote_data["quote"]
             
-            # Get latest trade
-            trade_data = await self._make_request("GET", f"/v2/stocks/{symbol}/trades/latest")
-            
+            # orjson already decodes JSON numbers to float/int; only map zero to None
             market_data = {
                 "symbol": symbol,
-                "bid": float(quote["bp"]) if quote["bp"] else None,
-                "ask": float(quote["ap"]) if quote["ap"] else None,
-                "bid_size": int(quote["bs"]) if quote["bs"] else None,
-                "ask_size": int(quote["as"]) if quote["as"] else None,
+                "bid": quote["bp"] or None,
+                "ask": quote["ap"] or None,
+                "bid_size": quote["bs"] or None,
+                "ask_size": quote["as"] or None,
                 "timestamp": quote["t"],
                 "exchange": quote.get("x", "IEX")
             }
@@ -798,31 +1305,43 @@ class AlpacaAdapter(BaseBrokerAdapter):
             if trade_data and "trade" in trade_data:
                 trade = trade_data["trade"]
                 market_data.update({
-                    "last": float(trade["p"]) if trade["p"] else None,
-                    "volume": int(trade["s"]) if trade["s"] else None,
+                    "last": trade["p"] or None,
+                    "volume": trade["s"] or None,
                     "trade_timestamp": trade["t"]
                 })
             
             return market_data
             
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get market data for {symbol}: {e}")
+            trade_logger.logger.error("Failed to get market data for %s: %s", symbol, e)
             self.handle_broker_error(e)
             raise
     
+    async def get_market_data_many(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get market data for several symbols concurrently, keyed by symbol.
+        
+        Symbols whose fetch fails are left out; get_market_data logs the error.
+        """
+        sem = asyncio.Semaphore(20)
+        
+        async def fetch(symbol: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_market_data(symbol)
+        
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        return {
+            symbol: result
+            for symbol, result in zip(symbols, results)
+            if not isinstance(result, BaseException)
+        }
+    
     def _map_order_type(self, order_type: OrderType) -> str:
         """Map order type to Alpaca format."""
-        mapping = {
-            OrderType.MARKET: AlpacaOrderType.MARKET.value,
-            OrderType.LIMIT: AlpacaOrderType.LIMIT.value,
-            OrderType.STOP: AlpacaOrderType.STOP.value,
-            OrderType.STOP_LIMIT: AlpacaOrderType.STOP_LIMIT.value
-        }
-        return mapping.get(order_type, AlpacaOrderType.MARKET.value)
+        return _ORDER_TYPE_GET(order_type, AlpacaOrderType.MARKET.value)
     
     def _map_side(self, side: Side) -> str:
         """Map side to Alpaca format."""
-        return side.value.lower()
+        return _SIDE_MAP[side]
     
     def _map_time_in_force(self, signal: TradeSignal) -> str:
         """Map time in force based on signal properties."""
@@ -831,22 +1350,37 @@ class AlpacaAdapter(BaseBrokerAdapter):
     
     def _map_execution_status(self, alpaca_status: str) -> ExecutionStatus:
         """Map Alpaca order status to ExecutionStatus."""
-        status_mapping = {
-            AlpacaOrderStatus.NEW.value: ExecutionStatus.PENDING,
-            AlpacaOrderStatus.PARTIALLY_FILLED.value: ExecutionStatus.PARTIALLY_FILLED,
-            AlpacaOrderStatus.FILLED.value: ExecutionStatus.FILLED,
-            AlpacaOrderStatus.CANCELED.value: ExecutionStatus.CANCELLED,
-            AlpacaOrderStatus.EXPIRED.value: ExecutionStatus.EXPIRED,
-            AlpacaOrderStatus.REJECTED.value: ExecutionStatus.REJECTED,
-            AlpacaOrderStatus.PENDING_CANCEL.value: ExecutionStatus.PENDING_CANCEL,
-            AlpacaOrderStatus.PENDING_REPLACE.value: ExecutionStatus.PENDING_REPLACE,
-            AlpacaOrderStatus.ACCEPTED.value: ExecutionStatus.ACCEPTED,
-            AlpacaOrderStatus.PENDING_NEW.value: ExecutionStatus.PENDING,
-            AlpacaOrderStatus.STOPPED.value: ExecutionStatus.STOPPED,
-            AlpacaOrderStatus.SUSPENDED.value: ExecutionStatus.SUSPENDED
+        return _STATUS_GET(alpaca_status, ExecutionStatus.UNKNOWN)
+    
+    async def _fetch_bars(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        timeframe: str,
+        limit: int,
+        reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None
+    ) -> Any:
+        """Fetch raw bars for symbol, or an empty list if there are none; with a reader, return what it parsed."""
+        params = {
+            "symbols": symbol,
+            "start": start_date,
+            "end": end_date,
+            "timeframe": timeframe,
+            "limit": limit,
+            "feed": "iex",
+            "sort": "asc"
         }
-        return status_mapping.get(alpaca_status, ExecutionStatus.UNKNOWN)
+        
+        bars_data = await self._make_request("GET", f"/v2/stocks/{symbol}/bars", params=params, reader=reader)
+        
+        if reader is not None:
+            return bars_data
+        if bars_data and "bars" in bars_data and symbol in bars_data["bars"]:
+            return bars_data["bars"][symbol]
+        return []
     
+    @_require_connected
     async def get_historical_data(
         self,
         symbol: str,
@@ -855,58 +1389,97 @@ class AlpacaAdapter(BaseBrokerAdapter):
         timeframe: str = "1Day",
         limit: int = 1000
     ) -> List[Dict[str, Any]]:
-        """Get historical data from Alpaca with comprehensive error handling."""
+        """Get historical data from Alpaca with comprehensive error handling.
+        
+        Returns one dict per bar; get_historical_data_arrays and get_historical_bars
+        return columns instead and suit large windows better.
+        """
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            bars = await self._fetch_bars(symbol, start_date, end_date, timeframe, limit)
+            
+            # Convert to standardized format; bar values are already numbers from orjson
+            return [
+                {
+                    "timestamp": bar["t"],
+                    "open": bar["o"],
+                    "high": bar["h"],
+                    "low": bar["l"],
+                    "close": bar["c"],
+                    "volume": bar["v"],
+                    "trade_count": bar.get("n", 0),
+                    "vwap": bar.get("vw", 0.0)
+                }
+                for bar in bars
+            ]
             
-            params = {
-                "symbols": symbol,
-                "start": start_date,
-                "end": end_date,
-                "timeframe": timeframe,
-                "limit": limit,
-                "asof": None,
-                "feed": "iex",
-                "sort": "asc"
-            }
+        except Exception as e:
+            trade_logger.logger.error("Failed to get historical data for %s: %s", symbol, e)
+            self.handle_broker_error(e)
+            raise
+    
+    @_require_connected
+    async def get_historical_data_arrays(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        timeframe: str = "1Day",
+        limit: int = 1000
+    ) -> Dict[str, np.ndarray]:
+        """Get historical data as one NumPy array per column instead of a dict per bar.
+        
+        Large requests are stream-parsed into the arrays without decoding the whole body.
+        """
+        try:
+            if limit > _BARS_STREAM_THRESHOLD:
+                return await self._fetch_bars(
+                    symbol, start_date, end_date, timeframe, limit,
+                    reader=partial(_read_bar_arrays, symbol, limit)
+                )
             
-            bars_data = await self._make_request("GET", f"/v2/stocks/{symbol}/bars", params=params)
+            bars = await self._fetch_bars(symbol, start_date, end_date, timeframe, limit)
+            n = len(bars)
+            
+            return {
+                # Bar times are UTC ("...Z"); datetime64 takes them without the suffix
+                "timestamp": np.array([bar["t"].rstrip("Z") for bar in bars], dtype="datetime64[ns]"),
+                "open": np.fromiter((bar["o"] for bar in bars), dtype=np.float64, count=n),
+                "high": np.fromiter((bar["h"] for bar in bars), dtype=np.float64, count=n),
+                "low": np.fromiter((bar["l"] for bar in bars), dtype=np.float64, count=n),
+                "close": np.fromiter((bar["c"] for bar in bars), dtype=np.float64, count=n),
+                "volume": np.fromiter((bar["v"] for bar in bars), dtype=np.int64, count=n),
+                "trade_count": np.fromiter((bar.get("n", 0) for bar in bars), dtype=np.int64, count=n),
+                "vwap": np.fromiter((bar.get("vw", 0) for bar in bars), dtype=np.float64, count=n)
+            }
             
-            if bars_data and "bars" in bars_data and symbol in bars_data["bars"]:
-                bars = bars_data["bars"][symbol]
-                
-                # Convert to standardized format
-                historical_data = []
-                for bar in bars:
-                    historical_data.append({
-                        "timestamp": bar["t"],
-                        "open": float(bar["o"]),
-                        "high": float(bar["h"]),
-                        "low": float(bar["l"]),
-                        "close": float(bar["c"]),
-                        "volume": int(bar["v"]),
-                        "trade_count": bar.get("n", 0),
-                        "vwap": float(bar.get("vw", 0))
-                    })
-                
-                return historical_data
-            else:
-                return []
-                
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get historical data for {symbol}: {e}")
+            trade_logger.logger.error("Failed to get historical data for %s: %s", symbol, e)
             self.handle_broker_error(e)
             raise
     
+    async def get_historical_bars(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        timeframe: str = "1Day",
+        limit: int = 1000
+    ) -> pa.RecordBatch:
+        """Get historical data as an Arrow record batch.
+        
+        Wraps the get_historical_data_arrays columns without copying, ready for
+        pandas, Polars or DuckDB.
+        """
+        arrays = await self.get_historical_data_arrays(symbol, start_date, end_date, timeframe, limit)
+        return pa.RecordBatch.from_arrays(
+            [pa.array(column) for column in arrays.values()],
+            names=list(arrays)
+        )
+    
+    @_require_connected
     async def get_news(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get news for symbol with comprehensive error handling."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
             params = {
                 "symbols": symbol,
                 "limit": limit,
@@ -922,16 +1495,18 @@ class AlpacaAdapter(BaseBrokerAdapter):
                 return []
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get news for {symbol}: {e}")
+            trade_logger.logger.error("Failed to get news for %s: %s", symbol, e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_calendar(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-        """Get market calendar information."""
+        """Get market calendar information with caching."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            key = (start_date, end_date)
+            calendar = self._calendar_cache.get(key)
+            if calendar is not None:
+                return calendar
             
             params = {
                 "start": start_date,
@@ -940,46 +1515,50 @@ class AlpacaAdapter(BaseBrokerAdapter):
             
             calendar_data = await self._make_request("GET", "/v1/calendar", params=params)
             
-            if calendar_data:
-                return calendar_data
-            else:
-                return []
+            calendar = calendar_data or []
+            self._calendar_cache[key] = calendar
+            return calendar
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get calendar: {e}")
+            trade_logger.logger.error("Failed to get calendar: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_clock(self) -> Dict[str, Any]:
-        """Get market clock information."""
+        """Get market clock information with caching."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            clock = self._clock_cache.get("clock")
+            if clock is not None:
+                return clock
             
             clock_data = await self._make_request("GET", "/v2/clock")
             
             if clock_data:
-                return {
+                clock = {
                     "timestamp": clock_data["timestamp"],
                     "is_open": clock_data["is_open"],
                     "next_open": clock_data["next_open"],
                     "next_close": clock_data["next_close"]
                 }
+                self._clock_cache["clock"] = clock
+                return clock
             else:
                 raise Exception("Failed to get market clock")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get market clock: {e}")
+            trade_logger.logger.error("Failed to get market clock: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_assets(self, status: str = "active", asset_class: str = "us_equity") -> List[Dict[str, Any]]:
-        """Get available assets."""
+        """Get available assets with caching."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
+            key = (status, asset_class)
+            assets = self._assets_cache.get(key)
+            if assets is not None:
+                return assets
             
             params = {
                 "status": status,
@@ -988,23 +1567,19 @@ class AlpacaAdapter(BaseBrokerAdapter):
             
             assets_data = await self._make_request("GET", "/v2/assets", params=params)
             
-            if assets_data:
-                return assets_data
-            else:
-                return []
+            assets = assets_data or []
+            self._assets_cache[key] = assets
+            return assets
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get assets: {e}")
+            trade_logger.logger.error("Failed to get assets: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_asset(self, symbol: str) -> Dict[str, Any]:
         """Get specific asset information."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
             asset_data = await self._make_request("GET", f"/v2/assets/{symbol}")
             
             if asset_data:
@@ -1013,10 +1588,11 @@ class AlpacaAdapter(BaseBrokerAdapter):
                 raise Exception(f"Asset {symbol} not found")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get asset {symbol}: {e}")
+            trade_logger.logger.error("Failed to get asset %s: %s", symbol, e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_orders(
         self,
         status: Optional[str] = None,
@@ -1027,20 +1603,17 @@ class AlpacaAdapter(BaseBrokerAdapter):
     ) -> List[Dict[str, Any]]:
         """Get orders with filtering."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
-            params = {
-                "status": status,
-                "limit": limit,
-                "after": after,
-                "until": until,
-                "direction": direction
-            }
-            
-            # Remove None values
-            params = {k: v for k, v in params.items() if v is not None}
+            # Build params from the set arguments only; the defaults-only poll reuses a prebuilt dict
+            if status is None and after is None and until is None and limit == 100 and direction == "desc":
+                params = _DEFAULT_ORDERS_PARAMS
+            else:
+                params = {k: v for k, v in (
+                    ("status", status),
+                    ("limit", limit),
+                    ("after", after),
+                    ("until", until),
+                    ("direction", direction)
+                ) if v is not None}
             
             orders_data = await self._make_request("GET", "/v2/orders", params=params)
             
@@ -1050,10 +1623,11 @@ class AlpacaAdapter(BaseBrokerAdapter):
                 return []
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get orders: {e}")
+            trade_logger.logger.error("Failed to get orders: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_portfolio_history(
         self,
         period: str = "1M",
@@ -1062,10 +1636,6 @@ class AlpacaAdapter(BaseBrokerAdapter):
     ) -> Dict[str, Any]:
         """Get portfolio history."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
             params = {
                 "period": period,
                 "timeframe": timeframe,
@@ -1080,10 +1650,11 @@ class AlpacaAdapter(BaseBrokerAdapter):
                 raise Exception("Failed to get portfolio history")
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get portfolio history: {e}")
+            trade_logger.logger.error("Failed to get portfolio history: %s", e)
             self.handle_broker_error(e)
             raise
     
+    @_require_connected
     async def get_activities(
         self,
         activity_type: Optional[str] = None,
@@ -1096,22 +1667,20 @@ class AlpacaAdapter(BaseBrokerAdapter):
     ) -> List[Dict[str, Any]]:
         """Get account activities."""
         try:
-            if not self.is_connected:
-                if not await self.connect():
-                    raise Exception("Failed to connect to Alpaca API")
-            
-            params = {
-                "activity_type": activity_type,
-                "activity_types": ",".join(activity_types) if activity_types else None,
-                "date": date,
-                "until": until,
-                "after": after,
-                "direction": direction,
-                "page_size": page_size
-            }
-            
-            # Remove None values
-            params = {k: v for k, v in params.items() if v is not None}
+            # Build params from the set arguments only; the defaults-only poll reuses a prebuilt dict
+            if (activity_type is None and not activity_types and date is None and until is None
+                    and after is None and direction == "desc" and page_size == 100):
+                params = _DEFAULT_ACTIVITIES_PARAMS
+            else:
+                params = {k: v for k, v in (
+                    ("activity_type", activity_type),
+                    ("activity_types", ",".join(activity_types) if activity_types else None),
+                    ("date", date),
+                    ("until", until),
+                    ("after", after),
+                    ("direction", direction),
+                    ("page_size", page_size)
+                ) if v is not None}
             
             activities_data = await self._make_request("GET", "/v2/account/activities", params=params)
             
@@ -1121,78 +1690,53 @@ class AlpacaAdapter(BaseBrokerAdapter):
                 return []
                 
         except Exception as e:
-            trade_logger.logger.error(f"Failed to get activities: {e}")
+            trade_logger.logger.error("Failed to get activities: %s", e)
             self.handle_broker_error(e)
             raise
     
     def validate_signal(self, signal: TradeSignal) -> bool:
         """Validate trading signal before execution."""
         try:
-            # Basic validation
-            if not signal.symbol or not signal.symbol.strip():
-                return False
-            
-            if signal.quantity <= 0:
-                return False
-            
-            if signal.side not in [Side.BUY, Side.SELL]:
-                return False
-            
-            if signal.order_type not in [OrderType.MARKET, OrderType.LIMIT, OrderType.STOP, OrderType.STOP_LIMIT]:
-                return False
-            
-            # Price validation for limit orders
-            if signal.order_type in [OrderType.LIMIT, OrderType.STOP_LIMIT] and not signal.price:
-                return False
-            
-            if signal.price and signal.price <= 0:
-                return False
-            
-            # Stop loss and take profit validation
-            if signal.stop_loss and signal.stop_loss <= 0:
-                return False
-            
-            if signal.take_profit and signal.take_profit <= 0:
-                return False
-            
-            # Stop loss should be below current price for buy orders
-            if signal.side == Side.BUY and signal.stop_loss and signal.price and signal.stop_loss >= signal.price:
-                return False
-            
-            # Take profit should be above current price for buy orders
-            if signal.side == Side.BUY and signal.take_profit and signal.price and signal.take_profit <= signal.price:
-                return False
-            
-            return True
+            return _validate_tuple(
+                signal.symbol,
+                signal.side,
+                signal.order_type,
+                signal.quantity,
+                signal.price,
+                signal.stop_loss,
+                signal.take_profit
+            )
             
         except Exception as e:
-            trade_logger.logger.error(f"Signal validation error: {e}")
+            trade_logger.logger.error("Signal validation error: %s", e)
             return False
     
     def handle_broker_error(self, error: Exception):
-        """Handle broker-specific errors with comprehensive logging."""
-        self._error_count += 1
-        self._last_error_time = datetime.now(timezone.utc)
+        """Handle broker-specific errors with comprehensive logging.
+        
+        Only transport errors, timeouts, 5xx and 429 responses count toward the
+        circuit breaker.
+        """
+        opened = isinstance(error, _BREAKER_ERRORS) and self._breaker.record_failure()
         
         # Log error with context
         trade_logger.logger.error(
-            f"Broker error occurred",
+            "Broker error occurred",
             extra={
                 "error_type": type(error).__name__,
                 "error_message": str(error),
-                "error_count": self._error_count,
+                "error_count": self._breaker.failure_count,
                 "broker": "Alpaca",
                 "sandbox": self.sandbox
             }
         )
         
-        # Activate circuit breaker if threshold exceeded
-        if self._error_count >= self._circuit_breaker_threshold:
-            self._circuit_breaker_active = True
+        # Report the circuit breaker once, when this error opened it
+        if opened:
             trade_logger.logger.critical(
                 "Circuit breaker activated due to repeated errors",
                 extra={
-                    "error_count": self._error_count,
+                    "error_count": self._breaker.failure_count,
                     "broker": "Alpaca"
                 }
             )
@@ -11,12 +11,23 @@ trade_logger = TradingLogger("trading.execution")
 class BaseBrokerAdapter(ABC):
     """Base class for broker adapters."""
     
+    __slots__ = ("api_key", "secret_key", "sandbox", "is_connected")
+    
     def __init__(self, api_key: str, secret_key: str, sandbox: bool = True):
         self.api_key = api_key
         self.secret_key = secret_key
         self.sandbox = sandbox
         self.is_connected = False
     
+    async def __aenter__(self) -> "BaseBrokerAdapter":
+        """Connect on entering an ``async with`` block."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Disconnect when leaving an ``async with`` block."""
+        await self.disconnect()
+    
     @abstractmethod
     async def connect(self) -> bool:
         """Connect to broker API."""
@@ -1,6 +1,7 @@
 """Production-ready Binance broker adapter using official python-binance library."""
 
 import asyncio
+import aiohttp
 import time
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone, timedelta
@@ -8,8 +9,9 @@ from decimal import Decimal
 import backoff
 from dataclasses import dataclass
 from enum import Enum
+from cachetools import TTLCache
 
-from binance.client import Client
+from binance import AsyncClient
 from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 from binance.enums import *
 
@@ -19,6 +21,12 @@ from trading.logging_utils import TradingLogger
 
 trade_logger = TradingLogger("trading.execution")
 
+# Cache TTLs in seconds, compared against time.monotonic() timestamps
+_ACCOUNT_TTL = 60.0
+_MARKET_TTL = 1.0
+_ORDER_TTL = 30.0
+_SYMBOL_TTL = 3600.0
+
 
 class BinanceOrderStatus(Enum):
     """Binance order status enumeration."""
@@ -47,15 +55,63 @@ class BinanceAccountInfo:
     permissions: List[str]
 
 
+_ORDER_TYPE_MAP = {
+    OrderType.MARKET: ORDER_TYPE_MARKET,
+    OrderType.LIMIT: ORDER_TYPE_LIMIT,
+    OrderType.STOP: ORDER_TYPE_STOP_LOSS_LIMIT,
+    OrderType.STOP_LIMIT: ORDER_TYPE_STOP_LOSS_LIMIT
+}
+_BINANCE_ORDER_TYPE_MAP = {
+    ORDER_TYPE_MARKET: OrderType.MARKET,
+    ORDER_TYPE_LIMIT: OrderType.LIMIT,
+    ORDER_TYPE_STOP_LOSS: OrderType.STOP,
+    ORDER_TYPE_STOP_LOSS_LIMIT: OrderType.STOP_LIMIT
+}
+_SIDE_MAP = {Side.BUY: SIDE_BUY, Side.SELL: SIDE_SELL}
+_STATUS_MAP = {
+    BinanceOrderStatus.NEW.value: ExecutionStatus.PENDING,
+    BinanceOrderStatus.PARTIALLY_FILLED.value: ExecutionStatus.PARTIALLY_FILLED,
+    BinanceOrderStatus.FILLED.value: ExecutionStatus.FILLED,
+    BinanceOrderStatus.CANCELED.value: ExecutionStatus.CANCELLED,
+    BinanceOrderStatus.PENDING_CANCEL.value: ExecutionStatus.PENDING_CANCEL,
+    BinanceOrderStatus.REJECTED.value: ExecutionStatus.REJECTED,
+    BinanceOrderStatus.EXPIRED.value: ExecutionStatus.EXPIRED
+}
+_INTERVAL_MAP = {
+    "1m": KLINE_INTERVAL_1MINUTE,
+    "3m": KLINE_INTERVAL_3MINUTE,
+    "5m": KLINE_INTERVAL_5MINUTE,
+    "15m": KLINE_INTERVAL_15MINUTE,
+    "30m": KLINE_INTERVAL_30MINUTE,
+    "1h": KLINE_INTERVAL_1HOUR,
+    "2h": KLINE_INTERVAL_2HOUR,
+    "4h": KLINE_INTERVAL_4HOUR,
+    "6h": KLINE_INTERVAL_6HOUR,
+    "8h": KLINE_INTERVAL_8HOUR,
+    "12h": KLINE_INTERVAL_12HOUR,
+    "1d": KLINE_INTERVAL_1DAY,
+    "3d": KLINE_INTERVAL_3DAY,
+    "1w": KLINE_INTERVAL_1WEEK,
+    "1M": KLINE_INTERVAL_1MONTH
+}
+# Quote assets checked longest first so e.g. FDUSD wins over a shorter suffix
+_QUOTE_ASSETS = ("FDUSD", "USDT", "USDC", "BUSD", "BNB", "BTC", "ETH")
+
+_ORDER_TYPE_GET = _ORDER_TYPE_MAP.get
+_BINANCE_ORDER_TYPE_GET = _BINANCE_ORDER_TYPE_MAP.get
+_STATUS_GET = _STATUS_MAP.get
+
+
 class BinanceAdapter(BaseBrokerAdapter):
     """Production-ready Binance broker adapter using official python-binance library."""
     
     def __init__(self, api_key: str, secret_key: str, sandbox: bool = True):
         super().__init__(api_key, secret_key, sandbox)
         
-        # Initialize Binance client with error handling
-        self.client = None
-        self._initialize_client(api_key, secret_key, sandbox)
+        # Binance AsyncClient, created lazily on first connect
+        self.client: Optional[AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self._connector: Optional[aiohttp.TCPConnector] = None
         
         # Connection state
         self.is_connected = False
@@ -65,16 +121,15 @@ class BinanceAdapter(BaseBrokerAdapter):
         
         # Account info cache
         self._account_info_cache: Optional[BinanceAccountInfo] = None
-        self._account_info_cache_time: Optional[datetime] = None
-        self._account_info_cache_ttl = timedelta(minutes=1)
+        self._account_info_cache_time: Optional[float] = None
+        self._account_info_cache_ttl = _ACCOUNT_TTL
         
-        # Market data cache
-        self._market_data_cache: Dict[str, Dict[str, Any]] = {}
-        self._market_data_cache_ttl = timedelta(seconds=1)
+        # Market data cache (bounded, entries expire after _MARKET_TTL)
+        self._market_data_cache: TTLCache = TTLCache(maxsize=512, ttl=_MARKET_TTL)
         
         # Order tracking
         self._pending_orders: Dict[str, TradeExecution] = {}
-        self._order_status_cache: Dict[str, Dict[str, Any]] = {}
+        self._order_status_cache: TTLCache = TTLCache(maxsize=2048, ttl=_ORDER_TTL)
         
         # Error tracking
         self._error_count = 0
@@ -82,18 +137,47 @@ class BinanceAdapter(BaseBrokerAdapter):
         
         # API restriction flag
         self._api_restricted = False
+        
+        # Circuit breaker properties
+        self._circuit_breaker_threshold = 10
+        self._circuit_breaker_timeout = timedelta(minutes=5)
+        self._circuit_breaker_active = False
+        
+        # Symbol info cache: one exchange-info snapshot keyed by Binance symbol
+        self._symbol_info_cache: TTLCache = TTLCache(maxsize=1, ttl=_SYMBOL_TTL)
     
-    def _initialize_client(self, api_key: str, secret_key: str, sandbox: bool):
+    async def _ensure_client(self) -> Optional[AsyncClient]:
+        """Create the Binance AsyncClient on first use with error handling."""
+        if self.client is not None:
+            return self.client
+        
+        async with self._client_lock:
+            if self.client is None:
+                await self._initialize_client()
+        return self.client
+    
+    async def _initialize_client(self):
         """Initialize Binance client with error handling."""
         try:
-            self.client = Client(
-                api_key=api_key,
-                api_secret=secret_key,
-                testnet=sandbox
+            # Keep-alive pool sized for the adapter's peak concurrency so bursts
+            # reuse warm TLS connections instead of opening new ones
+            self._connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            timeout = aiohttp.ClientTimeout(total=10, connect=3, sock_read=5)
+            
+            # AsyncClient.create pings the API and syncs the server time offset
+            self.client = await AsyncClient.create(
+                api_key=self.api_key,
+                api_secret=self.secret_key,
+                testnet=self.sandbox,
+                session_params={"connector": self._connector, "timeout": timeout}
             )
-            # Test connection
-            self.client.ping()
-            self.is_connected = True
             self._api_restricted = False
         except BinanceAPIException as e:
             if "restricted location" in str(e).lower():
@@ -105,10 +189,10 @@ class BinanceAdapter(BaseBrokerAdapter):
                 self._api_restricted = True
                 self.is_connected = False
             else:
-                trade_logger.error(f"Binance API error: {e}", extra={"error_code": e.code})
+                trade_logger.logger.error(f"Binance API error: {e}", extra={"error_code": e.code})
                 raise
         except Exception as e:
-            trade_logger.error(f"Failed to initialize Binance client: {e}")
+            trade_logger.logger.error(f"Failed to initialize Binance client: {e}")
             self.is_connected = False
             # Don't raise exception for testing purposes
             if "test" not in str(e).lower():
@@ -134,19 +218,10 @@ class BinanceAdapter(BaseBrokerAdapter):
             status_code=403,
             text="Service unavailable from a restricted location"
         )
-        
-        # Circuit breaker properties
-        self._circuit_breaker_threshold = 10
-        self._circuit_breaker_timeout = timedelta(minutes=5)
-        self._circuit_breaker_active = False
-        
-        # Symbol info cache
-        self._symbol_info_cache: Dict[str, Dict[str, Any]] = {}
-        self._symbol_info_cache_time: Optional[datetime] = None
-        self._symbol_info_cache_ttl = timedelta(hours=1)
     
     async def connect(self) -> bool:
         """Connect to Binance API with comprehensive error handling and retry logic."""
+        await self._ensure_client()
         if not self._check_api_availability():
             self._handle_api_restriction("connect")
         
@@ -170,7 +245,7 @@ class BinanceAdapter(BaseBrokerAdapter):
                     
                     # Cache account info
                     self._account_info_cache = account_info
-                    self._account_info_cache_time = datetime.now(timezone.utc)
+                    self._account_info_cache_time = time.monotonic()
                     
                     trade_logger.logger.info(
                         "Successfully connected to Binance API",
@@ -205,8 +280,12 @@ class BinanceAdapter(BaseBrokerAdapter):
         """Disconnect from Binance API and cleanup resources."""
         try:
             # Close client session
-            if hasattr(self.client, 'session') and self.client.session:
-                await self.client.session.close()
+            if self.client is not None:
+                await self.client.close_connection()
+                self.client = None
+            if self._connector is not None:
+                await self._connector.close()
+                self._connector = None
             
             self.is_connected = False
             
@@ -225,9 +304,8 @@ class BinanceAdapter(BaseBrokerAdapter):
     
     async def _get_account_info_async(self) -> Optional[BinanceAccountInfo]:
         """Get account info asynchronously."""
-        loop = asyncio.get_event_loop()
         try:
-            account_data = await loop.run_in_executor(None, self.client.get_account)
+            account_data = await self.client.get_account()
             return self._parse_account_info(account_data)
         except Exception as e:
             trade_logger.logger.error(f"Failed to get account info: {e}")
@@ -268,43 +346,23 @@ class BinanceAdapter(BaseBrokerAdapter):
     
     def _denormalize_symbol(self, symbol: str) -> str:
         """Convert Binance symbol format back to standard format."""
-        if symbol.endswith("USDT"):
-            return f"{symbol[:-4]}/USDT"
-        elif symbol.endswith("BTC"):
-            return f"{symbol[:-3]}/BTC"
-        elif symbol.endswith("ETH"):
-            return f"{symbol[:-3]}/ETH"
-        elif symbol.endswith("BNB"):
-            return f"{symbol[:-3]}/BNB"
-        else:
-            return symbol
+        if symbol.endswith(_QUOTE_ASSETS):
+            for quote in _QUOTE_ASSETS:
+                if symbol.endswith(quote):
+                    return f"{symbol[:-len(quote)]}/{quote}"
+        return symbol
     
     def _map_order_type(self, order_type: OrderType) -> str:
         """Map order type to Binance format."""
-        mapping = {
-            OrderType.MARKET: ORDER_TYPE_MARKET,
-            OrderType.LIMIT: ORDER_TYPE_LIMIT,
-            OrderType.STOP: ORDER_TYPE_STOP_LOSS_LIMIT,
-            OrderType.STOP_LIMIT: ORDER_TYPE_STOP_LOSS_LIMIT
-        }
-        return mapping.get(order_type, ORDER_TYPE_MARKET)
+        return _ORDER_TYPE_GET(order_type, ORDER_TYPE_MARKET)
     
     def _map_side(self, side: Side) -> str:
         """Map side to Binance format."""
-        return SIDE_BUY if side == Side.BUY else SIDE_SELL
+        return _SIDE_MAP[side]
     
     def _map_execution_status(self, binance_status: str) -> ExecutionStatus:
         """Map Binance order status to ExecutionStatus."""
-        status_mapping = {
-            BinanceOrderStatus.NEW.value: ExecutionStatus.PENDING,
-            BinanceOrderStatus.PARTIALLY_FILLED.value: ExecutionStatus.PARTIALLY_FILLED,
-            BinanceOrderStatus.FILLED.value: ExecutionStatus.FILLED,
-            BinanceOrderStatus.CANCELED.value: ExecutionStatus.CANCELLED,
-            BinanceOrderStatus.PENDING_CANCEL.value: ExecutionStatus.PENDING_CANCEL,
-            BinanceOrderStatus.REJECTED.value: ExecutionStatus.REJECTED,
-            BinanceOrderStatus.EXPIRED.value: ExecutionStatus.EXPIRED
-        }
-        return status_mapping.get(binance_status, ExecutionStatus.UNKNOWN)
+        return _STATUS_GET(binance_status, ExecutionStatus.UNKNOWN)
     
     async def place_order(self, signal: TradeSignal) -> TradeExecution:
         """Place an order with Binance using official python-binance library."""
@@ -360,11 +418,7 @@ class BinanceAdapter(BaseBrokerAdapter):
                     order_params['timeInForce'] = TIME_IN_FORCE_GTC
             
             # Place order using official library
-            loop = asyncio.get_event_loop()
-            order_response = await loop.run_in_executor(
-                None, 
-                lambda: self.client.create_order(**order_params)
-            )
+            order_response = await self.client.create_order(**order_params)
             
             # Create execution object
             execution = self._create_execution_from_response(signal, order_response)
@@ -438,42 +492,36 @@ class BinanceAdapter(BaseBrokerAdapter):
     async def get_current_price(self, symbol: str) -> float:
         """Get current price for symbol with caching."""
         # Check cache first
-        if symbol in self._market_data_cache:
-            cache_time = self._market_data_cache[symbol].get("timestamp")
-            if cache_time and datetime.now(timezone.utc) - cache_time < self._market_data_cache_ttl:
-                return self._market_data_cache[symbol]["last"]
+        cached = self._market_data_cache.get(symbol)
+        if cached is not None:
+            return cached["last"]
         
-        # Fetch from API
+        # Fetch from API (get_market_data refreshes the cache)
         try:
             market_data = await self.get_market_data(symbol)
-            price = market_data["last"]
-            
-            # Update cache
-            self._market_data_cache[symbol] = {
-                "last": price,
-                "timestamp": datetime.now(timezone.utc)
-            }
-            
-            return price
+            return market_data["last"]
             
         except Exception as e:
             trade_logger.logger.error(f"Failed to get current price for {symbol}: {e}")
             raise
     
-    async def update_order(self, order_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-        """Update an existing order (Binance doesn't support direct updates, so we cancel and replace)."""
+    async def update_order(self, order_id: str, updates: Dict[str, Any], symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Update an existing order (Binance doesn't support direct updates, so we cancel and replace).
+        
+        ``symbol`` is needed for orders this process did not place, as in get_order_status.
+        """
         try:
             if not self.is_connected:
                 if not await self.connect():
                     raise Exception("Failed to connect to Binance API")
             
             # Get current order details
-            current_order = await self.get_order_status(order_id)
+            current_order = await self.get_order_status(order_id, symbol)
             if not current_order:
                 raise Exception(f"Order {order_id} not found")
             
             # Cancel existing order
-            await self.cancel_order(order_id)
+            await self.cancel_order(order_id, current_order.get("symbol"))
             
             # Create new order with updated parameters
             new_signal = self._create_updated_signal(current_order, updates)
@@ -537,34 +585,25 @@ class BinanceAdapter(BaseBrokerAdapter):
     
     def _map_binance_order_type_to_enum(self, binance_type: str) -> OrderType:
         """Map Binance order type string to OrderType enum."""
-        mapping = {
-            ORDER_TYPE_MARKET: OrderType.MARKET,
-            ORDER_TYPE_LIMIT: OrderType.LIMIT,
-            ORDER_TYPE_STOP_LOSS: OrderType.STOP,
-            ORDER_TYPE_STOP_LOSS_LIMIT: OrderType.STOP_LIMIT
-        }
-        return mapping.get(binance_type, OrderType.MARKET)
+        return _BINANCE_ORDER_TYPE_GET(binance_type, OrderType.MARKET)
     
-    async def cancel_order(self, order_id: str) -> bool:
-        """Cancel an order using official python-binance library."""
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> bool:
+        """Cancel an order using official python-binance library.
+        
+        Binance cancels orders by symbol and id; when ``symbol`` is omitted it is
+        taken from the order's placement signal or a previous status lookup.
+        """
         try:
             if not self.is_connected:
                 if not await self.connect():
                     raise Exception("Failed to connect to Binance API")
             
-            # Get order details first to get symbol
-            order_status = await self.get_order_status(order_id)
-            symbol = order_status.get("symbol", "")
-            
-            if not symbol:
+            binance_symbol = self._resolve_order_symbol(order_id, symbol)
+            if not binance_symbol:
                 raise Exception(f"Could not determine symbol for order {order_id}")
             
             # Cancel order using official library
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.cancel_order(symbol=symbol, orderId=order_id)
-            )
+            response = await self.client.cancel_order(symbol=binance_symbol, orderId=int(order_id))
             
             if response:
                 # Remove from pending orders
@@ -572,8 +611,7 @@ class BinanceAdapter(BaseBrokerAdapter):
                     del self._pending_orders[order_id]
                 
                 # Remove from status cache
-                if order_id in self._order_status_cache:
-                    del self._order_status_cache[order_id]
+                self._order_status_cache.pop(order_id, None)
                 
                 trade_logger.logger.info(f"Order {order_id} cancelled successfully")
                 return True
@@ -589,33 +627,49 @@ class BinanceAdapter(BaseBrokerAdapter):
             self.handle_broker_error(e)
             return False
     
-    async def get_order_status(self, order_id: str) -> Dict[str, Any]:
-        """Get order status with caching using official python-binance library."""
+    def _resolve_order_symbol(self, order_id: str, symbol: Optional[str] = None) -> Optional[str]:
+        """Resolve the Binance symbol for an order from the caller, pending orders or the status cache."""
+        if symbol:
+            return self._normalize_symbol(symbol)
+        
+        pending = self._pending_orders.get(order_id)
+        if pending is not None:
+            return self._normalize_symbol(pending.signal.symbol)
+        
+        cached = self._order_status_cache.get(order_id)
+        if cached is not None:
+            return cached.get("symbol")
+        
+        return None
+    
+    async def get_order_status(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Get order status with caching using official python-binance library.
+        
+        Binance looks orders up by symbol and id; when ``symbol`` is omitted it
+        is taken from the order's placement signal or a previous status lookup.
+        """
         try:
             # Check cache first
-            if order_id in self._order_status_cache:
-                cache_time = self._order_status_cache[order_id].get("cache_time")
-                if cache_time and datetime.now(timezone.utc) - cache_time < timedelta(seconds=30):
-                    return self._order_status_cache[order_id]["data"]
+            cached = self._order_status_cache.get(order_id)
+            if cached is not None:
+                return cached
             
             if not self.is_connected:
                 if not await self.connect():
                     raise Exception("Failed to connect to Binance API")
             
-            # Get all orders and find the one with matching orderId
-            loop = asyncio.get_event_loop()
-            orders = await loop.run_in_executor(None, self.client.get_all_orders)
+            binance_symbol = self._resolve_order_symbol(order_id, symbol)
+            if not binance_symbol:
+                raise Exception(f"Could not determine symbol for order {order_id}")
             
-            for order in orders:
-                if str(order.get("orderId")) == str(order_id):
-                    # Update cache
-                    self._order_status_cache[order_id] = {
-                        "data": order,
-                        "cache_time": datetime.now(timezone.utc)
-                    }
-                    return order
+            # Single indexed lookup by symbol and orderId
+            order = await self.client.get_order(symbol=binance_symbol, orderId=int(order_id))
+            if not order:
+                raise Exception(f"Order {order_id} not found")
             
-            raise Exception(f"Order {order_id} not found")
+            # Update cache
+            self._order_status_cache[order_id] = order
+            return order
                 
         except BinanceAPIException as e:
             trade_logger.logger.error(f"Binance API error getting order status: {e.message}")
@@ -634,47 +688,50 @@ class BinanceAdapter(BaseBrokerAdapter):
                     raise Exception("Failed to connect to Binance API")
             
             account_info = await self.get_account_info()
-            balances = account_info.balances
             
-            positions = []
-            for balance in balances:
+            # Only include non-zero balances, skipping USDT as it's the quote currency
+            holdings = []
+            for balance in account_info.balances:
                 free = float(balance["free"])
                 locked = float(balance["locked"])
                 total = free + locked
+                if total > 0 and balance["asset"] != "USDT":
+                    holdings.append((balance["asset"], free, locked, total))
+            
+            # Price every held asset from a single all-tickers request
+            price_by_symbol: Dict[str, float] = {}
+            if holdings:
+                wanted = {f"{asset}USDT" for asset, _, _, _ in holdings}
+                try:
+                    tickers = await self.client.get_all_tickers()
+                    price_by_symbol = {
+                        t["symbol"]: float(t["price"]) for t in tickers if t["symbol"] in wanted
+                    }
+                except Exception as e:
+                    trade_logger.logger.warning(f"Failed to get ticker prices for positions: {e}")
+            
+            positions = []
+            for asset, free, locked, total in holdings:
+                symbol = f"{asset}/USDT"
+                current_price = price_by_symbol.get(f"{asset}USDT", 0.0)
+                market_value = total * current_price
                 
-                if total > 0:  # Only include non-zero balances
-                    asset = balance["asset"]
-                    
-                    # Skip USDT as it's the quote currency
-                    if asset == "USDT":
-                        continue
-                    
-                    # Get current price for the asset
-                    try:
-                        symbol = f"{asset}/USDT"
-                        ticker = await self.get_market_data(symbol)
-                        current_price = float(ticker["last"])
-                        market_value = total * current_price
-                    except:
-                        current_price = 0
-                        market_value = 0
-                    
-                    position = Position(
-                        symbol=symbol,
-                        quantity=total,
-                        average_price=current_price,
-                        unrealized_pnl=0,
-                        realized_pnl=0,
-                        market_value=market_value,
-                        timestamp=datetime.now(timezone.utc),
-                        metadata={
-                            "asset": asset,
-                            "free": free,
-                            "locked": locked,
-                            "current_price": current_price
-                        }
-                    )
-                    positions.append(position)
+                position = Position(
+                    symbol=symbol,
+                    quantity=total,
+                    average_price=current_price,
+                    unrealized_pnl=0,
+                    realized_pnl=0,
+                    market_value=market_value,
+                    timestamp=datetime.now(timezone.utc),
+                    metadata={
+                        "asset": asset,
+                        "free": free,
+                        "locked": locked,
+                        "current_price": current_price
+                    }
+                )
+                positions.append(position)
             
             return positions
             
@@ -693,7 +750,7 @@ class BinanceAdapter(BaseBrokerAdapter):
             # Check cache first
             if (self._account_info_cache and 
                 self._account_info_cache_time and 
-                datetime.now(timezone.utc) - self._account_info_cache_time < self._account_info_cache_ttl):
+                time.monotonic() - self._account_info_cache_time < self._account_info_cache_ttl):
                 return self._account_info_cache
             
             if not self.is_connected:
@@ -701,13 +758,12 @@ class BinanceAdapter(BaseBrokerAdapter):
                     raise Exception("Failed to connect to Binance API")
             
             # Fetch from API using official library
-            loop = asyncio.get_event_loop()
-            account_data = await loop.run_in_executor(None, self.client.get_account)
+            account_data = await self.client.get_account()
             
             if account_data:
                 # Parse and cache account info
                 self._account_info_cache = self._parse_account_info(account_data)
-                self._account_info_cache_time = datetime.now(timezone.utc)
+                self._account_info_cache_time = time.monotonic()
                 
                 return self._account_info_cache
             else:
@@ -726,10 +782,9 @@ class BinanceAdapter(BaseBrokerAdapter):
         """Get market data for symbol using official python-binance library."""
         try:
             # Check cache first
-            if symbol in self._market_data_cache:
-                cache_time = self._market_data_cache[symbol].get("timestamp")
-                if cache_time and datetime.now(timezone.utc) - cache_time < self._market_data_cache_ttl:
-                    return self._market_data_cache[symbol]
+            cached = self._market_data_cache.get(symbol)
+            if cached is not None:
+                return cached
             
             if not self.is_connected:
                 if not await self.connect():
@@ -738,22 +793,15 @@ class BinanceAdapter(BaseBrokerAdapter):
             # Convert symbol format
             normalized_symbol = self._normalize_symbol(symbol)
             
-            # Get 24hr ticker price change statistics using official library
-            loop = asyncio.get_event_loop()
-            ticker_data = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_ticker(symbol=normalized_symbol)
+            # Get 24hr ticker statistics and the order book for bid/ask concurrently
+            ticker_data, order_book = await asyncio.gather(
+                self.client.get_ticker(symbol=normalized_symbol),
+                self.client.get_order_book(symbol=normalized_symbol, limit=5)
             )
             
             if not ticker_data:
                 raise Exception(f"No ticker data available for {symbol}")
             
-            # Get order book for bid/ask
-            order_book = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_order_book(symbol=normalized_symbol, limit=5)
-            )
-            
             market_data = {
                 "symbol": symbol,
                 "last": float(ticker_data["lastPrice"]),
@@ -788,28 +836,25 @@ class BinanceAdapter(BaseBrokerAdapter):
         """Get symbol information and trading rules using official python-binance library."""
         try:
             # Check cache first
-            if (self._symbol_info_cache and 
-                self._symbol_info_cache_time and 
-                datetime.now(timezone.utc) - self._symbol_info_cache_time < self._symbol_info_cache_ttl):
-                return self._symbol_info_cache.get(symbol)
+            symbols = self._symbol_info_cache.get("symbols")
+            if symbols is not None:
+                return symbols.get(self._normalize_symbol(symbol))
             
             if not self.is_connected:
                 if not await self.connect():
                     raise Exception("Failed to connect to Binance API")
             
             # Get exchange info using official library
-            loop = asyncio.get_event_loop()
-            exchange_info = await loop.run_in_executor(None, self.client.get_exchange_info)
+            exchange_info = await self.client.get_exchange_info()
             
             if exchange_info and "symbols" in exchange_info:
                 # Update symbol cache
-                self._symbol_info_cache = {}
-                for symbol_info in exchange_info["symbols"]:
-                    self._symbol_info_cache[symbol_info["symbol"]] = symbol_info
-                
-                self._symbol_info_cache_time = datetime.now(timezone.utc)
+                symbols = {
+                    symbol_info["symbol"]: symbol_info for symbol_info in exchange_info["symbols"]
+                }
+                self._symbol_info_cache["symbols"] = symbols
                 
-                return self._symbol_info_cache.get(self._normalize_symbol(symbol))
+                return symbols.get(self._normalize_symbol(symbol))
             
             return None
             
@@ -877,8 +922,7 @@ class BinanceAdapter(BaseBrokerAdapter):
                     raise Exception("Failed to connect to Binance API")
             
             # Get all orders using official library
-            loop = asyncio.get_event_loop()
-            orders_data = await loop.run_in_executor(None, self.client.get_all_orders)
+            orders_data = await self.client.get_all_orders()
             
             if orders_data:
                 return orders_data
@@ -912,36 +956,15 @@ class BinanceAdapter(BaseBrokerAdapter):
             normalized_symbol = self._normalize_symbol(symbol)
             
             # Convert timeframe
-            interval_map = {
-                "1m": KLINE_INTERVAL_1MINUTE,
-                "3m": KLINE_INTERVAL_3MINUTE,
-                "5m": KLINE_INTERVAL_5MINUTE,
-                "15m": KLINE_INTERVAL_15MINUTE,
-                "30m": KLINE_INTERVAL_30MINUTE,
-                "1h": KLINE_INTERVAL_1HOUR,
-                "2h": KLINE_INTERVAL_2HOUR,
-                "4h": KLINE_INTERVAL_4HOUR,
-                "6h": KLINE_INTERVAL_6HOUR,
-                "8h": KLINE_INTERVAL_8HOUR,
-                "12h": KLINE_INTERVAL_12HOUR,
-                "1d": KLINE_INTERVAL_1DAY,
-                "3d": KLINE_INTERVAL_3DAY,
-                "1w": KLINE_INTERVAL_1WEEK,
-                "1M": KLINE_INTERVAL_1MONTH
-            }
-            interval = interval_map.get(timeframe, KLINE_INTERVAL_1DAY)
+            interval = _INTERVAL_MAP.get(timeframe, KLINE_INTERVAL_1DAY)
             
             # Get historical klines using official library
-            loop = asyncio.get_event_loop()
-            klines_data = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_historical_klines(
-                    symbol=normalized_symbol,
-                    interval=interval,
-                    start_str=start_date,
-                    end_str=end_date,
-                    limit=limit
-                )
+            klines_data = await self.client.get_historical_klines(
+                symbol=normalized_symbol,
+                interval=interval,
+                start_str=start_date,
+                end_str=end_date,
+                limit=limit
             )
             
             if klines_data:
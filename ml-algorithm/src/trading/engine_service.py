@@ -19,7 +19,7 @@ from trading.logging_utils import setup_logging, get_logger, trade_logger
 from trading.data.market_data import MarketDataManager
 from trading.policy.ppo import ProductionPPO as PPOPolicy
 from trading.adapters.base import BaseBrokerAdapter
-from trading.adapters.alpaca_adapter import AlpacaAdapter
+from trading.adapters.alpaca_adapter import AlpacaAdapter, close_shared_sessions
 from trading.adapters.binance_adapter import BinanceAdapter
 from trading.adapters.oanda_adapter import OandaAdapter
 
@@ -70,6 +70,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down engine service")
     if inference_client:
         await inference_client.aclose()
+    await close_shared_sessions()
 
 
 app = FastAPI(
@@ -77,6 +77,15 @@ class TradingEnvironment(gym.Env):
         self.available_features = [
             f for f in self.features if f in self.data.columns]
 
+        # Columnar views for per-step access: integer indexing into numpy
+        # arrays instead of building a pandas row on every step. Values that
+        # are missing or not numeric are observed as 0.0.
+        self._close = self.data["close"].to_numpy(dtype=np.float64)
+        market_features = self.data[self.available_features].apply(
+            pd.to_numeric, errors="coerce").to_numpy(dtype=np.float32)
+        self._market_features = np.where(
+            np.isnan(market_features), np.float32(0.0), market_features)
+
         # Action space: [hold, buy, sell] with position sizing
         self.action_space = spaces.Box(
             low=np.array([-1.0, -1.0]),  # [action_type, position_size]
@@ -112,9 +121,9 @@ class TradingEnvironment(gym.Env):
         self.winning_trades = 0
 
         # Price history for lookback
-        self.price_history = deque(maxlen=self.lookback_window)
-        for i in range(self.lookback_window):
-            self.price_history.append(self.data.iloc[i]["close"])
+        self.price_history = deque(
+            self._close[:self.lookback_window].tolist(),
+            maxlen=self.lookback_window)
 
         observation = self._get_observation()
         info = self._get_info()
@@ -133,7 +142,7 @@ class TradingEnvironment(gym.Env):
         position_size = action[1]  # -1 to 1, scaled to max_position_size
 
         # Get current price
-        current_price = self.data.iloc[self.current_step]["close"]
+        current_price = self._close[self.current_step]
 
         # Calculate position change
         if action_type > 0.1:  # Buy
@@ -187,19 +196,6 @@ class TradingEnvironment(gym.Env):
         if self.current_step >= len(self.data):
             return np.zeros(self.observation_space.shape[0], dtype=np.float32)
 
-        # Market features
-        market_features = []
-        for feature in self.available_features:
-            value = self.data.iloc[self.current_step][feature]
-            try:
-                # Try to convert to float and check for NaN
-                float_value = float(value)
-                market_features.append(
-                    float_value if not np.isnan(float_value) else 0.0)
-            except (ValueError, TypeError):
-                # If conversion fails, use 0.0
-                market_features.append(0.0)
-
         # Portfolio state
         portfolio_state = [
             self.balance / self.initial_balance,  # Normalized balance
@@ -208,10 +204,9 @@ class TradingEnvironment(gym.Env):
             self.realized_pnl / self.initial_balance  # Normalized realized PnL
         ]
 
-        observation = np.array(
-            market_features +
-            portfolio_state,
-            dtype=np.float32)
+        observation = np.concatenate((
+            self._market_features[self.current_step],
+            np.asarray(portfolio_state, dtype=np.float32)))
         return observation
 
     def _get_info(self) -> Dict[str, Any]:
@@ -345,8 +345,12 @@ class ProductionLSTM(BasePredictor):
             self.model = self._create_model().to(self.device)
 
             # Setup training
+            # Fused Adam needs the parameters on CUDA
+            fused = (self.config.get('fused_optimizer', False)
+                     and str(self.device).startswith('cuda'))
             optimizer = torch.optim.Adam(
-                self.model.parameters(), lr=self.learning_rate)
+                self.model.parameters(), lr=self.learning_rate,
+                fused=fused)
             criterion = nn.MSELoss()
             scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(
                 optimizer, mode='min', factor=0.5, patience=10
@@ -265,8 +265,12 @@ class TemporalFusionTransformer(BasePredictor):
                 y_val_tensor = torch.FloatTensor(y_val_scaled)
 
             # Training setup
+            # Fused AdamW needs the parameters on CUDA
+            fused = (self.config.get('fused_optimizer', False)
+                     and next(self.model.parameters()).is_cuda)
             optimizer = torch.optim.AdamW(
-                self.model.parameters(), lr=settings.learning_rate)
+                self.model.parameters(), lr=settings.learning_rate,
+                fused=fused)
             scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(
                 optimizer, mode='min', factor=0.5, patience=5
             )
@@ -52,6 +52,8 @@ class CircuitBreakerConfig:
     recovery_timeout: float = 60.0
     success_threshold: int = 3
     timeout: float = 30.0
+    # When set, only failures within this many seconds count toward failure_threshold
+    failure_window: Optional[float] = None
 
 
 @dataclass
@@ -173,9 +175,12 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = None
         self.last_success_time = None
+        # time.monotonic() of the last failure, so wall-clock steps cannot skew recovery
+        self._last_failure_at: Optional[float] = None
         self.total_requests = 0
         self.total_failures = 0
         self.total_successes = 0
+        self._failure_times: deque = deque(maxlen=config.failure_threshold)
         self._lock = threading.Lock()
 
         trade_logger.logger.info(
@@ -205,13 +210,10 @@ class CircuitBreaker:
         if self.state != CircuitState.OPEN:
             return False
 
-        if self.last_failure_time is None:
+        if self._last_failure_at is None:
             return True
 
-        time_since_failure = (
-            datetime.now(
-                timezone.utc) -
-            self.last_failure_time).total_seconds()
+        time_since_failure = time.monotonic() - self._last_failure_at
         return time_since_failure >= self.config.recovery_timeout
 
     def _record_success(self) -> None:
@@ -227,54 +229,82 @@ class CircuitBreaker:
                     self.state = CircuitState.CLOSED
                     self.failure_count = 0
                     self.success_count = 0
+                    self._failure_times.clear()
 
                     trade_logger.logger.info(
-                        f"Circuit breaker {
-                            self.name} closed after successful operations")
+                        f"Circuit breaker {self.name} closed after successful operations")
             else:
                 self.failure_count = 0
+                self._failure_times.clear()
 
-    def _record_failure(self) -> None:
-        """Record failed operation."""
+    def _record_failure(self) -> bool:
+        """Record failed operation; return True if it opened the circuit."""
         with self._lock:
             self.total_requests += 1
             self.total_failures += 1
             self.last_failure_time = datetime.now(timezone.utc)
+            now = time.monotonic()
+            self._last_failure_at = now
 
             if self.state == CircuitState.HALF_OPEN:
                 self.state = CircuitState.OPEN
                 self.success_count = 0
 
                 trade_logger.logger.warning(
-                    f"Circuit breaker {
-                        self.name} opened due to failure in half-open state")
-            else:
-                self.failure_count += 1
-                if self.failure_count >= self.config.failure_threshold:
+                    f"Circuit breaker {self.name} opened due to failure in half-open state")
+                return True
+            elif self.state == CircuitState.CLOSED:
+                if self.config.failure_window is None:
+                    self.failure_count += 1
+                    tripped = self.failure_count >= self.config.failure_threshold
+                else:
+                    # Error-rate trip: threshold failures within failure_window seconds
+                    times = self._failure_times
+                    times.append(now)
+                    self.failure_count = len(times)
+                    tripped = (len(times) == times.maxlen and
+                               now - times[0] < self.config.failure_window)
+                if tripped:
                     self.state = CircuitState.OPEN
 
                     trade_logger.logger.warning(
-                        f"Circuit breaker {
-                            self.name} opened due to failure threshold",
+                        f"Circuit breaker {self.name} opened due to failure threshold",
                         extra={
                             "failure_count": self.failure_count,
                             "failure_threshold": self.config.failure_threshold})
+                    return True
+            return False
+
+    def allow_request(self) -> bool:
+        """Check whether a call may proceed, half-opening after the recovery timeout."""
+        if self.state != CircuitState.OPEN:
+            return True
+
+        if not self._should_attempt_reset():
+            return False
+
+        # Attempt reset
+        self.state = CircuitState.HALF_OPEN
+        self.success_count = 0
+
+        trade_logger.logger.info(
+            f"Circuit breaker {self.name} attempting reset")
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call made outside call()."""
+        self._record_success()
+
+    def record_failure(self) -> bool:
+        """Record a failed call made outside call(); return True if it opened the circuit."""
+        return self._record_failure()
 
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """Call function through circuit breaker."""
         # Check if circuit is open
-        if self.state == CircuitState.OPEN:
-            if not self._should_attempt_reset():
-                raise CircuitBreakerOpenException(
-                    f"Circuit breaker {self.name} is open")
-
-            # Attempt reset
-            self.state = CircuitState.HALF_OPEN
-            self.success_count = 0
-
-            trade_logger.logger.info(
-                f"Circuit breaker {
-                    self.name} attempting reset")
+        if not self.allow_request():
+            raise CircuitBreakerOpenException(
+                f"Circuit breaker {self.name} is open")
 
         # Execute function
         try:
@@ -296,9 +326,7 @@ class CircuitBreaker:
         except Exception as e:
             self._record_failure()
             raise CircuitBreakerException(
-                f"Circuit breaker {
-                    self.name} failure: {
-                    str(e)}")
+                f"Circuit breaker {self.name} failure: {str(e)}")
 
 
 class CircuitBreakerException(Exception):
@@ -434,8 +462,7 @@ class TimeoutManager:
                 extra={"function": func.__name__, "timeout": timeout}
             )
             raise TimeoutException(
-                f"Function {
-                    func.__name__} timed out after {timeout} seconds")
+                f"Function {func.__name__} timed out after {timeout} seconds")
 
 
 class TimeoutException(Exception):
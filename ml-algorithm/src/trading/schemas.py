@@ -41,6 +41,13 @@ class ExecutionStatus(str, Enum):
     CANCELLED = "CANCELLED"
     REJECTED = "REJECTED"
     FAILED = "FAILED"
+    ACCEPTED = "ACCEPTED"
+    PENDING_CANCEL = "PENDING_CANCEL"
+    PENDING_REPLACE = "PENDING_REPLACE"
+    EXPIRED = "EXPIRED"
+    STOPPED = "STOPPED"
+    SUSPENDED = "SUSPENDED"
+    UNKNOWN = "UNKNOWN"
 
 
 class MarketData(BaseModel):
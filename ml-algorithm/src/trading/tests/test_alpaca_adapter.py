@@ -0,0 +1,293 @@
+"""Alpaca adapter tests against a local fake of the trading API."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from trading.adapters import alpaca_adapter
+from trading.adapters.alpaca_adapter import AlpacaAdapter, close_shared_sessions
+from trading.resilience import CircuitBreaker, CircuitBreakerConfig, CircuitState
+
+ACCOUNT = {
+    "id": "acct-1",
+    "account_number": "PA0001",
+    "status": "ACTIVE",
+    "currency": "USD",
+    "buying_power": "200000",
+    "regt_buying_power": "200000",
+    "daytrading_buying_power": "0",
+    "cash": "100000",
+    "portfolio_value": "100000",
+    "pattern_day_trader": False,
+    "trading_blocked": False,
+    "transfers_blocked": False,
+    "account_blocked": False,
+    "created_at": "2024-01-02T15:04:05Z",
+    "trade_suspended_by_user": False,
+    "multiplier": "2",
+    "shorting_enabled": True,
+    "equity": "100000",
+    "last_equity": "100000",
+    "long_market_value": "0",
+    "short_market_value": "0",
+    "initial_margin": "0",
+    "maintenance_margin": "0",
+    "last_maintenance_margin": "0",
+    "sma": "0",
+    "daytrade_count": 0,
+}
+
+
+class FakeAlpaca:
+    """Serves /v2/account and /v2/positions; positions fail while ``healthy`` is False."""
+
+    def __init__(self):
+        self.healthy = True
+        self.account_delay = 0.0
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def account(self, request: web.Request) -> web.Response:
+        self._count("account")
+        await asyncio.sleep(self.account_delay)
+        return web.json_response(ACCOUNT)
+
+    async def positions(self, request: web.Request) -> web.Response:
+        self._count("positions")
+        if not self.healthy:
+            return web.json_response({"message": "unavailable"}, status=503)
+        return web.json_response([])
+
+    async def cancel(self, request: web.Request) -> web.Response:
+        self._count("cancel")
+        return web.Response(status=204)
+
+    async def stream(self, request: web.Request) -> web.Response:
+        # No trade_updates stream; the adapter keeps retrying in the background
+        return web.Response(status=404)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/v2/account", self.account)
+        app.router.add_get("/v2/positions", self.positions)
+        app.router.add_delete("/v2/orders/{order_id}", self.cancel)
+        app.router.add_get("/stream", self.stream)
+        return app
+
+
+@asynccontextmanager
+async def fake_adapter(fake: FakeAlpaca, **breaker_config: Any):
+    """Yield an adapter pointed at ``fake``, optionally with a tighter circuit breaker."""
+    server = TestServer(fake.app())
+    await server.start_server()
+    adapter = AlpacaAdapter("key", "secret", sandbox=True)
+    adapter.base_url = str(server.make_url("")).rstrip("/")
+    adapter.trade_stream_url = str(server.make_url("/stream"))
+    if breaker_config:
+        adapter._breaker = CircuitBreaker("alpaca", CircuitBreakerConfig(**breaker_config))
+    try:
+        yield adapter
+    finally:
+        await adapter.disconnect()
+        await close_shared_sessions()
+        await server.close()
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry 5xx responses immediately."""
+    monkeypatch.setattr(alpaca_adapter, "_backoff_wait", lambda retry_state: 0)
+
+
+class TestAlpacaCircuitBreaker:
+    """The breaker opens on API failures and closes again on API successes."""
+
+    @pytest.mark.asyncio
+    async def test_trip_recover_close(self):
+        """A recovered adapter closes the breaker on its first successful call."""
+        fake = FakeAlpaca()
+        async with fake_adapter(
+            fake,
+            failure_threshold=2,
+            recovery_timeout=0.2,
+            success_threshold=1,
+            failure_window=60.0
+        ) as adapter:
+            assert await adapter.connect()
+            assert await adapter.get_positions() == []
+
+            fake.healthy = False
+            for _ in range(2):
+                with pytest.raises(Exception):
+                    await adapter.get_positions()
+            assert adapter._breaker.state is CircuitState.OPEN
+
+            fake.healthy = True
+            await asyncio.sleep(0.25)
+            assert await adapter.get_positions() == []
+            assert adapter._breaker.state is CircuitState.CLOSED
+
+            # A single failure after recovery does not reopen the breaker
+            fake.healthy = False
+            with pytest.raises(Exception):
+                await adapter.get_positions()
+            assert adapter._breaker.state is CircuitState.CLOSED
+
+
+class TestAlpacaOrderPaths:
+    """Order management keeps its own connect handling instead of _require_connected."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_bypasses_open_breaker(self):
+        """Cancels still go out while the breaker blocks read-only calls."""
+        fake = FakeAlpaca()
+        async with fake_adapter(fake, failure_threshold=1, recovery_timeout=300.0) as adapter:
+            assert await adapter.connect()
+            adapter._breaker.record_failure()
+            assert adapter._breaker.state is CircuitState.OPEN
+
+            with pytest.raises(Exception, match="Circuit breaker active"):
+                await adapter.get_positions()
+            assert await adapter.cancel_order("order-1") is True
+            assert fake.calls["cancel"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_returns_false_when_connect_fails(self):
+        """A failed connect is reported through the bool result, not raised."""
+        adapter = AlpacaAdapter("key", "secret", sandbox=True)
+        # An open breaker refuses the reconnect
+        adapter._breaker = CircuitBreaker("alpaca", CircuitBreakerConfig(failure_threshold=1))
+        adapter._breaker.record_failure()
+
+        assert await adapter.cancel_order("order-1") is False
+
+    @pytest.mark.asyncio
+    async def test_cached_order_status_needs_no_connection(self):
+        """A cached order status is returned without connecting first."""
+        adapter = AlpacaAdapter("key", "secret", sandbox=True)
+        adapter._order_status_cache["order-1"] = {"id": "order-1", "status": "filled"}
+
+        assert await adapter.get_order_status("order-1") == {"id": "order-1", "status": "filled"}
+        assert adapter.session is None
+
+
+class TestAlpacaBrokerErrors:
+    """Which errors count toward the circuit breaker."""
+
+    def test_client_errors_do_not_trip(self):
+        """Invalid signals and 4xx rejections leave the breaker closed."""
+        adapter = AlpacaAdapter("key", "secret", sandbox=True)
+
+        for _ in range(20):
+            adapter.handle_broker_error(ValueError("Invalid trading signal"))
+            adapter.handle_broker_error(Exception("Client error 422: insufficient buying power"))
+
+        assert adapter._breaker.state is CircuitState.CLOSED
+        assert adapter._breaker.failure_count == 0
+
+    def test_server_and_transport_errors_trip(self):
+        """5xx, 429, transport errors and timeouts open the breaker."""
+        adapter = AlpacaAdapter("key", "secret", sandbox=True)
+        errors = [
+            alpaca_adapter.RetryableStatus(503),
+            alpaca_adapter.RetryableStatus(429, 1.0),
+            alpaca_adapter.NetworkError("Network error: connection reset"),
+            asyncio.TimeoutError()
+        ]
+
+        for i in range(10):
+            adapter.handle_broker_error(errors[i % len(errors)])
+
+        assert adapter._breaker.state is CircuitState.OPEN
+
+
+class TestAlpacaSharedSession:
+    """Adapters for one account share a session and its concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_host_semaphore_is_shared_per_account(self):
+        """The in-flight cap is per shared connector, not per adapter."""
+        fake = FakeAlpaca()
+        async with fake_adapter(fake) as first, fake_adapter(fake) as second:
+            assert await first.connect()
+            assert await second.connect()
+
+            assert first.session is second.session
+            assert first._host_sem is second._host_sem
+
+            other = AlpacaAdapter("other-key", "secret", sandbox=True)
+            other.base_url = first.base_url
+            other.trade_stream_url = first.trade_stream_url
+            assert await other.connect()
+            try:
+                assert other._host_sem is not first._host_sem
+            finally:
+                await other.disconnect()
+
+
+class TestAlpacaConnect:
+    """Concurrent callers share a single connect handshake."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_handshake(self):
+        """A burst of calls on a disconnected adapter performs one handshake."""
+        fake = FakeAlpaca()
+        fake.account_delay = 0.1
+        async with fake_adapter(fake) as adapter:
+            results = await asyncio.gather(*(adapter.get_positions() for _ in range(20)))
+
+            assert results == [[]] * 20
+            assert fake.calls["account"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_order_calls_share_one_handshake(self):
+        """Order methods connecting through _ensure_connected on a cold start do one handshake."""
+        fake = FakeAlpaca()
+        fake.account_delay = 0.1
+        async with fake_adapter(fake) as adapter:
+            results = await asyncio.gather(*(adapter.cancel_order(f"order-{i}") for i in range(10)))
+
+            assert results == [True] * 10
+            assert fake.calls == {"account": 1, "cancel": 10}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connect_calls_share_one_handshake(self):
+        """Direct connect() calls wait for the handshake in progress."""
+        fake = FakeAlpaca()
+        fake.account_delay = 0.1
+        async with fake_adapter(fake) as adapter:
+            assert await asyncio.gather(*(adapter.connect() for _ in range(5))) == [True] * 5
+            assert fake.calls["account"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_handshake(self):
+        """Cancelling one waiting caller leaves the handshake running for the rest."""
+        fake = FakeAlpaca()
+        fake.account_delay = 0.1
+        async with fake_adapter(fake) as adapter:
+            first = asyncio.create_task(adapter.get_positions())
+            second = asyncio.create_task(adapter.get_positions())
+            await asyncio.sleep(0.02)
+            first.cancel()
+
+            assert await second == []
+            assert first.cancelled()
+            assert fake.calls["account"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_disconnect(self):
+        """A disconnect leaves nothing behind that short-circuits the next connect."""
+        fake = FakeAlpaca()
+        async with fake_adapter(fake) as adapter:
+            assert await adapter.get_positions() == []
+            await adapter.disconnect()
+
+            assert await adapter.get_positions() == []
+            assert adapter.is_connected
+            assert fake.calls["account"] == 2
@@ -0,0 +1,159 @@
+"""Binance adapter tests with a stand-in for python-binance's AsyncClient."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from trading.adapters.binance_adapter import BinanceAdapter
+from trading.schemas import ExecutionStatus, Side, OrderType, TradeExecution, TradeSignal
+
+
+class FakeClient:
+    """Records get_order/cancel_order calls and answers from a table of known orders."""
+
+    def __init__(self, orders: Dict[int, Dict[str, Any]]):
+        self.orders = orders
+        self.calls: List[tuple] = []
+
+    async def get_order(self, symbol: str, orderId: int) -> Dict[str, Any]:
+        self.calls.append(("get_order", symbol, orderId))
+        order = self.orders[orderId]
+        assert order["symbol"] == symbol
+        return order
+
+    async def cancel_order(self, symbol: str, orderId: int) -> Dict[str, Any]:
+        self.calls.append(("cancel_order", symbol, orderId))
+        order = self.orders[orderId]
+        assert order["symbol"] == symbol
+        return {**order, "status": "CANCELED"}
+
+
+def make_adapter(orders: Dict[int, Dict[str, Any]]) -> BinanceAdapter:
+    """Build a connected adapter backed by FakeClient."""
+    adapter = BinanceAdapter("key", "secret", sandbox=True)
+    adapter.client = FakeClient(orders)
+    adapter.is_connected = True
+    return adapter
+
+
+def make_pending(order_id: str, symbol: str) -> TradeExecution:
+    """A pending execution as place_order records it."""
+    signal = TradeSignal(
+        symbol=symbol,
+        side=Side.BUY,
+        quantity=0.01,
+        order_type=OrderType.LIMIT,
+        price=50000.0
+    )
+    return TradeExecution(
+        signal=signal,
+        execution_id=order_id,
+        executed_price=0.0,
+        executed_quantity=0.0,
+        execution_time=datetime.now(timezone.utc),
+        fees=0.0,
+        status=ExecutionStatus.PENDING,
+        broker_order_id=order_id
+    )
+
+
+ORDERS = {
+    101: {"orderId": 101, "symbol": "BTCUSDT", "status": "NEW"},
+    202: {"orderId": 202, "symbol": "ETHFDUSD", "status": "NEW"},
+}
+
+
+class TestOrderSymbolResolution:
+    """Orders are looked up and cancelled by (symbol, orderId)."""
+
+    def test_resolve_prefers_caller_symbol(self):
+        """An explicit symbol wins and is normalized."""
+        adapter = make_adapter(ORDERS)
+        adapter._pending_orders["101"] = make_pending("101", "BTC/USDT")
+
+        assert adapter._resolve_order_symbol("101", "eth/fdusd") == "ETHFDUSD"
+
+    def test_resolve_from_pending_then_cache(self):
+        """Without a symbol, placement signals come first, then cached statuses."""
+        adapter = make_adapter(ORDERS)
+        adapter._pending_orders["101"] = make_pending("101", "BTC/USDT")
+        adapter._order_status_cache["202"] = ORDERS[202]
+
+        assert adapter._resolve_order_symbol("101") == "BTCUSDT"
+        assert adapter._resolve_order_symbol("202") == "ETHFDUSD"
+        assert adapter._resolve_order_symbol("303") is None
+
+    @pytest.mark.asyncio
+    async def test_get_order_status_with_symbol(self):
+        """A foreign order is fetched with one get_order call and then cached."""
+        adapter = make_adapter(ORDERS)
+
+        order = await adapter.get_order_status("202", symbol="ETH/FDUSD")
+
+        assert order is ORDERS[202]
+        assert adapter.client.calls == [("get_order", "ETHFDUSD", 202)]
+
+        assert await adapter.get_order_status("202") is ORDERS[202]
+        assert len(adapter.client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_order_status_unknown_symbol_raises(self):
+        """Without any way to find the symbol, no request is made."""
+        adapter = make_adapter(ORDERS)
+
+        with pytest.raises(Exception, match="Could not determine symbol"):
+            await adapter.get_order_status("202")
+        assert adapter.client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_foreign_order_with_symbol(self):
+        """cancel_order takes the same optional symbol and sends an integer orderId."""
+        adapter = make_adapter(ORDERS)
+
+        assert await adapter.cancel_order("202", symbol="ETH/FDUSD") is True
+        assert adapter.client.calls == [("cancel_order", "ETHFDUSD", 202)]
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_order_without_symbol(self):
+        """Orders placed by this process resolve their symbol locally."""
+        adapter = make_adapter(ORDERS)
+        adapter._pending_orders["101"] = make_pending("101", "BTC/USDT")
+
+        assert await adapter.cancel_order("101") is True
+        assert adapter.client.calls == [("cancel_order", "BTCUSDT", 101)]
+        assert "101" not in adapter._pending_orders
+
+    @pytest.mark.asyncio
+    async def test_cancel_unknown_symbol_returns_false(self):
+        """An unresolvable symbol fails the cancel without a request."""
+        adapter = make_adapter(ORDERS)
+
+        assert await adapter.cancel_order("202") is False
+        assert adapter.client.calls == []
+
+
+class TestSymbolFormat:
+    """Binance symbols round-trip through the BASE/QUOTE format."""
+
+    @pytest.mark.parametrize("binance_symbol, symbol", [
+        ("BTCFDUSD", "BTC/FDUSD"),
+        ("ETHUSDC", "ETH/USDC"),
+        ("SOLUSDT", "SOL/USDT"),
+        ("BNBBUSD", "BNB/BUSD"),
+        ("ETHBTC", "ETH/BTC"),
+        ("ADABNB", "ADA/BNB"),
+        ("LINKETH", "LINK/ETH"),
+    ])
+    def test_denormalize_quote_assets(self, binance_symbol, symbol):
+        """The longest matching quote asset is split off."""
+        adapter = BinanceAdapter("key", "secret", sandbox=True)
+
+        assert adapter._denormalize_symbol(binance_symbol) == symbol
+        assert adapter._normalize_symbol(symbol) == binance_symbol
+
+    def test_unknown_quote_is_unchanged(self):
+        """Symbols without a known quote asset are returned as-is."""
+        adapter = BinanceAdapter("key", "secret", sandbox=True)
+
+        assert adapter._denormalize_symbol("EURGBP") == "EURGBP"
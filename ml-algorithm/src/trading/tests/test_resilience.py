@@ -0,0 +1,151 @@
+"""Unit tests for the circuit breaker state machine."""
+
+import pytest
+
+from trading import resilience
+from trading.resilience import CircuitBreaker, CircuitBreakerConfig, CircuitState
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the breaker's monotonic timestamps by hand."""
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    """Build a breaker that opens after 3 failures within 60 seconds."""
+    config = dict(
+        failure_threshold=3,
+        recovery_timeout=300.0,
+        success_threshold=1,
+        failure_window=60.0
+    )
+    config.update(overrides)
+    return CircuitBreaker("test", CircuitBreakerConfig(**config))
+
+
+class TestCircuitBreaker:
+    """Tests for allow_request/record_success/record_failure and failure_window."""
+
+    def test_opens_on_failures_within_window(self, clock):
+        """Threshold failures inside the window open the circuit."""
+        breaker = make_breaker()
+
+        assert breaker.record_failure() is False
+        clock.now += 10
+        assert breaker.record_failure() is False
+        clock.now += 10
+        assert breaker.record_failure() is True
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_spread_out_failures_stay_closed(self, clock):
+        """Failures further apart than the window never open the circuit."""
+        breaker = make_breaker()
+
+        for _ in range(10):
+            assert breaker.record_failure() is False
+            clock.now += 31
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_success_clears_failure_window(self, clock):
+        """A success in between resets the count of recent failures."""
+        breaker = make_breaker()
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.record_failure() is False
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_count == 1
+
+    def test_failures_while_open_do_not_reopen(self, clock):
+        """record_failure only reports True for the failure that opened the circuit."""
+        breaker = make_breaker()
+
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.record_failure() is False
+
+    def test_half_open_after_recovery_then_close(self, clock):
+        """After recovery_timeout one request is let through and a success closes the circuit."""
+        breaker = make_breaker()
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 299
+        assert breaker.allow_request() is False
+
+        clock.now += 1
+        assert breaker.allow_request() is True
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_count == 0
+
+        # A single failure after closing does not reopen it
+        assert breaker.record_failure() is False
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failure_while_half_open_reopens(self, clock):
+        """A failure during the trial request reopens the circuit for another recovery_timeout."""
+        breaker = make_breaker()
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 300
+        assert breaker.allow_request() is True
+        assert breaker.record_failure() is True
+        assert breaker.state is CircuitState.OPEN
+
+        clock.now += 299
+        assert breaker.allow_request() is False
+        clock.now += 1
+        assert breaker.allow_request() is True
+
+    def test_recovery_ignores_wall_clock(self, clock, monkeypatch):
+        """A wall-clock step does not change when the circuit half-opens."""
+        breaker = make_breaker()
+        for _ in range(3):
+            breaker.record_failure()
+
+        class SteppedDatetime(resilience.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return super().now(tz) + resilience.timedelta(days=1)
+
+        monkeypatch.setattr(resilience, "datetime", SteppedDatetime)
+        assert breaker.allow_request() is False
+
+        clock.now += 300
+        assert breaker.allow_request() is True
+
+    def test_count_based_without_window(self, clock):
+        """Without failure_window the breaker counts consecutive failures."""
+        breaker = make_breaker(failure_window=None)
+
+        breaker.record_failure()
+        clock.now += 3600
+        breaker.record_failure()
+        clock.now += 3600
+        assert breaker.record_failure() is True
+        assert breaker.state is CircuitState.OPEN
@@ -0,0 +1,230 @@
+"""Tests for the data preparation helpers in scripts/train_models.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("numba")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+import train_models  # noqa: E402
+from train_models import EnhancedModelTrainer  # noqa: E402
+
+
+def write_training_csv(path: Path, rows: int = 120) -> Path:
+    """Write a small OHLCV CSV with regime labels, shaped like collect_training_data.py output."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    frame = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=rows, freq="h", tz="UTC"),
+        "symbol": "AAPL",
+        "Open": close + rng.normal(0, 0.1, rows),
+        "High": close + 1.0,
+        "Low": close - 1.0,
+        "Close": close,
+        "Volume": rng.integers(1_000, 10_000, rows).astype(float),
+        "trend_regime": rng.choice(train_models.TREND_REGIMES, rows),
+        "vol_regime": rng.choice(train_models.VOL_REGIMES, rows),
+    })
+    frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def trainer_factory(tmp_path):
+    """Build trainers over one CSV that share a window cache directory."""
+    data_path = write_training_csv(tmp_path / "training.csv")
+
+    def make() -> EnhancedModelTrainer:
+        trainer = EnhancedModelTrainer(
+            str(data_path),
+            output_dir=str(tmp_path / "models"),
+            cache_dir=str(tmp_path / "cache")
+        )
+        trainer.load_and_prepare_data(summary=False)
+        return trainer
+
+    return make
+
+
+class TestWindowCache:
+    """Persisted windows are keyed on everything that shapes their contents."""
+
+    def test_windows_round_trip_through_disk(self, trainer_factory):
+        """A second trainer loads the first one's windows memory-mapped."""
+        first = trainer_factory()
+        X, y = first._prepare_naive_features(first.training_data)
+        second = trainer_factory()
+        X_cached, y_cached = second._prepare_naive_features(second.training_data)
+
+        assert isinstance(X_cached, np.memmap)
+        np.testing.assert_array_equal(X_cached, X)
+        np.testing.assert_array_equal(y_cached, y)
+
+    def test_version_bump_invalidates_and_prunes(self, trainer_factory, monkeypatch):
+        """Windows from an older WINDOW_CACHE_VERSION are rebuilt and deleted."""
+        trainer = trainer_factory()
+        trainer._prepare_naive_features(trainer.training_data)
+        old_files = sorted(trainer.cache_dir.glob("*.npy"))
+        assert len(old_files) == 2
+
+        monkeypatch.setattr(train_models, "WINDOW_CACHE_VERSION", train_models.WINDOW_CACHE_VERSION + 1)
+        trainer = trainer_factory()
+        X, _ = trainer._prepare_naive_features(trainer.training_data)
+
+        assert not isinstance(X, np.memmap)
+        new_files = sorted(trainer.cache_dir.glob("*.npy"))
+        assert len(new_files) == 2
+        assert not set(old_files) & set(new_files)
+
+    def test_key_covers_feature_dtypes(self, trainer_factory):
+        """The same columns with different dtypes get a different key."""
+        trainer = trainer_factory()
+        data = trainer.training_data
+        features = ("Close", "Volume")
+        key = trainer._window_cache_key(data, 20, features)
+
+        data["Volume"] = data["Volume"].astype(np.float32)
+        assert trainer._window_cache_key(data, 20, features) != key
+
+    def test_legacy_files_are_pruned(self, trainer_factory):
+        """Files named by the unversioned scheme are removed on the next write."""
+        trainer = trainer_factory()
+        trainer.cache_dir.mkdir(parents=True)
+        legacy = trainer.cache_dir / f"{'ab' * 20}_X.npy"
+        np.save(legacy, np.zeros(3))
+
+        trainer._prepare_naive_features(trainer.training_data)
+
+        assert not legacy.exists()
+
+
+class TestPreparedData:
+    """train_all_models hands its prepared frames to the workers as Arrow files."""
+
+    def test_prepared_frames_round_trip(self, trainer_factory, tmp_path):
+        """A worker-side trainer sees the same frames and feature columns as the parent."""
+        parent = trainer_factory()
+        parent.save_prepared_data(str(tmp_path))
+
+        worker = EnhancedModelTrainer(
+            parent.data_path,
+            output_dir=str(tmp_path / "models"),
+            cache_dir=str(parent.cache_dir)
+        )
+        worker.load_prepared_data(str(tmp_path))
+
+        pd.testing.assert_frame_equal(worker.training_data, parent.training_data)
+        pd.testing.assert_frame_equal(worker.validation_data, parent.validation_data)
+        assert worker._get_feature_columns() == parent._get_feature_columns()
+
+
+def loop_windows(features: np.ndarray, lookback_window: int) -> tuple:
+    """The original per-row window loop that _sliding_windows replaced."""
+    X, y = [], []
+    for i in range(lookback_window, len(features)):
+        X.append(features[i - lookback_window:i])
+        y.append(features[i, 0])
+    return np.array(X), np.array(y)
+
+
+class TestSlidingWindows:
+    """_sliding_windows matches the loop it replaced, as a view and as a copy."""
+
+    @pytest.mark.parametrize("rows, lookback", [(100, 20), (61, 60), (250, 60), (5, 1)])
+    @pytest.mark.parametrize("contiguous", [False, True])
+    def test_matches_loop(self, rows, lookback, contiguous):
+        """X[i] = features[i:i + lookback] and y[i] = features[i + lookback, 0]."""
+        features = np.random.default_rng(rows).normal(size=(rows, 7)).astype(np.float32)
+
+        X, y = train_models._sliding_windows(features, lookback, contiguous=contiguous)
+        X_loop, y_loop = loop_windows(features, lookback)
+
+        assert X.shape == X_loop.shape == (rows - lookback, lookback, 7)
+        np.testing.assert_array_equal(X, X_loop)
+        np.testing.assert_array_equal(y, y_loop)
+        assert X.dtype == y.dtype == np.float32
+
+    def test_contiguous_windows_own_their_memory(self):
+        """The numba kernel writes a C-contiguous copy; the default is a view."""
+        features = np.arange(60, dtype=np.float32).reshape(20, 3)
+
+        view, _ = train_models._sliding_windows(features, 5)
+        copy, _ = train_models._sliding_windows(features, 5, contiguous=True)
+
+        assert np.shares_memory(view, features)
+        assert copy.flags.c_contiguous and not np.shares_memory(copy, features)
+
+    @pytest.mark.parametrize("rows", [0, 3, 5])
+    def test_too_short_gives_empty(self, rows):
+        """No windows when there are not more rows than the lookback."""
+        X, y = train_models._sliding_windows(np.ones((rows, 2), dtype=np.float32), 5)
+
+        assert len(X) == 0 and len(y) == 0
+
+
+class TestRegimeEncoding:
+    """Regime labels are coded against fixed vocabularies, independent of the input."""
+
+    def test_codes_follow_fixed_vocabulary(self):
+        """A subset of labels, in any order, gets the vocabulary's codes."""
+        data = pd.DataFrame({
+            "trend_regime": ["sideways", "uptrend", "sideways"],
+            "vol_regime": ["high", "high", "low"],
+            "market_regime": ["sideways_high", "uptrend_low", "downtrend_normal"],
+        })
+
+        EnhancedModelTrainer._encode_regime_labels(data)
+
+        assert data["trend_regime"].tolist() == [2, 0, 2]
+        assert data["vol_regime"].tolist() == [2, 2, 0]
+        assert data["market_regime"].tolist() == [
+            train_models.MARKET_REGIMES.index(label)
+            for label in ["sideways_high", "uptrend_low", "downtrend_normal"]
+        ]
+        assert (data.dtypes == np.int8).all()
+
+    def test_categorical_order_does_not_matter(self):
+        """Categoricals with their own category order encode like plain strings."""
+        labels = ["downtrend", "uptrend", "sideways"]
+        as_strings = pd.DataFrame({"trend_regime": labels})
+        as_category = pd.DataFrame({
+            "trend_regime": pd.Categorical(labels, categories=["downtrend", "sideways", "uptrend"])
+        })
+
+        EnhancedModelTrainer._encode_regime_labels(as_strings)
+        EnhancedModelTrainer._encode_regime_labels(as_category)
+
+        pd.testing.assert_series_equal(as_strings["trend_regime"], as_category["trend_regime"])
+
+    def test_unknown_and_missing_labels_are_minus_one(self):
+        """Labels outside the vocabulary and missing values become -1."""
+        data = pd.DataFrame({"vol_regime": ["normal", "extreme", None]})
+
+        EnhancedModelTrainer._encode_regime_labels(data)
+
+        assert data["vol_regime"].tolist() == [1, -1, -1]
+
+    def test_integer_codes_pass_through(self):
+        """Already-coded columns are only narrowed to int8."""
+        data = pd.DataFrame({"trend_regime": np.array([0, 2, 1], dtype=np.int64)})
+
+        EnhancedModelTrainer._encode_regime_labels(data)
+
+        assert data["trend_regime"].dtype == np.int8
+        assert data["trend_regime"].tolist() == [0, 2, 1]
+
+    def test_column_without_vocabulary_is_left_alone(self, caplog):
+        """A text regime column with no fixed vocabulary stays uncoded and is reported."""
+        data = pd.DataFrame({"liquidity_regime": ["thin", "deep"]})
+
+        with caplog.at_level("WARNING", logger=train_models.logger.name):
+            EnhancedModelTrainer._encode_regime_labels(data)
+
+        assert data["liquidity_regime"].tolist() == ["thin", "deep"]
+        assert "liquidity_regime" in caplog.text